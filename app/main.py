@@ -6,36 +6,100 @@ Usage:
     streamlit run app/main.py
 """
 
+import functools
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import json
+import logging
 import os
 import re
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
+
+RUN_STARTED = time.perf_counter()
 
-import anthropic
 import streamlit as st
-import yaml
-from dotenv import load_dotenv
 try:
-    from openai import AuthenticationError as OpenAIAuthenticationError
-    from openai import OpenAI
-except ImportError:  # pragma: no cover - optional dependency for multi-provider mode
-    OpenAI = None
-
-    class OpenAIAuthenticationError(Exception):
-        pass
-
-load_dotenv(Path(__file__).parent / ".env")
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - hot reload falls back to stat polling
+    FileSystemEventHandler = None
+    Observer = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from skill_finder import (  # noqa: E402
+    FINDER_FIELDS,
+    Finder,
+    LiveSearch,
+    PhraseCorpus,
+    Ranked,
+    SemanticIndex,
+    SkillGraph,
+    field_term_counts,
+    match_reasons,
+    normalize_text,
+    purpose_excerpt,
+    search_text,
+    select_page,
+    sparse_product,
+    tokenize_text,
+)
+from skill_library import Section, SectionMap, parse_text, split_sections  # noqa: E402
+
+ENV_FILE = Path(__file__).parent / ".env"
+if ENV_FILE.exists():
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_FILE)
 
 # ─── Constants ────────────────────────────────────────────────────────────────
 
 SKILLS_DIR = Path(__file__).parent.parent / "skills"
 DOCS_DIR = Path(__file__).parent.parent / "docs"
 ROOT_DIR = Path(__file__).parent.parent
+SNAPSHOT_PATH = ROOT_DIR / ".cache" / "skill-snapshot.json"
+SNAPSHOT_VERSION = 5
+SEARCH_CORPUS_PATH = ROOT_DIR / ".cache" / "skill-search-corpus.bin"
+SEMANTIC_INDEX_PATH = ROOT_DIR / "catalog" / "skills-semantic.npz"
+SKILL_GRAPH_PATH = ROOT_DIR / "catalog" / "skills-graph.json"
+SKILL_CONTENT_CACHE_SIZE = 128
+WATCH_POLL_SECONDS = 2.0
+# Pooled provider clients (see `ProviderClients`): idle connections are kept
+# this long so consecutive turns skip the TCP and TLS handshake.
+PROVIDER_KEEPALIVE_SECONDS = 120.0
+PROVIDER_KEEPALIVE_CONNECTIONS = 8
+PROVIDER_MAX_CONNECTIONS = 16
+MODEL_MAX_TOKENS = 2048
+# "Run all phases" waits this long for the first phase's first token (its
+# prompt cache write) before starting the other phases anyway.
+WORKFLOW_WARMUP_SECONDS = 30.0
+# Opt-in learning-simulator response cache (PLAYGROUND_RESPONSE_CACHE=1).
+RESPONSE_CACHE_PATH = ROOT_DIR / ".cache" / "responses.sqlite3"
+RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+RESPONSE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+IMPORTTIME_MODULES = ("streamlit", "yaml", "dotenv", "watchdog", "numpy", "anthropic", "openai")
+# Provider SDKs are imported on the first model call (see `provider_sdk()`),
+# so browsing Learn/Find never pays for them. `sdk` names the module to load.
 PROVIDERS = {
     "anthropic": {
         "label": "Anthropic",
+        "sdk": "anthropic",
         "key_env": "ANTHROPIC_API_KEY",
         "default_model_env": "ANTHROPIC_MODEL",
         "models_env": "ANTHROPIC_MODELS",
+        "concurrency_env": "ANTHROPIC_MAX_CONCURRENCY",
+        "default_concurrency": 4,
         "default_models": ["claude-haiku-4-5-20251001", "claude-sonnet-4-6"],
         "model_help": {
             "claude-haiku-4-5-20251001": "Fast (cheaper; may miss depth in long workflows)",
@@ -43,12 +107,15 @@ PROVIDERS = {
         },
     },
 }
-if OpenAI is not None:
+if importlib.util.find_spec("openai") is not None:  # optional dependency for multi-provider mode
     PROVIDERS["openai"] = {
         "label": "OpenAI",
+        "sdk": "openai",
         "key_env": "OPENAI_API_KEY",
         "default_model_env": "OPENAI_MODEL",
         "models_env": "OPENAI_MODELS",
+        "concurrency_env": "OPENAI_MAX_CONCURRENCY",
+        "default_concurrency": 4,
         "default_models": ["gpt-4o-mini", "gpt-4o"],
         "model_help": {
             "gpt-4o-mini": "Fast (cheaper; may miss depth in long workflows)",
@@ -57,9 +124,12 @@ if OpenAI is not None:
     }
     PROVIDERS["ollama"] = {
         "label": "Ollama",
+        "sdk": "openai",
         "key_env": None,
         "default_model_env": "OLLAMA_MODEL",
         "models_env": "OLLAMA_MODELS",
+        "concurrency_env": "OLLAMA_MAX_CONCURRENCY",
+        "default_concurrency": 1,
         "default_models": ["qwen2.5:latest", "llama3.2:latest"],
         "model_help": {
             "qwen2.5:latest": "Fast (local; may miss depth in long workflows)",
@@ -287,73 +357,447 @@ FIND_MY_SKILL_PROMPTS = [
 
 # ─── Skill Loading ─────────────────────────────────────────────────────────────
 
-@st.cache_data
-def load_skills():
-    """Parse all SKILL.md files. Returns list of skill dicts."""
-    skills = []
-    for skill_dir in sorted(SKILLS_DIR.iterdir()):
-        skill_file = skill_dir / "SKILL.md"
-        if not skill_file.exists():
-            continue
-        text = skill_file.read_text(encoding="utf-8")
-        if not text.startswith("---\n"):
-            continue
-        parts = text.split("---", 2)
-        if len(parts) < 3:
-            continue
-        try:
-            fm = yaml.safe_load(parts[1]) or {}
-        except yaml.YAMLError:
-            continue
+@dataclass(frozen=True)
+class Skill:
+    """Immutable skill metadata, shared by reference across sessions.
+
+    List views only ever touch these fields. The full body and its sections
+    live in `SkillContent`, loaded on demand through `load_skill_content()`.
+    `field_terms` is tokenized once at compile time: per finder field (and
+    the body), each alphanumeric run with its count.
+    """
+
+    name: str
+    description: str
+    intent: str
+    type: str
+    theme: str | None
+    best_for: tuple[str, ...]
+    scenarios: tuple[str, ...]
+    estimated_time: str | None
+    purpose_short: str
+    has_examples: bool
+    search_text: Mapping[str, str]
+    field_terms: Mapping[str, Mapping[str, int]]
+    path: str
+    sha256: str
+    body_span: tuple[int, int]
+    section_spans: tuple[Section, ...]
+
+
+@dataclass(frozen=True)
+class SkillContent:
+    """Full SKILL.md body, loaded on first use.
+
+    `sections` maps each `##` heading to its content, sliced from `body` on
+    access; `outline` keeps the nested `##`/`###` offsets.
+    """
+
+    body: str
+    sections: SectionMap
+    outline: tuple[Section, ...]
+    search_body: str
+
+
+@dataclass(frozen=True)
+class SkillLibrary:
+    """Process-wide skill registry: ordered records plus a name lookup."""
+
+    skills: tuple[Skill, ...]
+    by_name: Mapping[str, Skill]
+    version: int = 0
+
+    def get(self, name: str | None) -> Skill | None:
+        return self.by_name.get(name or "")
+
+    @functools.cached_property
+    def finder(self) -> Finder:
+        """Find My Skill ranking; its indexes are built on the first search of this version."""
+        return Finder(
+            [skill.name for skill in self.skills],
+            [skill.search_text for skill in self.skills],
+            [skill.field_terms for skill in self.skills],
+            self.body_contains,
+        )
 
-        body = parts[2].strip()
-
-        # Extract ## sections into a dict
-        sections: dict[str, str] = {}
-        current: str | None = None
-        buf: list[str] = []
-        for line in body.split("\n"):
-            if line.startswith("## "):
-                if current is not None:
-                    sections[current] = "\n".join(buf).strip()
-                current = line[3:].strip()
-                buf = []
-            else:
-                buf.append(line)
-        if current is not None:
-            sections[current] = "\n".join(buf).strip()
-
-        # First non-empty paragraph of Purpose as a short excerpt
-        purpose_text = sections.get("Purpose", "")
-        purpose_short = next(
-            (p.strip() for p in purpose_text.split("\n\n") if p.strip()), ""
+    def body_contains(self, i: int, phrase: str) -> bool:
+        """Whether skill i's normalized body contains `phrase`, from the corpus when it can."""
+        skill = self.skills[i]
+        corpus = self.phrase_corpus
+        hit = corpus.contains(skill.sha256, phrase) if corpus else None
+        if hit is None:
+            hit = phrase in load_skill_content(skill).search_body
+        return hit
+
+    @functools.cached_property
+    def phrase_corpus(self) -> PhraseCorpus | None:
+        """Normalized skill bodies for multi-word phrase checks, keyed by sha256.
+
+        Only skills whose hash is not already in SEARCH_CORPUS_PATH are read.
+        """
+        return PhraseCorpus.build(
+            SEARCH_CORPUS_PATH,
+            ((skill.sha256, functools.partial(read_search_body, skill)) for skill in self.skills),
         )
 
-        skills.append(
-            {
-                "name": fm.get("name", skill_dir.name),
-                "description": fm.get("description", ""),
-                "intent": fm.get("intent", ""),
-                "type": fm.get("type", "component"),
-                "theme": fm.get("theme"),
-                "best_for": fm.get("best_for") or [],
-                "scenarios": fm.get("scenarios") or [],
-                "estimated_time": fm.get("estimated_time"),
-                "body": body,
-                "sections": sections,
-                "purpose_short": purpose_short,
-                "has_examples": (skill_dir / "examples").exists(),
-            }
+
+def compile_skill(text: str, fallback_name: str) -> dict | None:
+    """Parse SKILL.md text into a JSON-safe record, or None if unusable.
+
+    The body is not stored: `body_span` locates it in the file text and
+    sections are nested `Section` offsets into the body.
+    """
+    parsed = parse_text(text)
+    fm = parsed.frontmatter
+    if fm is None:
+        return None
+
+    raw_body = parsed.body
+    body = raw_body.strip()
+    body_start = len(text) - len(raw_body) + (len(raw_body) - len(raw_body.lstrip()))
+
+    outline = split_sections(body)
+    sections = SectionMap(body, outline)
+
+    # First non-empty paragraph of Purpose as a short excerpt
+    purpose_short = purpose_excerpt(sections.get("Purpose", ""))
+
+    record = {
+        "name": fm.get("name", fallback_name),
+        "description": fm.get("description", ""),
+        "intent": fm.get("intent", ""),
+        "type": fm.get("type", "component"),
+        "theme": fm.get("theme"),
+        "best_for": list(fm.get("best_for") or []),
+        "scenarios": list(fm.get("scenarios") or []),
+        "estimated_time": fm.get("estimated_time"),
+        "body_span": [body_start, body_start + len(body)],
+        "sections": [section.to_json() for section in outline],
+        "purpose_short": purpose_short,
+    }
+    record["search_text"] = search_text(
+        record["name"],
+        record["description"],
+        record["best_for"],
+        record["scenarios"],
+        record["intent"],
+        purpose_short,
+    )
+    record["field_terms"] = field_term_counts(record["search_text"], body)
+    return record
+
+
+def skill_from_record(record: dict, path: Path, sha256: str) -> Skill:
+    return Skill(
+        name=record["name"],
+        description=record["description"],
+        intent=record["intent"],
+        type=record["type"],
+        theme=record["theme"],
+        best_for=tuple(record["best_for"]),
+        scenarios=tuple(record["scenarios"]),
+        estimated_time=record["estimated_time"],
+        purpose_short=record["purpose_short"],
+        has_examples=(path.parent / "examples").exists(),
+        search_text=MappingProxyType(record["search_text"]),
+        field_terms=MappingProxyType(record["field_terms"]),
+        path=str(path),
+        sha256=sha256,
+        body_span=tuple(record["body_span"]),
+        section_spans=tuple(Section.from_json(data) for data in record["sections"]),
+    )
+
+
+def load_skill_content(skill: Skill) -> SkillContent:
+    """Return the skill's body and sections, read from disk on first access."""
+    return _read_skill_content(skill.path, skill.sha256, skill.body_span, skill.section_spans)
+
+
+# st.cache_resource rather than functools.lru_cache: Streamlit re-executes this
+# module on every rerun, which would hand lru_cache a fresh, empty cache each
+# time. The offsets are derived from `sha256`, so they are left out of the key.
+@st.cache_resource(max_entries=SKILL_CONTENT_CACHE_SIZE, show_spinner=False)
+def _read_skill_content(
+    path: str,
+    sha256: str,
+    _body_span: tuple[int, int],
+    _section_spans: tuple[Section, ...],
+) -> SkillContent:
+    return read_skill_content(path, sha256, _body_span, _section_spans)
+
+
+def read_search_body(skill: Skill) -> str:
+    """Normalized body for the phrase corpus, read without filling the content cache."""
+    return read_skill_content(skill.path, skill.sha256, skill.body_span, skill.section_spans).search_body
+
+
+def read_skill_content(
+    path: str,
+    sha256: str,
+    body_span: tuple[int, int],
+    section_spans: tuple[Section, ...],
+) -> SkillContent:
+    data = Path(path).read_bytes()
+    text = data.decode("utf-8")
+    if hashlib.sha256(data).hexdigest() != sha256:
+        # Edited since the registry loaded; re-split the current text.
+        record = compile_skill(text, Path(path).parent.name)
+        if record is None:
+            return SkillContent(body="", sections=SectionMap("", ()), outline=(), search_body="")
+        body_span = tuple(record["body_span"])
+        section_spans = tuple(Section.from_json(data) for data in record["sections"])
+    body = text[body_span[0]:body_span[1]]
+    return SkillContent(
+        body=body,
+        sections=SectionMap(body, section_spans),
+        outline=section_spans,
+        search_body=normalize_text(body),
+    )
+
+
+def read_skill_snapshot() -> dict[str, dict]:
+    """Return the compiled snapshot entries, or {} when missing, stale, or corrupt."""
+    try:
+        payload = json.loads(SNAPSHOT_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION:
+        return {}
+    entries = payload.get("skills")
+    return entries if isinstance(entries, dict) else {}
+
+
+def write_skill_snapshot(entries: dict[str, dict]) -> None:
+    """Atomically replace the snapshot; read-only deployments just skip it."""
+    payload = {"version": SNAPSHOT_VERSION, "skills": entries}
+    try:
+        SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = SNAPSHOT_PATH.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, SNAPSHOT_PATH)
+    except OSError:
+        pass
+
+
+def load_skill_entry(skill_file: Path, entry: dict | None) -> tuple[dict, bool]:
+    """Return the snapshot entry for one SKILL.md and whether it was refreshed.
+
+    Unchanged stat info reuses the entry as-is; otherwise the file is hashed and
+    re-parsed only when its content actually changed. A file that is not valid
+    UTF-8 (or was caught half-written) gets a None record, like bad YAML.
+    """
+    stat = skill_file.stat()
+    if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+        return entry, False
+    data = skill_file.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if not entry or entry.get("sha256") != digest:
+        try:
+            record = compile_skill(data.decode("utf-8"), skill_file.parent.name)
+        except UnicodeDecodeError:
+            record = None
+        entry = {"sha256": digest, "record": record}
+    return {**entry, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}, True
+
+
+class LibraryRegistry:
+    """Live skill library and guide cache for this process.
+
+    Readers take `registry.library`, an immutable `SkillLibrary`. Writers hold
+    the lock, rebuild only the skill that changed, and publish a new library
+    with one attribute assignment, so a rerun sees either the old library or
+    the new one and never a half-updated mix.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        self._skills: dict[str, Skill] = {}
+        self._guides: dict[Path, tuple[int, str]] = {}
+        self.library = SkillLibrary(skills=(), by_name=MappingProxyType({}))
+
+    def load(self) -> SkillLibrary:
+        """Build the full library from the snapshot plus any changed files."""
+        with self._lock:
+            cached = read_skill_snapshot()
+            entries: dict[str, dict] = {}
+            skills: dict[str, Skill] = {}
+            dirty = False
+            for skill_dir in sorted(SKILLS_DIR.iterdir()):
+                skill_file = skill_dir / "SKILL.md"
+                if not skill_file.is_file():
+                    continue
+                entry, changed = load_skill_entry(skill_file, cached.get(skill_dir.name))
+                dirty = dirty or changed
+                entries[skill_dir.name] = entry
+                if entry["record"] is not None:
+                    skills[skill_dir.name] = skill_from_record(entry["record"], skill_file, entry["sha256"])
+
+            if dirty or entries.keys() != cached.keys():
+                write_skill_snapshot(entries)
+            self._entries = entries
+            self._publish(skills)
+            return self.library
+
+    def reload_skill(self, folder: str) -> bool:
+        """Re-parse one skills/<folder>/SKILL.md; returns True if the library changed."""
+        with self._lock:
+            skill_file = SKILLS_DIR / folder / "SKILL.md"
+            old = self._entries.get(folder)
+            entries = dict(self._entries)
+            skills = dict(self._skills)
+            if skill_file.is_file():
+                entry, changed = load_skill_entry(skill_file, old)
+                if not changed:
+                    return False
+                entries[folder] = entry
+                write_skill_snapshot(entries)
+                self._entries = entries
+                if old and old["sha256"] == entry["sha256"]:
+                    return False
+                if entry["record"] is None:
+                    skills.pop(folder, None)
+                else:
+                    skills[folder] = skill_from_record(entry["record"], skill_file, entry["sha256"])
+            elif old is None:
+                return False
+            else:
+                del entries[folder]
+                skills.pop(folder, None)
+                write_skill_snapshot(entries)
+                self._entries = entries
+            self._publish(skills)
+            return True
+
+    def refresh(self) -> None:
+        """Stat every skill and cached guide, reloading whatever changed."""
+        folders = {p.parent.name for p in SKILLS_DIR.glob("*/SKILL.md")}
+        for folder in sorted(folders | self._entries.keys()):
+            self.reload_skill(folder)
+        for path, (mtime_ns, _text) in list(self._guides.items()):
+            try:
+                current = path.stat().st_mtime_ns
+            except OSError:
+                current = -1
+            if current != mtime_ns:
+                self.invalidate_path(path)
+
+    def invalidate_path(self, path: Path) -> None:
+        """Route a filesystem change to the skill or guide it belongs to."""
+        path = path.resolve()
+        try:
+            folder = path.relative_to(SKILLS_DIR.resolve()).parts[0]
+        except (ValueError, IndexError):
+            self._guides.pop(path, None)
+            return
+        self.reload_skill(folder)
+
+    def guide_markdown(self, path: Path) -> str:
+        path = path.resolve()
+        cached = self._guides.get(path)
+        if cached is not None:
+            return cached[1]
+        if not path.exists():
+            return f"# Missing guide\n\nCould not find `{path}`."
+        mtime_ns = path.stat().st_mtime_ns
+        text = path.read_text(encoding="utf-8")
+        self._guides[path] = (mtime_ns, text)
+        return text
+
+    def _publish(self, skills: dict[str, Skill]) -> None:
+        ordered = tuple(skills[folder] for folder in sorted(skills))
+        self._skills = skills
+        self.library = SkillLibrary(
+            skills=ordered,
+            by_name=MappingProxyType({skill.name: skill for skill in ordered}),
+            version=self.library.version + 1,
         )
-    return skills
 
 
-@st.cache_data
-def load_guide_markdown(path_str: str) -> str:
-    path = Path(path_str)
-    if not path.exists():
-        return f"# Missing guide\n\nCould not find `{path}`."
-    return path.read_text(encoding="utf-8")
+if FileSystemEventHandler is not None:
+
+    class LibraryEventHandler(FileSystemEventHandler):
+        """Forward watchdog events to the registry for targeted invalidation."""
+
+        IGNORED_EVENTS = {"opened", "closed_no_write"}
+
+        def __init__(self, registry: LibraryRegistry) -> None:
+            super().__init__()
+            self.registry = registry
+
+        def on_any_event(self, event) -> None:
+            if event.event_type in self.IGNORED_EVENTS:
+                return
+            for raw_path in (event.src_path, getattr(event, "dest_path", "")):
+                if not raw_path:
+                    continue
+                # An exception here would kill watchdog's dispatcher thread and
+                # stop hot reload for every session, so log it and keep going.
+                try:
+                    self.registry.invalidate_path(Path(os.fsdecode(raw_path)))
+                except OSError:
+                    continue  # raced a delete or rename; its own event follows
+                except Exception:
+                    logging.exception("Skill library reload failed for %s", raw_path)
+
+
+def poll_library(registry: LibraryRegistry) -> None:
+    while True:
+        time.sleep(WATCH_POLL_SECONDS)
+        try:
+            registry.refresh()
+        except OSError:
+            continue
+        except Exception:
+            logging.exception("Skill library refresh failed; still polling")
+
+
+def start_library_watcher(registry: LibraryRegistry) -> str:
+    """Watch skills and guides for edits. Returns the mode actually used.
+
+    `SKILLS_WATCH=auto` (default) uses inotify/FSEvents through watchdog when it
+    is installed and falls back to stat polling; `poll` forces polling; `off`
+    disables hot reload entirely.
+    """
+    mode = os.getenv("SKILLS_WATCH", "auto").strip().lower()
+    if mode in {"0", "off", "false", "no"}:
+        return "off"
+    if mode != "poll" and Observer is not None:
+        observer = Observer()
+        handler = LibraryEventHandler(registry)
+        observer.schedule(handler, str(SKILLS_DIR), recursive=True)
+        guide_dirs = {guide["path"].parent for group in GUIDE_GROUPS for guide in group["guides"]}
+        for guide_dir in sorted(guide_dirs):
+            observer.schedule(handler, str(guide_dir), recursive=False)
+        observer.daemon = True
+        observer.start()
+        return "watchdog"
+    threading.Thread(target=poll_library, args=(registry,), name="skill-library-poll", daemon=True).start()
+    return "poll"
+
+
+@st.cache_resource
+def library_registry() -> LibraryRegistry:
+    """One registry per process, loaded once and kept fresh by the watcher."""
+    registry = LibraryRegistry()
+    registry.load()
+    start_library_watcher(registry)
+    return registry
+
+
+def load_skills() -> SkillLibrary:
+    """Return the current shared skill library.
+
+    `st.cache_resource` hands every rerun and every session the same registry,
+    so views read records by reference and must treat them as read-only (the
+    frozen dataclasses and mapping proxies enforce that). Call this once per
+    rerun: a hot reload between reruns publishes a new library object.
+    """
+    return library_registry().library
+
+
+def load_guide_markdown(path: Path) -> str:
+    return library_registry().guide_markdown(path)
 
 
 # ─── API ──────────────────────────────────────────────────────────────────────
@@ -412,51 +856,542 @@ def provider_model_help(provider: str) -> dict[str, str]:
     return PROVIDERS[provider]["model_help"]
 
 
+def provider_concurrency(provider: str) -> int:
+    """Most workflow phases this process runs at once against `provider`."""
+    raw = os.getenv(PROVIDERS[provider]["concurrency_env"], "").strip()
+    return max(1, int(raw)) if raw.isdigit() else PROVIDERS[provider]["default_concurrency"]
+
+
+class ProviderSDKs:
+    """Provider SDK modules, imported the first time each one is needed."""
+
+    def __init__(self) -> None:
+        self.modules: dict[str, object] = {}
+        self.import_seconds: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def load(self, provider: str):
+        module_name = PROVIDERS[provider]["sdk"]
+        with self._lock:
+            if module_name not in self.modules:
+                started = time.perf_counter()
+                try:
+                    module = importlib.import_module(module_name)
+                except ImportError as e:
+                    raise RuntimeError(
+                        f"{module_name} package is not installed. Run: pip install -r app/requirements.txt"
+                    ) from e
+                self.import_seconds[module_name] = time.perf_counter() - started
+                self.modules[module_name] = module
+            return self.modules[module_name]
+
+
+@st.cache_resource
+def provider_sdks() -> ProviderSDKs:
+    return ProviderSDKs()
+
+
+def provider_sdk(provider: str):
+    return provider_sdks().load(provider)
+
+
 def is_auth_error(error: Exception) -> bool:
-    return isinstance(error, (anthropic.AuthenticationError, OpenAIAuthenticationError))
+    # Only an SDK that has been imported can have raised the error.
+    auth_errors = tuple(module.AuthenticationError for module in provider_sdks().modules.values())
+    return bool(auth_errors) and isinstance(error, auth_errors)
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    """Tokens billed for one model call.
+
+    `input_tokens` is the whole prompt. `cached_input_tokens` of it were read
+    from the provider's prompt cache and `cache_write_tokens` were written to
+    it (Anthropic only); the rest were processed from scratch.
+    """
+
+    input_tokens: int
+    cached_input_tokens: int
+    cache_write_tokens: int
+    output_tokens: int
+
+    @property
+    def uncached_input_tokens(self) -> int:
+        return self.input_tokens - self.cached_input_tokens
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(
+            self.input_tokens + other.input_tokens,
+            self.cached_input_tokens + other.cached_input_tokens,
+            self.cache_write_tokens + other.cache_write_tokens,
+            self.output_tokens + other.output_tokens,
+        )
 
+    @classmethod
+    def from_anthropic(cls, usage) -> "TokenUsage":
+        read = getattr(usage, "cache_read_input_tokens", None) or 0
+        written = getattr(usage, "cache_creation_input_tokens", None) or 0
+        return cls(usage.input_tokens + read + written, read, written, usage.output_tokens)
+
+    @classmethod
+    def from_openai(cls, usage: Mapping) -> "TokenUsage":
+        cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+        return cls(usage.get("prompt_tokens") or 0, cached, 0, usage.get("completion_tokens") or 0)
+
+
+NO_TOKENS = TokenUsage(0, 0, 0, 0)
+UsageCallback = Callable[[TokenUsage], None]
+
+
+@dataclass
+class ClientStats:
+    """Connection reuse and request latency for one pooled provider client."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    new_connection_seconds: float = 0.0
+    reused_connection_seconds: float = 0.0
+    streams: int = 0
+    first_token_seconds: float = 0.0
+    usage: TokenUsage = NO_TOKENS
+
+    @property
+    def connections_reused(self) -> int:
+        return self.requests - self.connections_opened
+
+    def mean_seconds(self, reused: bool) -> float | None:
+        count = self.connections_reused if reused else self.connections_opened
+        total = self.reused_connection_seconds if reused else self.new_connection_seconds
+        return total / count if count else None
+
+    @property
+    def mean_first_token_seconds(self) -> float | None:
+        return self.first_token_seconds / self.streams if self.streams else None
+
+
+class ProviderClients:
+    """Long-lived provider clients, shared by every session and thread.
+
+    A client owns an HTTP connection pool, so building one per call paid a
+    TCP and TLS handshake on every turn. Clients are keyed by provider, a
+    hash of the API key, and base URL. Their pools keep idle connections for
+    PROVIDER_KEEPALIVE_SECONDS (httpx defaults to 5 s, shorter than a typical
+    pause between chat turns). An httpcore trace hook counts the connections
+    each client opens, so `stats` shows how many requests reused one and the
+    time to response headers either way. `stream_model()` adds the time to
+    the first streamed token, and every call adds its `TokenUsage`.
+    """
+
+    def __init__(self, sdks: ProviderSDKs) -> None:
+        self.sdks = sdks
+        self.clients: dict[tuple[str, str, str | None], object] = {}
+        self.stats: dict[tuple[str, str, str | None], ClientStats] = {}
+        self.slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(provider: str, api_key: str, base_url: str | None) -> tuple[str, str, str | None]:
+        return provider, hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12], base_url
+
+    def get(self, provider: str, api_key: str):
+        base_url = ollama_base_url() if provider == "ollama" else None
+        key = self.key(provider, api_key, base_url)
+        with self._lock:
+            client = self.clients.get(key)
+            if client is None:
+                client = self.clients[key] = self._build(provider, api_key, base_url, key)
+            return client
+
+    def slot(self, provider: str) -> threading.BoundedSemaphore:
+        """Process-wide `provider_concurrency()` cap, shared by every session's workflow runs."""
+        with self._lock:
+            if provider not in self.slots:
+                self.slots[provider] = threading.BoundedSemaphore(provider_concurrency(provider))
+            return self.slots[provider]
+
+    def _stats(self, provider: str, api_key: str) -> ClientStats:
+        base_url = ollama_base_url() if provider == "ollama" else None
+        return self.stats[self.key(provider, api_key, base_url)]
+
+    def record_first_token(self, provider: str, api_key: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats(provider, api_key)
+            stats.streams += 1
+            stats.first_token_seconds += seconds
+
+    def record_usage(
+        self, provider: str, api_key: str, usage: TokenUsage, on_usage: UsageCallback | None = None
+    ) -> None:
+        with self._lock:
+            stats = self._stats(provider, api_key)
+            stats.usage += usage
+        if on_usage is not None:
+            on_usage(usage)
+
+    def _build(self, provider: str, api_key: str, base_url: str | None, key: tuple):
+        sdk = self.sdks.load(provider)
+        stats = self.stats[key] = ClientStats()
+        lock = self._lock
+
+        def on_request(request) -> None:
+            request.extensions["pm_started"] = time.perf_counter()
+            request.extensions["pm_opened"] = opened = []
+
+            def trace(event: str, info: dict) -> None:
+                if event == "connection.connect_tcp.complete":
+                    opened.append(True)
+
+            request.extensions["trace"] = trace
+
+        def on_response(response) -> None:
+            extensions = response.request.extensions
+            if "pm_started" not in extensions:
+                return
+            elapsed = time.perf_counter() - extensions["pm_started"]
+            with lock:
+                stats.requests += 1
+                if extensions["pm_opened"]:
+                    stats.connections_opened += 1
+                    stats.new_connection_seconds += elapsed
+                else:
+                    stats.reused_connection_seconds += elapsed
 
-def call_model(provider: str, api_key: str, model: str, system: str, messages: list) -> str:
-    if provider == "anthropic":
-        client = anthropic.Anthropic(api_key=api_key)
-        response = client.messages.create(
-            model=model,
-            max_tokens=2048,
-            system=system,
-            messages=messages,
+        import httpx  # a dependency of both provider SDKs, already imported by them
+
+        limits = httpx.Limits(
+            max_connections=PROVIDER_MAX_CONNECTIONS,
+            max_keepalive_connections=PROVIDER_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=PROVIDER_KEEPALIVE_SECONDS,
+        )
+        http_client = sdk.DefaultHttpxClient(
+            limits=limits,
+            event_hooks={"request": [on_request], "response": [on_response]},
         )
+        if provider == "anthropic":
+            return sdk.Anthropic(api_key=api_key, http_client=http_client)
+        return sdk.OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+
+@st.cache_resource
+def provider_clients() -> ProviderClients:
+    return ProviderClients(provider_sdks())
+
+
+def anthropic_request(model: str, system: str, messages: list) -> dict:
+    """Messages API arguments with the stable prompt prefix marked `cache_control`.
+
+    The system prompt (the skill body) is the same for every turn and every
+    workflow phase, so it is always a cache breakpoint. In a conversation,
+    everything up to the newest message is also the prefix of the next turn,
+    so the newest message is a second breakpoint. A one-message request gets
+    only the first, since writing a prefix nobody resends costs extra.
+    Later calls within the cache lifetime (5 minutes, refreshed on each read)
+    read the prefix back instead of reprocessing it. Prompts shorter than the
+    model's cache minimum are simply sent uncached.
+    """
+    cached_messages = [dict(message) for message in messages]
+    last = cached_messages[-1]
+    if len(cached_messages) > 1 and isinstance(last["content"], str):
+        last["content"] = [{"type": "text", "text": last["content"], "cache_control": {"type": "ephemeral"}}]
+    return {
+        "model": model,
+        "max_tokens": MODEL_MAX_TOKENS,
+        "system": [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+        "messages": cached_messages,
+    }
+
+
+def openai_request(model: str, system: str, messages: list) -> dict:
+    """Chat Completions arguments. OpenAI caches long prompt prefixes automatically;
+    the skill body leads as the system message so every call shares that prefix."""
+    return {
+        "model": model,
+        "max_tokens": MODEL_MAX_TOKENS,
+        "messages": [{"role": "system", "content": system}] + messages,
+    }
+
+
+def call_model(
+    provider: str, api_key: str, model: str, system: str, messages: list, on_usage: UsageCallback | None = None
+) -> str:
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unsupported provider: {provider}")
+    clients = provider_clients()
+    client = clients.get(provider, api_key)
+
+    if provider == "anthropic":
+        response = client.messages.create(**anthropic_request(model, system, messages))
+        clients.record_usage(provider, api_key, TokenUsage.from_anthropic(response.usage), on_usage)
         return response.content[0].text
 
-    if provider == "openai":
-        if OpenAI is None:
-            raise RuntimeError("openai package is not installed. Run: pip install -r app/requirements.txt")
-        client = OpenAI(api_key=api_key)
-        openai_messages = [{"role": "system", "content": system}] + messages
-        response = client.chat.completions.create(
-            model=model,
-            messages=openai_messages,
-            max_tokens=2048,
-        )
+    if provider in ("openai", "ollama"):
+        response = client.chat.completions.create(**openai_request(model, system, messages))
+        if response.usage is not None:
+            clients.record_usage(provider, api_key, TokenUsage.from_openai(response.usage.model_dump()), on_usage)
         return response.choices[0].message.content or ""
 
-    if provider == "ollama":
-        if OpenAI is None:
-            raise RuntimeError("openai package is not installed. Run: pip install -r app/requirements.txt")
-        client = OpenAI(api_key=api_key, base_url=ollama_base_url())
-        openai_messages = [{"role": "system", "content": system}] + messages
-        response = client.chat.completions.create(
-            model=model,
-            messages=openai_messages,
-            max_tokens=2048,
+    raise ValueError(f"Unsupported provider: {provider}")
+
+
+def stream_model(
+    provider: str,
+    api_key: str,
+    model: str,
+    system: str,
+    messages: list,
+    on_usage: UsageCallback | None = None,
+    clients: ProviderClients | None = None,
+) -> Iterator[str]:
+    """Yield the reply as text deltas as they arrive, for `st.write_stream`.
+
+    Same request as `call_model`, so the first words show while the rest is
+    still being generated. `on_usage` gets the call's `TokenUsage` once the
+    stream ends. Worker threads pass `clients` so they never touch Streamlit.
+    """
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unsupported provider: {provider}")
+    clients = clients or provider_clients()
+    client = clients.get(provider, api_key)
+    started = time.perf_counter()
+
+    if provider == "anthropic":
+        with client.messages.stream(**anthropic_request(model, system, messages)) as events:
+            deltas = (text for text in events.text_stream if text)
+            yield from timed_first_token(deltas, clients, provider, api_key, started)
+            usage = TokenUsage.from_anthropic(events.get_final_message().usage)
+        clients.record_usage(provider, api_key, usage, on_usage)
+        return
+
+    if provider in ("openai", "ollama"):
+        # Read the server-sent events directly: the SDK's Stream stops at
+        # "[DONE]" and closes the response unread, which discards the pooled
+        # connection instead of returning it.
+        stream = client.chat.completions.with_streaming_response.create(
+            **openai_request(model, system, messages),
+            stream=True,
+            stream_options={"include_usage": True},
         )
-        return response.choices[0].message.content or ""
+        usage: list[TokenUsage] = []
+        with stream as response:
+            deltas = openai_stream_deltas(response.iter_lines(), usage.append)
+            yield from timed_first_token(deltas, clients, provider, api_key, started)
+        if usage:
+            clients.record_usage(provider, api_key, usage[-1], on_usage)
+        return
 
     raise ValueError(f"Unsupported provider: {provider}")
 
 
-def build_system_prompt(skill: dict) -> str:
+def openai_stream_deltas(lines: Iterable[str], on_usage: UsageCallback) -> Iterator[str]:
+    """Text deltas from OpenAI-style chat completion server-sent events, read to the end.
+
+    The final event carries the call's token usage when `include_usage` was requested.
+    """
+    for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            continue
+        chunk = json.loads(data)
+        if chunk.get("error"):
+            raise RuntimeError(f"Model stream failed: {chunk['error']}")
+        if chunk.get("usage"):
+            on_usage(TokenUsage.from_openai(chunk["usage"]))
+        for choice in chunk.get("choices") or ():
+            text = (choice.get("delta") or {}).get("content")
+            if text:
+                yield text
+
+
+def timed_first_token(
+    deltas: Iterable[str], clients: ProviderClients, provider: str, api_key: str, started: float
+) -> Iterator[str]:
+    deltas = iter(deltas)
+    first = next(deltas, None)
+    if first is None:
+        return
+    clients.record_first_token(provider, api_key, time.perf_counter() - started)
+    yield first
+    yield from deltas
+
+
+def run_workflow_phases(
+    provider: str, api_key: str, model: str, system: str, prompts: Sequence[str], usages: list[TokenUsage]
+) -> Iterator[tuple[int, str]]:
+    """Run independent phase prompts in parallel, yielding (index, reply) as each finishes.
+
+    Every prompt shares `system`, so the first phase starts alone and the rest
+    wait for its first token, by which time the provider has cached that
+    prefix, or WORKFLOW_WARMUP_SECONDS. Each call then holds one of the
+    provider's `ProviderClients.slot()` permits. `usages` collects each
+    call's `TokenUsage`. On a failure, phases that have not started are
+    cancelled, those already running still finish and are yielded, and then
+    the first failure is raised.
+    """
+    clients = provider_clients()
+    slot = clients.slot(provider)
+    warm = threading.Event()
+
+    def run(index: int) -> str:
+        if index:
+            warm.wait(WORKFLOW_WARMUP_SECONDS)
+        messages = [{"role": "user", "content": prompts[index]}]
+        parts = []
+        with slot:
+            try:
+                for delta in stream_model(provider, api_key, model, system, messages, usages.append, clients):
+                    warm.set()
+                    parts.append(delta)
+            finally:
+                warm.set()
+        return "".join(parts)
+
+    workers = min(provider_concurrency(provider), len(prompts)) or 1
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="workflow-phase")
+    failure: BaseException | None = None
+    try:
+        futures = {pool.submit(run, index): index for index in range(len(prompts))}
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is None:
+                yield futures[future], future.result()
+            elif failure is None:
+                failure = error
+                for pending in futures:
+                    pending.cancel()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    if failure is not None:
+        raise failure
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored model reply and where it came from."""
+
+    response: str
+    provider: str
+    model: str
+    source: str
+    created: float
+    hits: int
+
+
+class ResponseCache:
+    """Model replies in a local SQLite file, keyed by a hash of the request.
+
+    `key()` hashes provider, model, system prompt, messages, and max tokens,
+    so only an identical request is answered from the cache. Entries expire
+    after `ttl_seconds`, and the least recently used are evicted once the
+    stored replies exceed `max_bytes`. Each entry keeps its provenance: the
+    provider and model that produced it, the view and skill that asked
+    (`source`), when it was written, and how often it has been served.
+    A database that cannot be opened or written is treated as a miss.
+    """
+
+    def __init__(self, path: Path, max_bytes: int, ttl_seconds: float) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(provider: str, model: str, system: str, messages: list, max_tokens: int) -> str:
+        payload = json.dumps([provider, model, system, messages, max_tokens], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, bytes INTEGER NOT NULL, "
+                "provider TEXT NOT NULL, model TEXT NOT NULL, source TEXT NOT NULL, "
+                "created REAL NOT NULL, last_used REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+            self._db = db
+        return self._db
+
+    def get(self, key: str) -> CachedResponse | None:
+        now = time.time()
+        with self._lock:
+            try:
+                db = self._connect()
+                row = db.execute(
+                    "SELECT response, provider, model, source, created, hits FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[4] > self.ttl_seconds:
+                    with db:
+                        db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    row = None
+                if row is None:
+                    self.misses += 1
+                    return None
+                with db:
+                    db.execute("UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            except (sqlite3.Error, OSError):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return CachedResponse(*row[:5], hits=row[5] + 1)
+
+    def put(self, key: str, response: str, provider: str, model: str, source: str) -> None:
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        if not response or size > self.max_bytes:
+            return
+        with self._lock:
+            try:
+                db = self._connect()
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                        (key, response, size, provider, model, source, now, now),
+                    )
+                    db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+                    total = db.execute("SELECT COALESCE(SUM(bytes), 0) FROM responses").fetchone()[0]
+                    if total > self.max_bytes:
+                        evict = []
+                        for old_key, old_size in db.execute("SELECT key, bytes FROM responses ORDER BY last_used"):
+                            if total <= self.max_bytes:
+                                break
+                            evict.append((old_key,))
+                            total -= old_size
+                        db.executemany("DELETE FROM responses WHERE key = ?", evict)
+            except (sqlite3.Error, OSError):
+                pass
+
+    def usage(self) -> tuple[int, int]:
+        """(entries, stored bytes)."""
+        with self._lock:
+            try:
+                row = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM responses").fetchone()
+            except (sqlite3.Error, OSError):
+                return 0, 0
+            return row[0], row[1]
+
+
+def response_cache_enabled() -> bool:
+    return os.getenv("PLAYGROUND_RESPONSE_CACHE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+@st.cache_resource
+def response_cache() -> ResponseCache:
+    return ResponseCache(RESPONSE_CACHE_PATH, RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_TTL_SECONDS)
+
+
+def build_system_prompt(skill: Skill) -> str:
     extra = ""
-    if skill["type"] == "interactive":
+    if skill.type == "interactive":
         extra = (
             "\n\nFacilitation rules:\n"
             "- Ask ONE question at a time with numbered options as the skill specifies.\n"
@@ -464,185 +1399,437 @@ def build_system_prompt(skill: dict) -> str:
             "- Be conversational but stay true to the skill's structure exactly.\n"
             "- Do not improvise beyond what the skill defines."
         )
-    return f"You are running the following PM skill for the user. Follow it exactly as written.\n\n{skill['body']}{extra}"
-
-
-FINDER_STOP_WORDS = {
-    "a",
-    "an",
-    "and",
-    "are",
-    "at",
-    "be",
-    "by",
-    "do",
-    "for",
-    "from",
-    "help",
-    "how",
-    "i",
-    "if",
-    "in",
-    "into",
-    "is",
-    "it",
-    "me",
-    "my",
-    "need",
-    "new",
-    "of",
-    "on",
-    "or",
-    "our",
-    "that",
-    "the",
-    "this",
-    "to",
-    "user",
-    "users",
-    "we",
-    "what",
-    "when",
-    "with",
+    return f"You are running the following PM skill for the user. Follow it exactly as written.\n\n{load_skill_content(skill).body}{extra}"
+
+
+def record_token_usage(usage: TokenUsage) -> None:
+    """Add one model call's usage to this session's tally (see `render_session`)."""
+    st.session_state.setdefault("token_usage", []).append(usage)
+
+
+def format_token_usage(usage: TokenUsage) -> str:
+    text = f"{usage.input_tokens:,} input tokens ({usage.cached_input_tokens:,} from prompt cache"
+    if usage.cache_write_tokens:
+        text += f", {usage.cache_write_tokens:,} written to it"
+    return text + f") · {usage.output_tokens:,} output"
+
+
+FINDER_RANKINGS = {
+    "weighted": {
+        "label": "Weighted fields",
+        "help": "Fixed points per field for phrase and word matches (default).",
+    },
+    "bm25f": {
+        "label": "BM25F",
+        "help": "Field-weighted BM25: rare words count more and long skill bodies are length-normalized.",
+    },
 }
+# optional: needs NumPy and the catalog/skills-semantic.npz artifact from generate-catalog.py
+if importlib.util.find_spec("numpy") is not None and SEMANTIC_INDEX_PATH.exists():
+    FINDER_RANKINGS["semantic"] = {
+        "label": "Semantic + keywords",
+        "help": "Adds skills on related topics (offline LSA model), fused with the weighted keyword ranking.",
+    }
+# optional: needs the catalog/skills-graph.json artifact from generate-catalog.py
+if SKILL_GRAPH_PATH.exists():
+    FINDER_RANKINGS["graph"] = {
+        "label": "Weighted + skill graph",
+        "help": "Weighted keyword scores; after the best match, skills linked to it in the skill graph come first.",
+    }
 
+# Semantic fusion: how many related skills to add, the similarity floor, and
+# the reciprocal-rank-fusion constant.
+SEMANTIC_TOP_K = 20
+SEMANTIC_MIN_SIMILARITY = 0.3
+RANK_FUSION_K = 60
 
-def normalize_text(value: str) -> str:
-    return re.sub(r"\s+", " ", (value or "").strip().lower())
+# Ranked result pages kept across reruns and sessions (see `finder_cache()`).
+FINDER_CACHE_SIZE = 256
+FINDER_PAGE_SIZE = 10
+# Search as you type: the typing pause before re-ranking. It needs `st.fragment`
+# and `st.text_input(live=...)`; older Streamlit keeps the Find Skills button.
+FINDER_LIVE_DEBOUNCE = "300ms"
+FINDER_LIVE_SUPPORTED = hasattr(st, "fragment") and "live" in inspect.signature(st.text_input).parameters
+# Query x skill cells per block in `rank_skills_for_queries` (8 MB per float64 matrix).
+FINDER_BATCH_CELLS = 1 << 20
 
 
-def tokenize_text(value: str) -> list[str]:
-    tokens: list[str] = []
-    for token in re.findall(r"[a-z0-9]+", normalize_text(value)):
-        if len(token) <= 1 or token in FINDER_STOP_WORDS:
-            continue
-        tokens.append(token)
-    return tokens
-
-
-def tokens_match(query_token: str, candidate_token: str) -> bool:
-    if query_token == candidate_token:
-        return True
-    if len(query_token) >= 4 and candidate_token.startswith(query_token):
-        return True
-    if len(candidate_token) >= 4 and query_token.startswith(candidate_token):
-        return True
-    if len(query_token) >= 5 and len(candidate_token) >= 5:
-        if query_token in candidate_token or candidate_token in query_token:
-            return True
-    return False
-
-
-def matched_query_tokens(query_tokens: list[str], text: str) -> list[str]:
-    text_tokens = tokenize_text(text)
-    matched: list[str] = []
-    for query_token in query_tokens:
-        if any(tokens_match(query_token, candidate) for candidate in text_tokens):
-            matched.append(query_token)
-    return matched
-
-
-def summarize_match_reasons(skill: dict, query_lc: str, query_tokens: list[str]) -> list[str]:
-    reasons: list[str] = []
-    fields = [
-        ("description", skill.get("description", "")),
-        ("best for", " ".join(skill.get("best_for") or [])),
-        ("scenarios", " ".join(skill.get("scenarios") or [])),
-        ("intent", skill.get("intent", "")),
-        ("purpose", skill.get("purpose_short", "")),
-    ]
-    for label, raw_text in fields:
-        normalized = normalize_text(raw_text)
-        if query_lc and query_lc in normalized:
-            reasons.append(label)
-            continue
-        if query_tokens and matched_query_tokens(query_tokens, raw_text):
-            reasons.append(label)
-    return reasons[:3]
+@dataclass(frozen=True)
+class FinderResults:
+    """One page of ranked skills and how many matched in total.
+
+    Each item is `{"skill", "score", "match", "reasons"}`; `offset` is the
+    rank of the first item, counting from zero. `corrections` maps each
+    misspelled query word to the indexed words searched in its place.
+    """
+
+    items: list[dict]
+    total: int
+    offset: int = 0
+    corrections: Mapping[str, tuple[str, ...]] = field(default_factory=dict)
 
 
 def rank_skills_for_query(
-    skills: list[dict],
+    library: SkillLibrary,
     query: str,
     type_filter: str = "Any",
     theme_filter: str = "Any",
-) -> list[dict]:
-    query_lc = normalize_text(query)
-    query_tokens = tokenize_text(query)
-    results: list[dict] = []
+    ranking: str = "weighted",
+    k: int | None = None,
+    offset: int = 0,
+    live: LiveSearch | None = None,
+) -> FinderResults:
+    """Score skills against a query with the library's `Finder`.
+
+    Only skills with a token hit or a phrase match in some field are scored,
+    so cost follows the number of matches rather than the library size.
+    `ranking` picks a scorer from FINDER_RANKINGS; "semantic" fuses the
+    weighted ranking with the offline topic model, and "graph" reorders the
+    weighted matches after the best one by the skill graph
+    (`SkillGraph.rerank`) without changing their scores.
+
+    Scoring produces plain tuples. Only the `k` results from `offset` on are
+    selected with a heap and built into result dicts with match reasons;
+    `k=None` returns every match.
+
+    `live` is a search-as-you-type session from `live_search()` for the same
+    filters and ranking. It narrows the previous keystroke's matches instead
+    of ranking from scratch, with the same results.
+    """
+    skills = library.skills
+    allowed = finder_allowed(library, type_filter, theme_filter)
+    if live is not None:
+        ranked = live.rank(query)
+    else:
+        ranked = library.finder.rank(query, allowed, ranking)
+    scored = ranked.scored
+    presorted = False
+    if ranking == "semantic" and normalize_text(query):
+        scored = fuse_semantic_ranking(library, query, scored, set(allowed))
+    elif ranking == "graph" and normalize_text(query):
+        graph = skill_graph()
+        if graph is not None:
+            scored, presorted = graph.rerank(scored), True
+
+    items = [
+        {
+            "skill": skills[i],
+            "score": -negated,
+            "match": match,
+            "reasons": match_reasons(ranked.fields_hit(i)),
+        }
+        for negated, _name, i, match in select_page(scored, k, offset, presorted)
+    ]
+    return FinderResults(
+        items=items, total=len(scored), offset=offset, corrections=MappingProxyType(ranked.corrections)
+    )
 
-    for skill in skills:
-        if type_filter != "Any" and skill["type"] != type_filter:
-            continue
-        if theme_filter != "Any" and skill.get("theme") != theme_filter:
-            continue
 
-        name_lc = normalize_text(skill.get("name", ""))
-        score = 0
-        match = "browse"
+def finder_allowed(library: SkillLibrary, type_filter: str, theme_filter: str) -> list[int]:
+    """Indices of the skills that pass the finder's type and theme filters."""
+    return [
+        i
+        for i, skill in enumerate(library.skills)
+        if (type_filter == "Any" or skill.type == type_filter)
+        and (theme_filter == "Any" or skill.theme == theme_filter)
+    ]
 
-        if not query_lc:
-            score = 50
-        elif name_lc == query_lc:
-            score = 400
-            match = "exact name"
-        else:
-            field_specs = [
-                ("name", skill.get("name", ""), 320, 120),
-                ("trigger metadata", skill.get("description", ""), 240, 45),
-                ("best for", " ".join(skill.get("best_for") or []), 220, 55),
-                ("scenarios", " ".join(skill.get("scenarios") or []), 220, 55),
-                ("intent", skill.get("intent", ""), 180, 30),
-                ("purpose", skill.get("purpose_short", ""), 140, 24),
-                ("skill body", skill.get("body", ""), 80, 8),
-            ]
 
-            best_label = ""
-            best_field_score = 0
-            matched_token_set: set[str] = set()
+@st.cache_resource(show_spinner=False)
+def semantic_model() -> SemanticIndex | None:
+    """The prebuilt semantic model, loaded once per process (None if unreadable)."""
+    return SemanticIndex.load(SEMANTIC_INDEX_PATH)
 
-            for label, text, phrase_bonus, token_weight in field_specs:
-                normalized_text = normalize_text(text)
-                field_score = 0
-                if query_lc and query_lc in normalized_text:
-                    field_score += phrase_bonus
 
-                token_hits = matched_query_tokens(query_tokens, text)
-                if token_hits:
-                    unique_hits = len(set(token_hits))
-                    field_score += unique_hits * token_weight
-                    matched_token_set.update(token_hits)
+@st.cache_resource(show_spinner=False)
+def skill_graph() -> SkillGraph | None:
+    """The prebuilt skill graph, loaded once per process (None if missing or unreadable)."""
+    return SkillGraph.load(SKILL_GRAPH_PATH)
 
-                if field_score > best_field_score:
-                    best_field_score = field_score
-                    best_label = label
 
-                score += field_score
+def fuse_semantic_ranking(
+    library: SkillLibrary, query: str, lexical: list[Ranked], allowed: set[int]
+) -> list[Ranked]:
+    """Reciprocal-rank fusion of the lexical results with the closest skills by topic.
 
-            if not score:
-                continue
+    Skills in the model but missing from the library (renamed or removed since
+    the catalog was generated) are skipped; new skills rank lexically only.
+    """
+    model = semantic_model()
+    similarity = model.score(query) if model else None
+    if similarity is None:
+        return lexical
+
+    positions = {skill.name: i for i, skill in enumerate(library.skills)}
+    related = []
+    for row in similarity.argsort()[::-1]:
+        if similarity[row] < SEMANTIC_MIN_SIMILARITY or len(related) == SEMANTIC_TOP_K:
+            break
+        i = positions.get(model.names[row])
+        if i is not None and i in allowed:
+            related.append(i)
 
-            if best_label:
-                match = best_label
+    fused: dict[int, list] = {}
+    for rank, (_negated, _name, i, match) in enumerate(sorted(lexical), start=1):
+        fused[i] = [1 / (RANK_FUSION_K + rank), match]
+    for rank, i in enumerate(related, start=1):
+        fused.setdefault(i, [0.0, "related topics"])[0] += 1 / (RANK_FUSION_K + rank)
+    return [(-score, library.skills[i].name, i, match) for i, (score, match) in fused.items()]
 
-            if query_tokens:
-                coverage = len(matched_token_set) / max(len(query_tokens), 1)
-                score += int(coverage * 100)
 
-            if len(query_tokens) >= 3 and len(matched_token_set) < 2:
+def rank_skills_for_queries(
+    library: SkillLibrary,
+    queries: Sequence[str],
+    type_filter: str = "Any",
+    theme_filter: str = "Any",
+    ranking: str = "weighted",
+    k: int | None = FINDER_PAGE_SIZE,
+) -> list[FinderResults]:
+    """Rank many queries at once, for offline audits over logged questions.
+
+    Each result equals `rank_skills_for_query(library, query, ..., k=k)`,
+    scores included. Every distinct query word is matched against the index
+    once for the whole batch, giving one sparse row of skill hits per field
+    (and of BM25F weights). A block of queries is then scored as a sparse
+    query x term matrix times those rows (`sparse_product`), and the scoring
+    rules run as array operations instead of a loop over skills. Phrase
+    matches and the skill-graph order are still applied per query. Needs
+    NumPy.
+    """
+    import numpy as np
+
+    skills = library.skills
+    width = len(skills)
+    finder = library.finder
+    graph = skill_graph() if ranking == "graph" else None
+    index = finder.index
+    allowed = np.array(
+        [
+            (type_filter == "Any" or skill.type == type_filter)
+            and (theme_filter == "Any" or skill.theme == theme_filter)
+            for skill in skills
+        ],
+        dtype=bool,
+    )
+    allowed_set = set(np.flatnonzero(allowed).tolist())
+    fields = [field for _label, field, _bonus, _weight, _reason in FINDER_FIELDS]
+    names_by_text: dict[str, list[int]] = {}
+    for i, skill in enumerate(skills):
+        names_by_text.setdefault(skill.search_text["name"], []).append(i)
+
+    def posting(documents: Collection[int] | Mapping[int, float]) -> tuple:
+        doc_ids = np.fromiter(documents, dtype=np.int64, count=len(documents))
+        if isinstance(documents, Mapping):
+            return doc_ids, np.fromiter(documents.values(), dtype=np.float64, count=len(documents))
+        return doc_ids, np.ones(len(documents))
+
+    # One posting per distinct query word: skills hit per field, in any field,
+    # and the word's BM25F contribution per skill.
+    term_rows: dict[str, int] = {}
+    field_postings: dict[str, list[tuple]] = {field: [] for field in fields}
+    any_postings: list[tuple] = []
+    bm25f_postings: list[tuple] = []
+    parsed = []
+    for query in queries:
+        query_tokens = tokenize_text(query)
+        rows: list[int] = []
+        corrections: dict[str, tuple[str, ...]] = {}
+        for query_token in dict.fromkeys(query_tokens):
+            terms = index.matching_tokens(query_token)
+            if not terms:
                 continue
+            substitutes = index.substitutions(query_token)
+            if substitutes:
+                corrections[query_token] = tuple(sorted(substitutes))
+            if query_token not in term_rows:
+                term_rows[query_token] = len(term_rows)
+                hit_any: set[int] = set()
+                for field in fields:
+                    documents = index.documents_with(field, terms)
+                    hit_any |= documents
+                    field_postings[field].append(posting(documents))
+                any_postings.append(posting(hit_any))
+                if ranking == "bm25f":
+                    bm25f_postings.append(posting(finder.bm25f.group_scores(terms)))
+            rows.append(term_rows[query_token])
+        parsed.append((query, normalize_text(query), query_tokens, rows, MappingProxyType(corrections)))
+
+    results: list[FinderResults] = []
+    block = max(1, FINDER_BATCH_CELLS // max(width, 1))
+    for start in range(0, len(parsed), block):
+        chunk = parsed[start:start + block]
+        rows = [entry[3] for entry in chunk]
+        covered = sparse_product(rows, any_postings, width)
+        hits = np.stack([sparse_product(rows, field_postings[field], width) for field in fields], axis=1)
+        bm25f = sparse_product(rows, bm25f_postings, width) if ranking == "bm25f" else None
+
+        for q, (query, query_lc, query_tokens, _rows, corrections) in enumerate(chunk):
+            phrases = np.zeros((len(fields), width), dtype=bool)
+            presorted = False
+            if not query_lc:
+                scored: list[Ranked] = [(-50, skills[i].name, i, "browse") for i in sorted(allowed_set)]
+                total = len(scored)
+            else:
+                exact = [i for i in names_by_text.get(query_lc, ()) if allowed[i]]
+                if ranking == "bm25f" and query_tokens:
+                    candidates = np.flatnonzero(allowed & (covered[q] > 0))
+                    found = batch_scores_bm25f(query_tokens, hits[q], covered[q], bm25f[q], candidates, exact)
+                else:
+                    for row, field in enumerate(fields):
+                        phrases[row, list(finder.phrase_matches(field, query_lc, allowed_set))] = True
+                    candidates = np.flatnonzero(allowed & ((covered[q] > 0) | phrases.any(axis=0)))
+                    found = batch_scores_weighted(query_tokens, hits[q], covered[q], phrases, candidates, exact)
+                if ranking == "semantic":
+                    scored = fuse_semantic_ranking(library, query, batch_ranked(library, *found), allowed_set)
+                    total = len(scored)
+                elif graph is not None:
+                    scored, presorted = graph.rerank(batch_ranked(library, *found)), True
+                    total = len(scored)
+                else:
+                    scored = batch_ranked(library, *found, limit=k)
+                    total = len(found[0])
+            items = [
+                {
+                    "skill": skills[i],
+                    "score": -negated,
+                    "match": match,
+                    "reasons": match_reasons(
+                        field for row, field in enumerate(fields) if hits[q, row, i] or phrases[row, i]
+                    ),
+                }
+                for negated, _name, i, match in select_page(scored, k, presorted=presorted)
+            ]
+            results.append(FinderResults(items=items, total=total, corrections=corrections))
+    return results
 
-        results.append(
-            {
-                "skill": skill,
-                "score": score,
-                "match": match,
-                "reasons": summarize_match_reasons(skill, query_lc, query_tokens),
-            }
-        )
 
-    results.sort(key=lambda item: (-item["score"], item["skill"]["name"]))
-    return results
+def batch_scores_weighted(query_tokens, hits, covered, phrases, candidates, exact) -> tuple:
+    """`Finder.score_weighted` for one query of a batch: (candidates, scores, match labels)."""
+    import numpy as np
+
+    bonuses = np.array([bonus for _label, _field, bonus, _weight, _reason in FINDER_FIELDS], dtype=float)
+    weights = np.array([weight for _label, _field, _bonus, weight, _reason in FINDER_FIELDS], dtype=float)
+    labels = np.array([label for label, _field, _bonus, _weight, _reason in FINDER_FIELDS], dtype=object)
+    field_scores = hits[:, candidates] * weights[:, None] + phrases[:, candidates] * bonuses[:, None]
+    scores = field_scores.sum(axis=0)
+    matches = labels[field_scores.argmax(axis=0)]
+    if query_tokens:
+        scores += np.trunc(covered[candidates] / max(len(query_tokens), 1) * 100)
+    keep = scores > 0
+    if len(query_tokens) >= 3:
+        keep &= covered[candidates] >= 2
+    is_exact = np.isin(candidates, exact)
+    scores[is_exact] = 400
+    matches[is_exact] = "exact name"
+    keep |= is_exact
+    return candidates[keep], scores[keep].astype(np.int64), matches[keep]
+
+
+def batch_scores_bm25f(query_tokens, hits, covered, bm25f, candidates, exact) -> tuple:
+    """`Finder.score_bm25f` for one query of a batch: (candidates, scores, match labels)."""
+    import numpy as np
+
+    labels = np.array([label for label, _field, _bonus, _weight, _reason in FINDER_FIELDS], dtype=object)
+    candidates = candidates[bm25f[candidates] > 0]
+    scores = bm25f[candidates]
+    top_score = scores.max() if len(scores) else 0.0
+    matches = labels[(hits[:, candidates] > 0).argmax(axis=0)]
+    keep = np.ones(len(candidates), dtype=bool)
+    if len(query_tokens) >= 3:
+        keep = covered[candidates] >= 2
+    is_exact = np.isin(candidates, exact)
+    scores[is_exact] = top_score + 1
+    matches[is_exact] = "exact name"
+    keep |= is_exact
+    return candidates[keep], scores[keep], matches[keep]
+
+
+def batch_ranked(library: SkillLibrary, candidates, scores, matches, limit: int | None = None) -> list[Ranked]:
+    """Ranked tuples for batch-scored candidates.
+
+    With a `limit`, only candidates scoring at least the limit-th best score
+    (ties included) become tuples, which is all `select_page` can pick from.
+    """
+    positions = range(len(candidates))
+    if limit is not None and len(candidates) > limit:
+        if not limit:
+            return []
+        ordered = scores.copy()
+        ordered.partition(len(scores) - limit)
+        positions = (scores >= ordered[len(scores) - limit]).nonzero()[0]
+    return [
+        (-scores[j].item(), library.skills[candidates[j]].name, candidates[j].item(), matches[j])
+        for j in positions
+    ]
+
+
+class FinderCache:
+    """Bounded LRU of ranked results, shared by every session.
+
+    Keys are (normalized query, type filter, theme filter, ranking, page
+    size, offset, library version), so each page is ranked and cached on its
+    own. The first lookup against a newly published library drops every
+    entry, so results never outlive the snapshot they were ranked from.
+    Cached pages are shared; callers must not mutate them.
+    """
+
+    def __init__(self, max_entries: int = FINDER_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self.entries: OrderedDict[tuple, FinderResults] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._library: SkillLibrary | None = None
+        self._lock = threading.Lock()
+
+    def rank(
+        self,
+        library: SkillLibrary,
+        query: str,
+        type_filter: str = "Any",
+        theme_filter: str = "Any",
+        ranking: str = "weighted",
+        k: int | None = None,
+        offset: int = 0,
+    ) -> FinderResults:
+        key = (normalize_text(query), type_filter, theme_filter, ranking, k, offset, library.version)
+        with self._lock:
+            if self._library is not library:
+                self.entries.clear()
+                self._library = library
+            results = self.entries.get(key)
+            if results is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return results
+            self.misses += 1
+
+        results = rank_skills_for_query(library, query, type_filter, theme_filter, ranking, k, offset)
+        with self._lock:
+            if self._library is library:
+                self.entries[key] = results
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        return results
+
+
+@st.cache_resource
+def finder_cache() -> FinderCache:
+    return FinderCache()
+
+
+def live_search(library: SkillLibrary, type_filter: str, theme_filter: str, ranking: str) -> LiveSearch:
+    """This session's search-as-you-type state.
+
+    Kept in session state rather than `finder_cache()` because it follows one
+    person's keystrokes; a new library, filter, or ranking starts a new one.
+    """
+    key = (type_filter, theme_filter, ranking)
+    live = st.session_state.get("finder_live_search")
+    if live is None or live.finder is not library.finder or st.session_state.get("finder_live_key") != key:
+        live = LiveSearch(library.finder, finder_allowed(library, type_filter, theme_filter), ranking)
+        st.session_state["finder_live_search"] = live
+        st.session_state["finder_live_key"] = key
+    return live
 
 
 # ─── State Helpers ─────────────────────────────────────────────────────────────
@@ -656,12 +1843,14 @@ def nav(view: str, **kwargs):
         st.session_state.messages = []
         st.session_state.phase = 0
         st.session_state.workflow_outputs = {}
+        st.session_state.token_usage = []
         st.session_state.scenario = st.session_state.get("scenario_input", "")
-    elif "scenario" in kwargs or "skill" in kwargs:
+    elif "scenario" in kwargs or "skill_name" in kwargs:
         # Fresh session starts should not carry prior workflow/chat artifacts.
         st.session_state.messages = []
         st.session_state.phase = 0
         st.session_state.workflow_outputs = {}
+        st.session_state.token_usage = []
     st.rerun()
 
 
@@ -670,6 +1859,10 @@ def queue_finder_reset():
     st.session_state["finder_reset_requested"] = True
 
 
+def set_finder_page(page: int):
+    st.session_state["finder_page"] = page
+
+
 def detect_progress(messages: list) -> tuple[int | None, int | None]:
     """Parse Q1/3-style progress labels from the most recent assistant message."""
     for msg in reversed(messages):
@@ -686,24 +1879,21 @@ def detect_progress(messages: list) -> tuple[int | None, int | None]:
     return None, None
 
 
-def extract_workflow_phases(app_text: str) -> list[dict[str, str]]:
-    """Extract phase headings and their bodies from a workflow Application section."""
-    phase_re = re.compile(r"(?m)^#{2,3}\s+(Phase\s+\d+[^\n#]*)\s*$")
-    matches = list(phase_re.finditer(app_text))
-    if not matches:
-        return [{"name": "Full workflow", "body": app_text.strip()}]
+def extract_workflow_phases(content: SkillContent) -> list[dict[str, str]]:
+    """Extract workflow phases from the skill's section outline.
 
-    phases: list[dict[str, str]] = []
-    for i, match in enumerate(matches):
-        start = match.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(app_text)
-        phases.append(
-            {
-                "name": match.group(1).strip(),
-                "body": app_text[start:end].strip(),
-            }
-        )
-    return phases
+    Skills either use `## Phase N` sections or `### Phase N` headings under
+    `## Application`; anything else runs as one "Full workflow" phase.
+    """
+    phase_re = re.compile(r"^Phase\s+\d+")
+    candidates = [section for section in content.outline if phase_re.match(section.heading)]
+    if not candidates:
+        application = content.sections.section("Application")
+        if application is not None:
+            candidates = [child for child in application.children if phase_re.match(child.heading)]
+    if not candidates:
+        return [{"name": "Full workflow", "body": content.sections.get("Application", "")}]
+    return [{"name": section.heading, "body": section.text(content.body)} for section in candidates]
 
 
 def build_phase_prompt(
@@ -725,7 +1915,7 @@ def build_phase_prompt(
 
 # ─── Sidebar ──────────────────────────────────────────────────────────────────
 
-def render_sidebar(skill: dict | None = None):
+def render_sidebar(skill: Skill | None = None):
     with st.sidebar:
         st.markdown("## 🧰 PM Skills Playground (beta)")
 
@@ -813,15 +2003,15 @@ def render_sidebar(skill: dict | None = None):
 
         # During a session: show bail options prominently
         if skill and st.session_state.get("view") == "session":
-            icon, type_label = TYPE_BADGES.get(skill["type"], ("", "Skill"))
-            st.markdown(f"**{icon} {skill['name']}**")
+            icon, type_label = TYPE_BADGES.get(skill.type, ("", "Skill"))
+            st.markdown(f"**{icon} {skill.name}**")
             st.caption(f"{type_label} skill")
-            if skill.get("estimated_time"):
-                st.caption(f"⏱ {skill['estimated_time']}")
+            if skill.estimated_time:
+                st.caption(f"⏱ {skill.estimated_time}")
             st.divider()
             st.caption("Navigation")
             if st.button("↩ Start over", use_container_width=True):
-                nav("skill", skill=skill, theme=st.session_state.get("theme"))
+                nav("skill", skill_name=skill.name, theme=st.session_state.get("theme"))
             if st.button("← Different skill", use_container_width=True):
                 theme = st.session_state.get("theme")
                 if theme:
@@ -888,7 +2078,7 @@ def render_home():
                 nav("run_home")
 
 
-def render_learn_home(skills: list):
+def render_learn_home(skills: Sequence[Skill]):
     st.title("📚 Learn PM Skills")
     st.markdown(
         "Start with onboarding docs, then open a platform-specific guide. "
@@ -913,7 +2103,7 @@ def render_learn_home(skills: list):
         "Pick one starter skill and run it now. This keeps learning tied to real output."
     )
     run_cols = st.columns(3)
-    skills_by_name = {s["name"]: s for s in skills}
+    skills_by_name = {s.name: s for s in skills}
     for i, (skill_name, label) in enumerate(LEARN_TO_RUN_SKILLS):
         skill = skills_by_name.get(skill_name)
         if not skill:
@@ -923,7 +2113,7 @@ def render_learn_home(skills: list):
                 st.markdown(f"**{skill_name}**")
                 st.caption(f"{label} starter")
                 if st.button("Run this skill →", key=f"learn_run_{skill_name}", use_container_width=True):
-                    nav("skill", skill=skill, theme=skill.get("theme"))
+                    nav("skill", skill_name=skill.name, theme=skill.theme)
 
 
 def render_learn_doc():
@@ -942,7 +2132,7 @@ def render_learn_doc():
         st.title(guide["title"])
         st.caption(str(guide["path"].relative_to(ROOT_DIR)))
 
-    content = load_guide_markdown(str(guide["path"]))
+    content = load_guide_markdown(guide["path"])
     st.markdown(content)
 
     st.divider()
@@ -950,18 +2140,25 @@ def render_learn_doc():
         nav("run_home")
 
 
-def render_find_home(skills: list):
+def render_find_home(library: SkillLibrary):
+    skills = library.skills
     if st.session_state.get("finder_reset_requested"):
         st.session_state["finder_query_input"] = ""
         st.session_state["finder_last_query"] = ""
         st.session_state["finder_type_filter"] = "Any"
         st.session_state["finder_theme_filter"] = "Any"
         st.session_state["finder_reset_requested"] = False
+    live = FINDER_LIVE_SUPPORTED and st.session_state.get("finder_live", True)
 
     st.title("🧭 Find My Skill")
-    st.markdown(
-        "Describe the job you need done, click **Find Skills**, and the app will recommend the best-fit PM skills."
-    )
+    if live:
+        st.markdown(
+            "Describe the job you need done, and the app will recommend the best-fit PM skills as you type."
+        )
+    else:
+        st.markdown(
+            "Describe the job you need done, click **Find Skills**, and the app will recommend the best-fit PM skills."
+        )
     st.caption("You do not need to know the skill name. Start with plain English like “Help me create a PRD” or “I need to prioritize roadmap bets.”")
     st.info(
         "Finder results are local and instant. The app only calls an API after you choose **Run This Skill** or start a skill session."
@@ -970,7 +2167,7 @@ def render_find_home(skills: list):
     steps = st.columns(3)
     step_copy = [
         ("1", "Describe your situation"),
-        ("2", "Click Find Skills"),
+        ("2", "Watch the matches update" if live else "Click Find Skills"),
         ("3", "Preview or run the best match"),
     ]
     for col, (step_num, step_text) in zip(steps, step_copy):
@@ -989,6 +2186,17 @@ def render_find_home(skills: list):
                     st.rerun()
 
     st.divider()
+    if FINDER_LIVE_SUPPORTED:
+        st.toggle(
+            "Search as you type",
+            key="finder_live",
+            help="Update the matches after each pause in typing instead of waiting for **Find Skills**.",
+        )
+    theme_options = ["Any"] + [slug for slug in THEMES if any(s.theme == slug for s in skills)]
+    if live:
+        render_finder_live(library, theme_options)
+        return
+
     with st.form("finder_form", clear_on_submit=False):
         form_col, filter_col = st.columns([3, 2])
         with form_col:
@@ -1002,20 +2210,7 @@ def render_find_home(skills: list):
             ).strip()
             st.caption("Tip: write the situation the way you would ask a teammate.")
         with filter_col:
-            type_filter = st.selectbox(
-                "Skill type",
-                options=["Any", "component", "interactive", "workflow"],
-                key="finder_type_filter",
-            )
-            theme_options = ["Any"] + [
-                slug for slug in THEMES if any(s.get("theme") == slug for s in skills)
-            ]
-            theme_filter = st.selectbox(
-                "Theme",
-                options=theme_options,
-                format_func=lambda value: "Any" if value == "Any" else THEMES[value]["label"],
-                key="finder_theme_filter",
-            )
+            type_filter, theme_filter, ranking = render_finder_filters(theme_options)
 
         action_cols = st.columns([1, 1, 4])
         with action_cols[0]:
@@ -1041,68 +2236,203 @@ def render_find_home(skills: list):
     if not active_query:
         st.info("Enter your situation above, then click **Find Skills**.")
         return
+    render_finder_results(library, active_query, query, type_filter, theme_filter, ranking)
 
-    results = rank_skills_for_query(skills, active_query, type_filter, theme_filter)
+
+def render_finder_filters(theme_options: list[str]) -> tuple[str, str, str]:
+    """Type, theme, and ranking selectors; returns (type filter, theme filter, ranking)."""
+    type_filter = st.selectbox(
+        "Skill type",
+        options=["Any", "component", "interactive", "workflow"],
+        key="finder_type_filter",
+    )
+    theme_filter = st.selectbox(
+        "Theme",
+        options=theme_options,
+        format_func=lambda value: "Any" if value == "Any" else THEMES[value]["label"],
+        key="finder_theme_filter",
+    )
+    ranking = st.selectbox(
+        "Ranking",
+        options=list(FINDER_RANKINGS),
+        format_func=lambda value: FINDER_RANKINGS[value]["label"],
+        key="finder_ranking",
+        help=" ".join(f"{r['label']}: {r['help']}" for r in FINDER_RANKINGS.values()),
+    )
+    return type_filter, theme_filter, ranking
+
+
+def render_finder_live(library: SkillLibrary, theme_options: list[str]):
+    """Query box, filters, and matches, re-ranked after each pause in typing.
+
+    Runs as a fragment, so a keystroke reruns only this part of the page, and
+    ranks through `live_search()`, which narrows the previous keystroke's
+    matches instead of starting over.
+    """
+    query_col, filter_col = st.columns([3, 2])
+    with query_col:
+        query = st.text_input(
+            "What are you trying to do?",
+            placeholder="Example: Help me create a PRD from discovery notes for a new onboarding improvement.",
+            key="finder_query_input",
+            live=FINDER_LIVE_DEBOUNCE,
+        ).strip()
+        st.caption("Tip: write the situation the way you would ask a teammate.")
+        if st.button("Clear", key="finder_live_clear"):
+            queue_finder_reset()
+            st.rerun()
+    with filter_col:
+        type_filter, theme_filter, ranking = render_finder_filters(theme_options)
+
+    st.session_state["finder_last_query"] = query
+    if not query:
+        st.info("Start describing your situation above; matches appear as you type.")
+        return
+    live = live_search(library, type_filter, theme_filter, ranking)
+    render_finder_results(library, query, query, type_filter, theme_filter, ranking, live)
+
+
+if FINDER_LIVE_SUPPORTED:
+    render_finder_live = st.fragment(render_finder_live)
+
+
+def render_finder_results(
+    library: SkillLibrary,
+    active_query: str,
+    query: str,
+    type_filter: str,
+    theme_filter: str,
+    ranking: str,
+    live: LiveSearch | None = None,
+):
+    """The recommended skill and a page of other matches for `active_query`.
+
+    `query` is the text in the query box, which seeds a skill session. With
+    `live`, pages are ranked through that search-as-you-type session instead
+    of the shared `finder_cache()`.
+    """
+    # A new query, filter, or ranking starts again from the first page.
+    page_signature = (active_query, type_filter, theme_filter, ranking)
+    if st.session_state.get("finder_page_signature") != page_signature:
+        st.session_state["finder_page_signature"] = page_signature
+        st.session_state["finder_page"] = 0
+    page = st.session_state["finder_page"]
+    if live is not None:
+        results = rank_skills_for_query(
+            library, active_query, type_filter, theme_filter, ranking,
+            k=FINDER_PAGE_SIZE, offset=page * FINDER_PAGE_SIZE, live=live,
+        )
+    else:
+        results = finder_cache().rank(
+            library, active_query, type_filter, theme_filter, ranking,
+            k=FINDER_PAGE_SIZE, offset=page * FINDER_PAGE_SIZE,
+        )
     st.markdown(f"### Best Matches for “{active_query}”")
-    st.caption(f"{len(results)} matching skills")
+    st.caption(f"{results.total} matching skills")
+    if results.corrections:
+        st.caption(
+            "Also searched close spellings: "
+            + "; ".join(f"“{typo}” → {', '.join(words)}" for typo, words in results.corrections.items())
+        )
 
-    if not results:
+    if not results.total:
         st.warning("No matching skills found yet. Try simpler phrasing or remove a filter.")
         return
 
-    top = results[0]
+    if page > 0:
+        st.markdown(f"### More Matches (page {page + 1})")
+        render_finder_result_list(results.items, query)
+        render_finder_pager(results)
+        return
+
+    top = results.items[0]
     top_skill = top["skill"]
-    top_icon, top_type_label = TYPE_BADGES.get(top_skill["type"], ("", "Skill"))
+    top_icon, top_type_label = TYPE_BADGES.get(top_skill.type, ("", "Skill"))
     with st.container(border=True):
         st.markdown("#### Recommended First")
-        st.markdown(f"**{top_icon} {top_skill['name']}**")
+        st.markdown(f"**{top_icon} {top_skill.name}**")
         st.caption(f"{top_type_label} skill")
-        st.markdown(top_skill["description"])
+        st.markdown(top_skill.description)
         why_text = ", ".join(top["reasons"]) if top["reasons"] else top["match"]
         st.caption(f"Why this is a good fit: matched on {why_text}.")
-        if top_skill.get("best_for"):
+        if top_skill.best_for:
             st.markdown("**Best for**")
-            for bf in top_skill["best_for"][:3]:
+            for bf in top_skill.best_for[:3]:
                 st.markdown(f"- {bf}")
         top_actions = st.columns(2)
         with top_actions[0]:
-            if st.button("Preview This Skill", key=f"finder_top_preview_{top_skill['name']}", type="primary", use_container_width=True):
-                nav("skill", skill=top_skill, theme=top_skill.get("theme"))
+            if st.button("Preview This Skill", key=f"finder_top_preview_{top_skill.name}", type="primary", use_container_width=True):
+                nav("skill", skill_name=top_skill.name, theme=top_skill.theme)
         with top_actions[1]:
-            if st.button("Run This Skill", key=f"finder_top_run_{top_skill['name']}", use_container_width=True):
-                seed_scenario = active_query or (top_skill.get("scenarios") or [""])[0]
-                nav("session", skill=top_skill, theme=top_skill.get("theme"), scenario=seed_scenario)
-        st.caption("Running a skill sends your scenario to the selected model and will show a spinner on the next screen.")
+            if st.button("Run This Skill", key=f"finder_top_run_{top_skill.name}", use_container_width=True):
+                seed_scenario = active_query or (top_skill.scenarios or ("",))[0]
+                nav("session", skill_name=top_skill.name, theme=top_skill.theme, scenario=seed_scenario)
+        st.caption("Running a skill sends your scenario to the selected model; its reply streams in on the next screen.")
 
-    if len(results) > 1:
+    if len(results.items) > 1:
         st.markdown("### Other Good Options")
+    render_finder_result_list(results.items[1:], query)
+    render_finder_pager(results)
 
-    for item in results[1:10]:
+
+def render_finder_result_list(items: list[dict], query: str):
+    for item in items:
         skill = item["skill"]
-        icon, type_label = TYPE_BADGES.get(skill["type"], ("", "Skill"))
+        icon, type_label = TYPE_BADGES.get(skill.type, ("", "Skill"))
         with st.container(border=True):
             c1, c2 = st.columns([4, 1])
             with c1:
-                st.markdown(f"**{icon} {skill['name']}**")
-                st.caption(skill["description"])
+                st.markdown(f"**{icon} {skill.name}**")
+                st.caption(skill.description)
                 if item["reasons"]:
                     st.caption(
                         "Why this matches: " + ", ".join(item["reasons"]) + "."
                     )
                 else:
                     st.caption(f"Why this matches: {item['match']}.")
-                if skill.get("best_for"):
-                    for bf in skill["best_for"][:3]:
+                if skill.best_for:
+                    for bf in skill.best_for[:3]:
                         st.markdown(f"- {bf}")
-                elif skill.get("purpose_short"):
-                    st.caption(skill["purpose_short"][:220])
+                elif skill.purpose_short:
+                    st.caption(skill.purpose_short[:220])
             with c2:
                 st.caption(f"{type_label} skill")
-                if st.button("Preview →", key=f"finder_preview_{skill['name']}", use_container_width=True):
-                    nav("skill", skill=skill, theme=skill.get("theme"))
-                if st.button("Run →", key=f"finder_run_{skill['name']}", use_container_width=True):
-                    seed_scenario = query or (skill.get("scenarios") or [""])[0]
-                    nav("session", skill=skill, theme=skill.get("theme"), scenario=seed_scenario)
+                if st.button("Preview →", key=f"finder_preview_{skill.name}", use_container_width=True):
+                    nav("skill", skill_name=skill.name, theme=skill.theme)
+                if st.button("Run →", key=f"finder_run_{skill.name}", use_container_width=True):
+                    seed_scenario = query or (skill.scenarios or ("",))[0]
+                    nav("session", skill_name=skill.name, theme=skill.theme, scenario=seed_scenario)
+
+
+def render_finder_pager(results: FinderResults):
+    """Previous/next controls; each page is ranked on demand."""
+    if results.total <= FINDER_PAGE_SIZE:
+        return
+    page = results.offset // FINDER_PAGE_SIZE
+    last_page = (results.total - 1) // FINDER_PAGE_SIZE
+    prev_col, info_col, next_col = st.columns([1, 2, 1])
+    with prev_col:
+        st.button(
+            "← Previous",
+            key="finder_page_prev",
+            disabled=page == 0,
+            use_container_width=True,
+            on_click=set_finder_page,
+            args=(page - 1,),
+        )
+    with info_col:
+        st.caption(
+            f"Showing {results.offset + 1}–{results.offset + len(results.items)} of {results.total}"
+        )
+    with next_col:
+        st.button(
+            "Next →",
+            key="finder_page_next",
+            disabled=page >= last_page,
+            use_container_width=True,
+            on_click=set_finder_page,
+            args=(page + 1,),
+        )
 
 
 # ─── Screen: Run Home ─────────────────────────────────────────────────────────
@@ -1115,19 +2445,19 @@ GLOBAL_CONTEXT_PRESETS = [
 ]
 
 
-def build_learning_simulator_system_prompt(skill: dict) -> str:
+def build_learning_simulator_system_prompt(skill: Skill) -> str:
     return (
         "You are a PM Skills learning simulator.\n"
         "Run the skill end-to-end internally using the provided context.\n"
         "Do not ask follow-up questions.\n"
         "Make explicit assumptions when needed.\n\n"
-        f"Skill definition:\n\n{skill['body']}"
+        f"Skill definition:\n\n{load_skill_content(skill).body}"
     )
 
 
-def build_learning_simulator_user_prompt(skill: dict, context: str) -> str:
+def build_learning_simulator_user_prompt(skill: Skill, context: str) -> str:
     return (
-        f"Skill: {skill['name']} ({skill['type']})\n\n"
+        f"Skill: {skill.name} ({skill.type})\n\n"
         f"Context:\n{context}\n\n"
         "Run through the skill steps as a worked example and return markdown with exactly these H2 sections in this order:\n"
         "## Filled Template / Form\n"
@@ -1142,27 +2472,16 @@ def build_learning_simulator_user_prompt(skill: dict, context: str) -> str:
     )
 
 
-def parse_h2_sections(markdown_text: str) -> dict[str, str]:
-    lines = markdown_text.splitlines()
-    sections: dict[str, list[str]] = {}
-    current = "__full__"
-    sections[current] = []
-
-    for line in lines:
-        if line.startswith("## "):
-            current = line[3:].strip().lower()
-            sections[current] = []
-            continue
-        sections.setdefault(current, []).append(line)
-
-    return {k: "\n".join(v).strip() for k, v in sections.items()}
+def parse_h2_sections(markdown_text: str) -> Mapping[str, str]:
+    """Map lowercased `##` headings in model output to their content."""
+    return SectionMap(markdown_text, split_sections(markdown_text, max_level=2), key=str.lower)
 
 
-def render_run_theme_browser(skills: list):
+def render_run_theme_browser(skills: Sequence[Skill]):
     # Group skills by theme
     theme_skills: dict[str, list] = {}
     for s in skills:
-        key = s.get("theme") or "_unthemed"
+        key = s.theme or "_unthemed"
         theme_skills.setdefault(key, []).append(s)
 
     cols = st.columns(3)
@@ -1170,7 +2489,7 @@ def render_run_theme_browser(skills: list):
         skill_list = theme_skills.get(slug, [])
         type_counts: dict[str, int] = {}
         for s in skill_list:
-            type_counts[s["type"]] = type_counts.get(s["type"], 0) + 1
+            type_counts[s.type] = type_counts.get(s.type, 0) + 1
         count_str = "  ·  ".join(
             f"{v} {k}" for k, v in sorted(type_counts.items())
         )
@@ -1188,19 +2507,19 @@ def render_run_theme_browser(skills: list):
     if unthemed:
         st.divider()
         with st.expander(f"All other skills ({len(unthemed)} without theme tag)"):
-            for s in sorted(unthemed, key=lambda x: x["name"]):
-                icon, label = TYPE_BADGES.get(s["type"], ("", "Skill"))
+            for s in sorted(unthemed, key=lambda x: x.name):
+                icon, label = TYPE_BADGES.get(s.type, ("", "Skill"))
                 c1, c2 = st.columns([4, 1])
                 with c1:
-                    st.markdown(f"**{s['name']}** · {icon} {label}")
-                    desc = s["description"]
+                    st.markdown(f"**{s.name}** · {icon} {label}")
+                    desc = s.description
                     st.caption(desc[:120] + "…" if len(desc) > 120 else desc)
                 with c2:
-                    if st.button("Try →", key=f"unthemed_{s['name']}"):
-                        nav("skill", skill=s, theme=None)
+                    if st.button("Try →", key=f"unthemed_{s.name}"):
+                        nav("skill", skill_name=s.name, theme=None)
 
 
-def render_run_home(skills: list):
+def render_run_home(skills: Sequence[Skill]):
     st.title("🧪 Run Skills (Learning Simulator)")
     st.markdown(
         "Paste your context, click **Run the Skill Steps**, and get a worked example with a filled output and a step-by-step transformation walkthrough."
@@ -1213,8 +2532,8 @@ def render_run_home(skills: list):
             "`ANTHROPIC_API_KEY`, `OPENAI_API_KEY`, or `OLLAMA_ENABLED=1` with `OLLAMA_BASE_URL`."
         )
 
-    skills_sorted = sorted(skills, key=lambda s: s["name"])
-    skills_by_name = {s["name"]: s for s in skills_sorted}
+    skills_sorted = sorted(skills, key=lambda s: s.name)
+    skills_by_name = {s.name: s for s in skills_sorted}
     skill_names = list(skills_by_name.keys())
 
     if not skill_names:
@@ -1233,8 +2552,8 @@ def render_run_home(skills: list):
         key="runner_skill_name",
     )
     selected_skill = skills_by_name[selected_skill_name]
-    type_icon, type_label = TYPE_BADGES.get(selected_skill["type"], ("", "Skill"))
-    st.caption(f"{type_icon} {type_label} · {selected_skill['description']}")
+    type_icon, type_label = TYPE_BADGES.get(selected_skill.type, ("", "Skill"))
+    st.caption(f"{type_icon} {type_label} · {selected_skill.description}")
 
     context_mode = st.radio(
         "2) Pick context source",
@@ -1243,7 +2562,7 @@ def render_run_home(skills: list):
         key="runner_context_mode",
     )
 
-    quick_contexts = list(dict.fromkeys((selected_skill.get("scenarios") or []) + GLOBAL_CONTEXT_PRESETS))
+    quick_contexts = list(dict.fromkeys(selected_skill.scenarios + tuple(GLOBAL_CONTEXT_PRESETS)))
     if context_mode == "Choose a quick context":
         if st.session_state.get("runner_context_preset") not in quick_contexts:
             st.session_state["runner_context_preset"] = quick_contexts[0]
@@ -1266,6 +2585,12 @@ def render_run_home(skills: list):
 
     run_disabled = not selected_context or not providers
     run_label = f"Run the Skill Steps ({selected_skill_name})"
+    use_cache = response_cache_enabled() and st.checkbox(
+        "Use cached responses",
+        value=True,
+        key="runner_use_cache",
+        help="Answer a run identical to an earlier one from the local response cache. Untick to call the model again.",
+    )
     if st.button(run_label, type="primary", use_container_width=True, disabled=run_disabled):
         provider = st.session_state.get("selected_provider", providers[0])
         if provider not in providers:
@@ -1282,30 +2607,36 @@ def render_run_home(skills: list):
         system = build_learning_simulator_system_prompt(selected_skill)
         prompt = build_learning_simulator_user_prompt(selected_skill, selected_context)
 
-        with st.spinner("Running skill steps..."):
+        messages = [{"role": "user", "content": prompt}]
+        cache = response_cache() if response_cache_enabled() else None
+        cache_key = ResponseCache.key(provider, model, system, messages, MODEL_MAX_TOKENS)
+        cached = cache.get(cache_key) if cache is not None and use_cache else None
+        usage: list[TokenUsage] = []
+        if cached is not None:
+            response = cached.response
+        else:
             try:
-                response = call_model(
-                    provider,
-                    api_key,
-                    model,
-                    system,
-                    [{"role": "user", "content": prompt}],
-                )
-                st.session_state["runner_result"] = {
-                    "skill_name": selected_skill_name,
-                    "skill_type": selected_skill["type"],
-                    "provider": PROVIDERS[provider]["label"],
-                    "model": model,
-                    "context": selected_context,
-                    "response": response,
-                }
-                st.rerun()
+                with st.container(border=True):
+                    response = st.write_stream(stream_model(provider, api_key, model, system, messages, usage.append))
             except Exception as e:
                 if is_auth_error(e):
                     st.error(f"Invalid {PROVIDERS[provider]['label']} API key. Check your environment configuration.")
                     return
                 st.error(f"API error: {e}")
                 return
+            if cache is not None:
+                cache.put(cache_key, response, provider, model, f"learning simulator: {selected_skill_name}")
+        st.session_state["runner_result"] = {
+            "skill_name": selected_skill_name,
+            "skill_type": selected_skill.type,
+            "provider": PROVIDERS[provider]["label"],
+            "model": model,
+            "context": selected_context,
+            "response": response,
+            "cached": cached,
+            "usage": usage[-1] if usage else None,
+        }
+        st.rerun()
 
     result = st.session_state.get("runner_result")
     if result:
@@ -1314,6 +2645,15 @@ def render_run_home(skills: list):
         st.caption(
             f"Provider: {result['provider']} · Model: {result['model']} · Skill type: {result['skill_type']}"
         )
+        if result.get("usage") is not None:
+            st.caption(f"Tokens: {format_token_usage(result['usage'])}")
+        cached = result.get("cached")
+        if cached is not None:
+            saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(cached.created))
+            st.caption(
+                f"⚡ Cached response, saved {saved} and served {cached.hits} time{'s' if cached.hits != 1 else ''}; "
+                "no model call was made. Untick **Use cached responses** to run it fresh."
+            )
         if st.button("Clear worked example", use_container_width=False):
             st.session_state["runner_result"] = None
             st.rerun()
@@ -1351,7 +2691,7 @@ def render_run_home(skills: list):
 
 # ─── Screen: Theme ────────────────────────────────────────────────────────────
 
-def render_theme(skills: list, theme_slug: str):
+def render_theme(skills: Sequence[Skill], theme_slug: str):
     meta = THEMES.get(theme_slug, {"label": theme_slug, "icon": "📦", "description": ""})
 
     if st.button("← Back to themes"):
@@ -1361,45 +2701,45 @@ def render_theme(skills: list, theme_slug: str):
     st.markdown(meta["description"])
     st.divider()
 
-    theme_skills = [s for s in skills if s.get("theme") == theme_slug]
+    theme_skills = [s for s in skills if s.theme == theme_slug]
 
     if not theme_skills:
         st.info("No skills tagged with this theme yet — check back soon.")
         return
 
-    for s in sorted(theme_skills, key=lambda x: x["name"]):
-        icon, type_label = TYPE_BADGES.get(s["type"], ("", "Skill"))
+    for s in sorted(theme_skills, key=lambda x: x.name):
+        icon, type_label = TYPE_BADGES.get(s.type, ("", "Skill"))
         with st.container(border=True):
             c1, c2 = st.columns([4, 1])
             with c1:
-                st.markdown(f"**{icon} {s['name']}**")
-                desc = s["description"]
+                st.markdown(f"**{icon} {s.name}**")
+                desc = s.description
                 st.caption(desc[:150] + "…" if len(desc) > 150 else desc)
 
-                if s.get("best_for"):
-                    for bf in s["best_for"][:3]:
+                if s.best_for:
+                    for bf in s.best_for[:3]:
                         st.markdown(f"- {bf}")
-                elif s.get("purpose_short"):
-                    st.caption(s["purpose_short"][:220])
+                elif s.purpose_short:
+                    st.caption(s.purpose_short[:220])
 
-                if s.get("estimated_time"):
-                    st.caption(f"⏱ {s['estimated_time']}")
+                if s.estimated_time:
+                    st.caption(f"⏱ {s.estimated_time}")
             with c2:
                 st.caption(f"{type_label} skill")
-                if st.button("Try it →", key=f"skill_{s['name']}", use_container_width=True):
-                    nav("skill", skill=s, theme=theme_slug)
+                if st.button("Try it →", key=f"skill_{s.name}", use_container_width=True):
+                    nav("skill", skill_name=s.name, theme=theme_slug)
 
 
 # ─── Screen: Skill Detail ─────────────────────────────────────────────────────
 
-def render_skill_detail(skill: dict, theme_slug: str | None):
+def render_skill_detail(skill: Skill, theme_slug: str | None):
     if skill is None:
         st.error("No skill selected.")
         nav("run_home")
         return
 
     meta = THEMES.get(theme_slug or "", {"label": "All Skills"})
-    icon, type_label = TYPE_BADGES.get(skill["type"], ("", "Skill"))
+    icon, type_label = TYPE_BADGES.get(skill.type, ("", "Skill"))
 
     # Breadcrumb nav
     bc = st.columns([1, 1, 6])
@@ -1410,32 +2750,34 @@ def render_skill_detail(skill: dict, theme_slug: str | None):
         if theme_slug and st.button(f"← {meta['label']}"):
             nav("theme", theme=theme_slug)
 
-    st.title(skill["name"])
-    st.caption(f"{icon} {type_label} skill{'  ·  ⏱ ' + skill['estimated_time'] if skill.get('estimated_time') else ''}")
+    st.title(skill.name)
+    st.caption(f"{icon} {type_label} skill{'  ·  ⏱ ' + skill.estimated_time if skill.estimated_time else ''}")
     st.divider()
 
+    sections = load_skill_content(skill).sections
+
     # Purpose
-    if skill["sections"].get("Purpose"):
-        st.markdown(skill["sections"]["Purpose"])
+    if sections.get("Purpose"):
+        st.markdown(sections["Purpose"])
 
     # Best for
-    if skill.get("best_for"):
+    if skill.best_for:
         st.markdown("**Best for:**")
-        for bf in skill["best_for"]:
+        for bf in skill.best_for:
             st.markdown(f"- {bf}")
 
     st.divider()
 
     # Pre-flight for interactive / workflow skills
-    if skill["type"] == "interactive":
+    if skill.type == "interactive":
         st.info(
             "💬 **Guided conversation**  \n"
             "This skill asks you questions one at a time and gives you personalised "
             "recommendations based on your answers.  \n\n"
-            + (f"Estimated time: **{skill['estimated_time']}**  \n\n" if skill.get("estimated_time") else "")
+            + (f"Estimated time: **{skill.estimated_time}**  \n\n" if skill.estimated_time else "")
             + "You can bail at any time — use **Start over** or **← Different skill** in the sidebar."
         )
-    elif skill["type"] == "workflow":
+    elif skill.type == "workflow":
         st.info(
             "🔄 **Multi-phase workflow**  \n"
             "This skill walks you through a structured process in phases. "
@@ -1444,20 +2786,20 @@ def render_skill_detail(skill: dict, theme_slug: str | None):
 
     # What to bring — the skill's own Input section. Optional by design:
     # arriving empty-handed is fine, the guided flow covers the gaps.
-    if skill["sections"].get("Input"):
+    if sections.get("Input"):
         with st.expander("🎒 What to bring (all optional — the skill walks you through the rest)"):
-            st.markdown(skill["sections"]["Input"])
+            st.markdown(sections["Input"])
 
     # Scenario input
     st.markdown("### Your scenario")
 
     # Pre-built scenario chips
-    if skill.get("scenarios"):
+    if skill.scenarios:
         st.caption("Quick-start with a pre-built scenario, or write your own below:")
-        for i, scenario in enumerate(skill["scenarios"][:4]):
+        for i, scenario in enumerate(skill.scenarios[:4]):
             label = f'"{scenario[:70]}{"…" if len(scenario) > 70 else ""}"'
             if st.button(label, key=f"chip_{i}"):
-                nav("session", skill=skill, theme=theme_slug, scenario=scenario)
+                nav("session", skill_name=skill.name, theme=theme_slug, scenario=scenario)
 
     scenario = st.text_area(
         "Your situation:",
@@ -1474,20 +2816,20 @@ def render_skill_detail(skill: dict, theme_slug: str | None):
         "component": "Generate artifact →",
         "interactive": "Start guided session →",
         "workflow": "Start workflow →",
-    }.get(skill["type"], "Run skill →")
+    }.get(skill.type, "Run skill →")
 
     disabled = not scenario.strip()
     if st.button(btn_label, type="primary", disabled=disabled):
-        nav("session", skill=skill, theme=theme_slug, scenario=scenario.strip())
+        nav("session", skill_name=skill.name, theme=theme_slug, scenario=scenario.strip())
     if disabled:
         st.caption("↑ Add your scenario above to continue")
     else:
-        st.caption("Starting this skill will call the selected model. A spinner will appear on the next screen while it runs.")
+        st.caption("Starting this skill will call the selected model. Its reply streams in on the next screen as it is written.")
 
 
 # ─── Screen: Session ──────────────────────────────────────────────────────────
 
-def render_session(skill: dict | None):
+def render_session(skill: Skill | None):
     if skill is None:
         st.error("No skill selected.")
         nav("run_home")
@@ -1517,48 +2859,61 @@ def render_session(skill: dict | None):
     scenario = st.session_state.get("scenario", "")
 
     st.caption(f"Provider: **{PROVIDERS[provider]['label']}** · Model: **{model}**")
+    usage_slot = st.empty()
 
-    if skill["type"] == "component":
+    if skill.type == "component":
         render_component_session(skill, provider, api_key, model, system, scenario)
-    elif skill["type"] == "interactive":
+    elif skill.type == "interactive":
         render_interactive_session(skill, provider, api_key, model, system, scenario)
-    elif skill["type"] == "workflow":
+    elif skill.type == "workflow":
         render_workflow_session(skill, provider, api_key, model, system, scenario)
 
+    # Filled after the renderer so a call made during this run is included.
+    usages = st.session_state.get("token_usage") or []
+    if usages:
+        total = sum(usages, NO_TOKENS)
+        share = total.cached_input_tokens / total.input_tokens if total.input_tokens else 0.0
+        usage_slot.caption(
+            f"Last call: {format_token_usage(usages[-1])}  \n"
+            f"This session: {len(usages)} call{'s' if len(usages) != 1 else ''}, "
+            f"{total.input_tokens:,} input tokens, {share:.0%} from prompt cache"
+        )
+
 
 def render_component_session(
-    skill: dict, provider: str, api_key: str, model: str, system: str, scenario: str
+    skill: Skill, provider: str, api_key: str, model: str, system: str, scenario: str
 ):
-    st.subheader(f"🧱 {skill['name']}")
+    st.subheader(f"🧱 {skill.name}")
     st.caption(f"Scenario: {scenario[:120]}{'…' if len(scenario) > 120 else ''}")
     st.divider()
 
     if not st.session_state.get("messages"):
-        with st.spinner("Running skill…"):
-            try:
-                messages = [{"role": "user", "content": scenario}]
-                response = call_model(provider, api_key, model, system, messages)
-                st.session_state.messages = messages + [
-                    {"role": "assistant", "content": response}
-                ]
-            except Exception as e:
-                if is_auth_error(e):
-                    st.error(f"❌ Invalid {PROVIDERS[provider]['label']} API key. Check your environment configuration.")
-                    return
-                st.error(f"API error: {e}")
+        try:
+            messages = [{"role": "user", "content": scenario}]
+            response = st.write_stream(
+                stream_model(provider, api_key, model, system, messages, record_token_usage)
+            )
+            st.session_state.messages = messages + [
+                {"role": "assistant", "content": response}
+            ]
+        except Exception as e:
+            if is_auth_error(e):
+                st.error(f"❌ Invalid {PROVIDERS[provider]['label']} API key. Check your environment configuration.")
                 return
-
-    for msg in st.session_state.messages:
-        if msg["role"] == "assistant":
-            st.markdown(msg["content"])
+            st.error(f"API error: {e}")
+            return
+    else:
+        for msg in st.session_state.messages:
+            if msg["role"] == "assistant":
+                st.markdown(msg["content"])
 
     st.divider()
     if st.button("↩ Try a different scenario", use_container_width=True):
-        nav("skill", skill=skill, theme=st.session_state.get("theme"))
+        nav("skill", skill_name=skill.name, theme=st.session_state.get("theme"))
 
 
 def render_interactive_session(
-    skill: dict, provider: str, api_key: str, model: str, system: str, scenario: str
+    skill: Skill, provider: str, api_key: str, model: str, system: str, scenario: str
 ):
     # Progress bar
     messages = st.session_state.get("messages", [])
@@ -1572,15 +2927,24 @@ def render_interactive_session(
         user_turns = sum(1 for m in messages if m["role"] == "user")
         st.caption(f"Turn {user_turns}")
 
-    st.subheader(f"🔄 {skill['name']}")
+    st.subheader(f"🔄 {skill.name}")
+
+    # Render conversation history
+    for msg in messages:
+        with st.chat_message(msg["role"]):
+            st.markdown(msg["content"])
 
-    # Kick off with first message if fresh
+    # Kick off with first message if fresh, streaming the reply into the chat
     if not messages:
         initial = f"My situation: {scenario}" if scenario else "Let's start."
-        with st.spinner("Starting session…"):
+        msgs = [{"role": "user", "content": initial}]
+        with st.chat_message("user"):
+            st.markdown(initial)
+        with st.chat_message("assistant"):
             try:
-                msgs = [{"role": "user", "content": initial}]
-                response = call_model(provider, api_key, model, system, msgs)
+                response = st.write_stream(
+                    stream_model(provider, api_key, model, system, msgs, record_token_usage)
+                )
                 st.session_state.messages = msgs + [
                     {"role": "assistant", "content": response}
                 ]
@@ -1592,11 +2956,6 @@ def render_interactive_session(
                 st.error(f"API error: {e}")
                 return
 
-    # Render conversation history
-    for msg in messages:
-        with st.chat_message(msg["role"]):
-            st.markdown(msg["content"])
-
     # Chat input
     user_input = st.chat_input("Your response… (type 'done' to finish)")
     if user_input:
@@ -1611,41 +2970,30 @@ def render_interactive_session(
             with st.chat_message("user"):
                 st.markdown(user_input)
             with st.chat_message("assistant"):
-                with st.spinner("Thinking…"):
-                    try:
-                        response = call_model(
-                            provider, api_key, model, system, st.session_state.messages
-                        )
-                        st.markdown(response)
-                        st.session_state.messages.append(
-                            {"role": "assistant", "content": response}
-                        )
-                    except Exception as e:
-                        if is_auth_error(e):
-                            st.error(f"❌ Invalid {PROVIDERS[provider]['label']} API key. Check your environment configuration.")
-                            return
-                        st.error(f"API error: {e}")
+                try:
+                    response = st.write_stream(
+                        stream_model(provider, api_key, model, system, st.session_state.messages, record_token_usage)
+                    )
+                    st.session_state.messages.append(
+                        {"role": "assistant", "content": response}
+                    )
+                except Exception as e:
+                    if is_auth_error(e):
+                        st.error(f"❌ Invalid {PROVIDERS[provider]['label']} API key. Check your environment configuration.")
                         return
+                    st.error(f"API error: {e}")
+                    return
             st.rerun()
 
 
 def render_workflow_session(
-    skill: dict, provider: str, api_key: str, model: str, system: str, scenario: str
+    skill: Skill, provider: str, api_key: str, model: str, system: str, scenario: str
 ):
-    # Detect phases from parsed section keys first (handles skills that use ## Phase N),
-    # then fall back to heading extraction from Application text.
-    phase_defs = [
-        {"name": section_name, "body": section_body}
-        for section_name, section_body in skill["sections"].items()
-        if re.match(r"^Phase\s+\d+", section_name)
-    ]
-    if not phase_defs:
-        app_text = skill["sections"].get("Application", "")
-        phase_defs = extract_workflow_phases(app_text)
+    phase_defs = extract_workflow_phases(load_skill_content(skill))
     phases = [p["name"] for p in phase_defs]
     workflow_outputs: dict[str, str] = st.session_state.get("workflow_outputs", {})
 
-    st.subheader(f"🎭 {skill['name']}")
+    st.subheader(f"🎭 {skill.name}")
 
     current_phase = st.session_state.get("phase", 0)
     if current_phase >= len(phases):
@@ -1704,46 +3052,52 @@ def render_workflow_session(
         st.session_state.phase = 0
         st.rerun()
 
-    if run_phase:
-        with st.spinner(f"Running {phase_name}…"):
-            try:
-                prompt = build_phase_prompt(
-                    scenario, phase_name, current_def["body"], current_phase + 1, len(phases)
-                )
-                msgs = [{"role": "user", "content": prompt}]
-                response = call_model(provider, api_key, model, system, msgs)
-                workflow_outputs[phase_name] = response
-                st.session_state.workflow_outputs = workflow_outputs
-                st.rerun()
-            except Exception as e:
-                if is_auth_error(e):
-                    st.error(f"❌ Invalid {PROVIDERS[provider]['label']} API key. Check your environment configuration.")
-                    return
-                st.error(f"API error: {e}")
-                return
-
     if run_all:
-        with st.spinner(f"Running all {len(phases)} phases…"):
-            try:
-                for idx, phase_def in enumerate(phase_defs, start=1):
-                    prompt = build_phase_prompt(
-                        scenario, phase_def["name"], phase_def["body"], idx, len(phases)
-                    )
-                    msgs = [{"role": "user", "content": prompt}]
-                    response = call_model(provider, api_key, model, system, msgs)
-                    workflow_outputs[phase_def["name"]] = response
-                st.session_state.workflow_outputs = workflow_outputs
-                st.session_state.phase = len(phases) - 1
-                st.rerun()
-            except Exception as e:
-                if is_auth_error(e):
-                    st.error(f"❌ Invalid {PROVIDERS[provider]['label']} API key. Check your environment configuration.")
-                    return
-                st.error(f"API error while running full workflow: {e}")
+        progress = st.progress(0.0, text=f"Running all {len(phases)} phases…")
+        prompts = [
+            build_phase_prompt(scenario, phase_def["name"], phase_def["body"], idx, len(phases))
+            for idx, phase_def in enumerate(phase_defs, start=1)
+        ]
+        usages: list[TokenUsage] = []
+        try:
+            for done, (index, response) in enumerate(
+                run_workflow_phases(provider, api_key, model, system, prompts, usages), start=1
+            ):
+                workflow_outputs[phases[index]] = response
+                progress.progress(done / len(phases), text=f"{done}/{len(phases)} phases done · {phases[index]}")
+        except Exception as e:
+            if is_auth_error(e):
+                st.error(f"❌ Invalid {PROVIDERS[provider]['label']} API key. Check your environment configuration.")
                 return
+            st.error(f"API error while running full workflow: {e}")
+            return
+        finally:
+            st.session_state.workflow_outputs = workflow_outputs
+            for usage in usages:
+                record_token_usage(usage)
+        st.session_state.phase = len(phases) - 1
+        st.rerun()
 
     st.divider()
-    if workflow_outputs.get(phase_name):
+    if run_phase:
+        try:
+            prompt = build_phase_prompt(
+                scenario, phase_name, current_def["body"], current_phase + 1, len(phases)
+            )
+            msgs = [{"role": "user", "content": prompt}]
+            response = st.write_stream(
+                stream_model(provider, api_key, model, system, msgs, record_token_usage)
+            )
+        except Exception as e:
+            if is_auth_error(e):
+                st.error(f"❌ Invalid {PROVIDERS[provider]['label']} API key. Check your environment configuration.")
+                return
+            st.error(f"API error: {e}")
+            return
+        workflow_outputs[phase_name] = response
+        st.session_state.workflow_outputs = workflow_outputs
+        st.rerun()
+    elif workflow_outputs.get(phase_name):
         st.markdown(workflow_outputs[phase_name])
     else:
         st.caption("No output yet for this phase. Click **Run this phase**.")
@@ -1779,6 +3133,99 @@ def render_workflow_session(
             )
 
 
+# ─── Diagnostics ──────────────────────────────────────────────────────────────
+
+def debug_enabled() -> bool:
+    return os.getenv("PLAYGROUND_DEBUG", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def measure_import_times(modules: Iterable[str]) -> list[dict]:
+    """Cold-import each module in a fresh interpreter under `-X importtime`."""
+    rows = []
+    for name in modules:
+        if importlib.util.find_spec(name) is None:
+            rows.append({"module": name, "cold import (ms)": None, "note": "not installed"})
+            continue
+        try:
+            result = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", f"import {name}"],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            rows.append({"module": name, "cold import (ms)": None, "note": str(e)})
+            continue
+        # Lines look like "import time:   self [us] | cumulative | <indent>package";
+        # the unindented entry for `name` carries the total cost of importing it.
+        cumulative_us = None
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].rstrip() == f" {name}":
+                cumulative_us = int(fields[1])
+        rows.append(
+            {
+                "module": name,
+                "cold import (ms)": round(cumulative_us / 1000, 1) if cumulative_us is not None else None,
+                "note": "" if result.returncode == 0 else result.stderr.strip().splitlines()[-1],
+            }
+        )
+    return rows
+
+
+def render_debug_panel():
+    """Sidebar startup, provider connection, and cache report, shown when PLAYGROUND_DEBUG is set."""
+    sdks = provider_sdks()
+    with st.sidebar.expander("🛠 Performance", expanded=False):
+        st.caption(f"This script run: {(time.perf_counter() - RUN_STARTED) * 1000:.0f} ms")
+        for module_name in sorted({PROVIDERS[p]["sdk"] for p in PROVIDERS}):
+            if module_name in sdks.import_seconds:
+                st.caption(f"`{module_name}` imported on first call ({sdks.import_seconds[module_name] * 1000:.0f} ms)")
+            else:
+                st.caption(f"`{module_name}` not imported yet")
+        for (provider, key_hash, _base_url), stats in list(provider_clients().stats.items()):
+            timings = [
+                f"{label} {seconds * 1000:.0f} ms"
+                for label, seconds in (("new", stats.mean_seconds(False)), ("reused", stats.mean_seconds(True)))
+                if seconds is not None
+            ]
+            st.caption(
+                f"{PROVIDERS[provider]['label']} client `{key_hash[:6]}`: {stats.requests} requests, "
+                f"connections {stats.connections_opened} opened / {stats.connections_reused} reused"
+                + (f" (mean to headers: {', '.join(timings)})" if timings else "")
+                + (
+                    f"; first token {stats.mean_first_token_seconds * 1000:.0f} ms"
+                    if stats.mean_first_token_seconds is not None
+                    else ""
+                )
+            )
+            if stats.usage.input_tokens:
+                st.caption(
+                    f"{stats.usage.input_tokens:,} input tokens, "
+                    f"{stats.usage.cached_input_tokens / stats.usage.input_tokens:.0%} from prompt cache; "
+                    f"{stats.usage.output_tokens:,} output"
+                )
+        if response_cache_enabled():
+            responses = response_cache()
+            entries, stored = responses.usage()
+            st.caption(
+                f"Response cache: {entries} replies, {stored / 1024:.0f} KB of "
+                f"{responses.max_bytes // (1024 * 1024)} MB, {responses.hits} hits / {responses.misses} misses"
+            )
+        cache = finder_cache()
+        lookups = cache.hits + cache.misses
+        st.caption(
+            f"Finder cache: {len(cache.entries)}/{cache.max_entries} queries, "
+            f"{cache.hits} hits / {cache.misses} misses"
+            + (f" ({cache.hits / lookups:.0%} hit rate)" if lookups else "")
+        )
+        if st.button("Measure cold import cost", use_container_width=True):
+            with st.spinner("Running python -X importtime…"):
+                st.session_state["importtime_report"] = measure_import_times(IMPORTTIME_MODULES)
+        if st.session_state.get("importtime_report"):
+            st.dataframe(st.session_state["importtime_report"], hide_index=True, use_container_width=True)
+
+
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
 def main():
@@ -1794,13 +3241,15 @@ def main():
         "view": "home",
         "guide_id": None,
         "theme": None,
-        "skill": None,
+        "skill_name": None,
         "finder_query_input": "",
         "finder_last_query": "",
         "finder_reset_requested": False,
         "finder_type_filter": "Any",
         "finder_theme_filter": "Any",
+        "finder_live": True,
         "messages": [],
+        "token_usage": [],
         "scenario": "",
         "scenario_input": "",
         "phase": 0,
@@ -1817,8 +3266,9 @@ def main():
         if k not in st.session_state:
             st.session_state[k] = v
 
-    skills = load_skills()
-    current_skill = st.session_state.get("skill")
+    library = load_skills()
+    skills = library.skills
+    current_skill = library.get(st.session_state.get("skill_name"))
 
     render_sidebar(current_skill)
 
@@ -1830,15 +3280,18 @@ def main():
     elif view == "learn_doc":
         render_learn_doc()
     elif view == "find_home":
-        render_find_home(skills)
+        render_find_home(library)
     elif view == "run_home":
         render_run_home(skills)
     elif view == "theme":
         render_theme(skills, st.session_state.get("theme", ""))
     elif view == "skill":
-        render_skill_detail(st.session_state.get("skill"), st.session_state.get("theme"))
+        render_skill_detail(current_skill, st.session_state.get("theme"))
     elif view == "session":
-        render_session(st.session_state.get("skill"))
+        render_session(current_skill)
+
+    if debug_enabled():
+        render_debug_panel()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Run Find My Skill over a file of real questions and report coverage gaps.
+
+Why this exists
+---------------
+Support threads and workshop notes are full of questions nobody wrote a
+skill for. Pasting them into the Playground one at a time does not scale
+past a handful. This script ranks every question in one batch with
+`rank_skills_for_queries()` (the same results the app shows, computed as a
+sparse query-by-term product), then reports:
+
+- questions with no matching skill, which are the coverage gaps
+- how often each skill is the top answer
+- skills that never reach the top `--top` for any question
+
+Input is plain text with one question per line; blank lines and lines
+starting with `#` are skipped. Pass `-` to read from stdin.
+
+Usage:
+    python3 scripts/audit-finder-coverage.py questions.txt
+    python3 scripts/audit-finder-coverage.py questions.txt --ranking bm25f --json > audit.json
+
+Needs the Playground's dependencies (app/requirements.txt) plus NumPy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+APP_DIR = PROJECT_ROOT / "app"
+
+
+def load_app():
+    """Import app/main.py without starting the file watcher; None when a dependency is missing."""
+    logging.disable(logging.WARNING)  # st.cache_resource warns outside `streamlit run`
+    os.environ["SKILLS_WATCH"] = "off"
+    sys.path.insert(0, str(APP_DIR))
+    if importlib.util.find_spec("numpy") is None:
+        print("The batch ranker needs NumPy. Install with: python3 -m pip install numpy", file=sys.stderr)
+        return None
+    try:
+        import main
+    except ImportError as e:
+        print(f"Cannot load the Playground: {e}. Install with: pip install -r app/requirements.txt", file=sys.stderr)
+        return None
+    return main
+
+
+def read_questions(source: str) -> list[str]:
+    text = sys.stdin.read() if source == "-" else Path(source).read_text(encoding="utf-8")
+    return [line.strip() for line in text.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("questions", help="Text file with one question per line, or - for stdin.")
+    parser.add_argument("--ranking", default="weighted", help="Ranking mode from the Playground (default weighted).")
+    parser.add_argument("--type", default="Any", help="Only rank skills of this type.")
+    parser.add_argument("--theme", default="Any", help="Only rank skills in this theme.")
+    parser.add_argument("--top", type=int, default=3, help="Results kept per question (default 3).")
+    parser.add_argument("--show", type=int, default=20, help="Unmatched questions and skills to list.")
+    parser.add_argument("--json", action="store_true", help="Print every question's top results as JSON.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    app = load_app()
+    if app is None:
+        return 1
+    if args.ranking not in app.FINDER_RANKINGS:
+        print(f"Unknown ranking {args.ranking!r}; choose from: {', '.join(app.FINDER_RANKINGS)}", file=sys.stderr)
+        return 1
+    questions = read_questions(args.questions)
+    library = app.load_skills()
+
+    started = time.perf_counter()
+    results = app.rank_skills_for_queries(library, questions, args.type, args.theme, args.ranking, args.top)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        payload = [
+            {
+                "question": question,
+                "matches": result.total,
+                "top": [
+                    {"skill": item["skill"].name, "score": item["score"], "match": item["match"]}
+                    for item in result.items
+                ],
+            }
+            for question, result in zip(questions, results)
+        ]
+        print(json.dumps(payload, indent=2))
+        return 0
+
+    unmatched = [question for question, result in zip(questions, results) if not result.total]
+    top_counts = Counter(result.items[0]["skill"].name for result in results if result.items)
+    reached = {item["skill"].name for result in results for item in result.items}
+    never = [skill.name for skill in library.skills if skill.name not in reached]
+
+    print(
+        f"Ranked {len(questions)} questions against {len(library.skills)} skills "
+        f"({args.ranking}) in {elapsed:.2f}s"
+    )
+    print(f"\nNo matching skill: {len(unmatched)}")
+    for question in unmatched[: args.show]:
+        print(f"  - {question}")
+    print("\nMost frequent top answer:")
+    for name, count in top_counts.most_common(args.show):
+        print(f"  {count:>5}  {name}")
+    print(f"\nNever in the top {args.top}: {len(never)}")
+    for name in never[: args.show]:
+        print(f"  - {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""Time the skill loader, finder, and library scripts on synthetic libraries.
+
+Why this exists
+---------------
+The repo ships well under a hundred skills, so every loader or finder change
+looks instant and nobody can tell a linear scan from an index. This script
+builds synthetic, schema-valid libraries (1k, 10k, and 50k skills by default)
+and times the code paths that grow with the library:
+
+- `load_skills()` from `app/main.py`, cold (no snapshot) and warm
+- `rank_skills_for_query()` for a fixed query set, first page only (as the UI asks)
+- `extract_workflow_phases()` across every workflow skill
+- `generate-catalog.py`, `check-skill-metadata.py`, `check-skill-triggers.py`
+
+Each synthetic skill is a real skill from `skills/` with a new name and one
+extra Purpose sentence drawn from the library's own vocabulary, so every file
+passes `check-skill-metadata.py` (required sections, in order) and finder
+scores look like real ones. Generation is seeded and repeatable.
+
+Every measurement runs in a fresh interpreter so import and cache costs are
+counted the way a user pays them. Results go to a JSON report (default
+`.cache/benchmarks/<commit>.json`); pass `--compare` with an older report to
+print the ratio for every metric.
+
+Usage:
+    python3 scripts/benchmark-library.py
+    python3 scripts/benchmark-library.py --sizes 1000 --compare .cache/benchmarks/abc1234.json
+    python3 scripts/benchmark-library.py --sizes 10000 --keep /tmp/pm-skills-10k
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import yaml
+
+from skill_library import load_library_snapshot
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+APP_DIR = PROJECT_ROOT / "app"
+REPORT_DIR = PROJECT_ROOT / ".cache" / "benchmarks"
+REPORT_VERSION = 1
+
+DEFAULT_SIZES = (1000, 10000, 50000)
+DEFAULT_SEED = 7
+BENCHMARK_QUERIES = (
+    "I need to figure out why activation is dropping for new users.",
+    "Help me decide whether this feature is worth building.",
+    "I need to turn discovery notes into a PRD my engineers can use.",
+    "We need a clearer prioritization framework for roadmap decisions.",
+    "prd",
+    "jobs to be done",
+    "pricing strategy",
+    "user story",
+)
+SCRIPT_TIMEOUT_SECONDS = 3600
+
+
+# ─── Synthetic library ────────────────────────────────────────────────────────
+
+def synthetic_name(base: str, index: int) -> str:
+    suffix = f"-{index:05d}"
+    return base[: 64 - len(suffix)].rstrip("-") + suffix
+
+
+def build_vocabulary(bodies: list[str]) -> list[str]:
+    words = set()
+    for body in bodies:
+        words.update(re.findall(r"[a-z]{5,}", body.lower()))
+    return sorted(words)
+
+
+def generate_library(root: Path, count: int, seed: int = DEFAULT_SEED) -> None:
+    """Write `count` schema-valid skills (plus the real commands) under root."""
+    templates = [p for p in load_library_snapshot(PROJECT_ROOT).skills if p.frontmatter]
+    vocabulary = build_vocabulary([p.body for p in templates])
+    rng = random.Random(seed)
+
+    skills_dir = root / "skills"
+    skills_dir.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        template = templates[index % len(templates)]
+        frontmatter = dict(template.frontmatter)
+        name = synthetic_name(str(frontmatter.get("name") or template.path.parent.name), index)
+        frontmatter["name"] = name
+        focus = ", ".join(rng.sample(vocabulary, 3))
+        body = template.body.replace(
+            "## Purpose\n",
+            f"## Purpose\n\nSynthetic variant {index} with extra emphasis on {focus}.\n",
+            1,
+        )
+        skill_dir = skills_dir / name
+        skill_dir.mkdir(exist_ok=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\n"
+            + yaml.safe_dump(frontmatter, sort_keys=False, allow_unicode=True, width=1000)
+            + "---"
+            + body,
+            encoding="utf-8",
+        )
+
+    shutil.copytree(PROJECT_ROOT / "commands", root / "commands", dirs_exist_ok=True)
+
+
+# ─── Measurements ─────────────────────────────────────────────────────────────
+
+def app_worker(root: Path, rank_budget: float, with_queries: bool) -> dict:
+    """Run inside a fresh interpreter: import the app and time its hot paths."""
+    import logging
+
+    logging.disable(logging.WARNING)  # st.cache_resource warns outside `streamlit run`
+    os.environ["SKILLS_WATCH"] = "off"
+    sys.path.insert(0, str(APP_DIR))
+
+    started = time.perf_counter()
+    import main
+
+    result: dict = {"import_app_s": time.perf_counter() - started}
+    main.SKILLS_DIR = root / "skills"
+    main.SNAPSHOT_PATH = root / ".cache" / "skill-snapshot.json"
+    main.SEARCH_CORPUS_PATH = root / ".cache" / "skill-search-corpus.bin"
+
+    started = time.perf_counter()
+    library = main.load_skills()
+    result["load_skills_s"] = time.perf_counter() - started
+    result["skills_loaded"] = len(library.skills)
+    if not with_queries:
+        return result
+
+    timings: list[float] = []
+    deadline = time.perf_counter() + rank_budget
+    for query in BENCHMARK_QUERIES:
+        started = time.perf_counter()
+        main.rank_skills_for_query(library, query, k=main.FINDER_PAGE_SIZE)
+        timings.append(time.perf_counter() - started)
+        if time.perf_counter() > deadline:
+            break
+    result["rank"] = {
+        "queries": len(timings),
+        "mean_s": statistics.fmean(timings),
+        "p50_s": statistics.median(timings),
+        "max_s": max(timings),
+    }
+
+    workflows = [skill for skill in library.skills if skill.type == "workflow"]
+    started = time.perf_counter()
+    phases = sum(len(main.extract_workflow_phases(main.load_skill_content(skill))) for skill in workflows)
+    result["extract_workflow_phases"] = {
+        "skills": len(workflows),
+        "phases": phases,
+        "total_s": time.perf_counter() - started,
+    }
+    return result
+
+
+def run_app(root: Path, rank_budget: float, with_queries: bool) -> dict:
+    command = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--worker",
+        str(root),
+        "--rank-budget",
+        str(rank_budget),
+    ]
+    if with_queries:
+        command.append("--worker-queries")
+    completed = subprocess.run(
+        command, capture_output=True, text=True, timeout=SCRIPT_TIMEOUT_SECONDS, env=scratch_env(root)
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"app worker failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def scratch_env(root: Path) -> dict[str, str]:
+    """Keep the scratch library's frontmatter cache out of the repo's .cache/."""
+    return {**os.environ, "SKILL_LIBRARY_CACHE": str(root / ".cache" / "library-snapshot.json")}
+
+
+def time_script(root: Path, args: list[str]) -> dict:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, *args],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        timeout=SCRIPT_TIMEOUT_SECONDS,
+        env=scratch_env(root),
+    )
+    return {"seconds": time.perf_counter() - started, "exit_code": completed.returncode}
+
+
+def benchmark_size(count: int, args: argparse.Namespace) -> dict:
+    root = Path(args.keep) if args.keep else Path(tempfile.mkdtemp(prefix=f"pm-skills-{count}-"))
+    try:
+        started = time.perf_counter()
+        generate_library(root, count, args.seed)
+        result: dict = {"generate_s": time.perf_counter() - started}
+        print(f"[{count}] generated in {result['generate_s']:.1f}s", flush=True)
+
+        shutil.rmtree(root / ".cache", ignore_errors=True)
+        cold = run_app(root, args.rank_budget, with_queries=False)
+        warm = run_app(root, args.rank_budget, with_queries=True)
+        result["import_app_s"] = warm["import_app_s"]
+        result["load_skills_cold_s"] = cold["load_skills_s"]
+        result["load_skills_warm_s"] = warm["load_skills_s"]
+        result["skills_loaded"] = warm["skills_loaded"]
+        result["rank"] = warm["rank"]
+        result["extract_workflow_phases"] = warm["extract_workflow_phases"]
+        print(
+            f"[{count}] load_skills cold {cold['load_skills_s']:.2f}s warm {warm['load_skills_s']:.2f}s, "
+            f"rank mean {warm['rank']['mean_s']:.3f}s over {warm['rank']['queries']} queries",
+            flush=True,
+        )
+
+        # The validators and catalog share the frontmatter cache, so the first
+        # script pays for YAML parsing; clear it to time each one cold.
+        for label, script_args in (
+            ("generate_catalog", [str(SCRIPTS_DIR / "generate-catalog.py"), "--root", str(root)]),
+            ("check_skill_metadata", [str(SCRIPTS_DIR / "check-skill-metadata.py")]),
+            ("check_skill_triggers", [str(SCRIPTS_DIR / "check-skill-triggers.py")]),
+        ):
+            (root / ".cache" / "library-snapshot.json").unlink(missing_ok=True)
+            result[label] = time_script(root, script_args)
+            print(f"[{count}] {label} {result[label]['seconds']:.2f}s (exit {result[label]['exit_code']})", flush=True)
+        return result
+    finally:
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+# ─── Report ───────────────────────────────────────────────────────────────────
+
+def git_commit() -> str:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+    except OSError:
+        return "unknown"
+    return completed.stdout.strip() or "unknown"
+
+
+def flatten(prefix: str, value) -> dict[str, float]:
+    """Flatten nested timings to `size.metric` keys; only `*_s`/`seconds` leaves."""
+    if isinstance(value, dict):
+        flat: dict[str, float] = {}
+        for key, item in value.items():
+            flat.update(flatten(f"{prefix}.{key}" if prefix else key, item))
+        return flat
+    if isinstance(value, (int, float)) and prefix.endswith(("_s", "seconds")):
+        return {prefix: float(value)}
+    return {}
+
+
+def print_comparison(report: dict, baseline_path: Path) -> None:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    before = flatten("", baseline.get("sizes", {}))
+    after = flatten("", report["sizes"])
+    print(f"\nCompared with {baseline_path} ({baseline.get('commit', 'unknown')}):")
+    shared = sorted(after.keys() & before.keys())
+    if not shared:
+        print("  No sizes in common; rerun with the same --sizes to compare.")
+    for key in shared:
+        if before[key] > 0:
+            print(f"  {key:<55} {before[key]:9.3f}s -> {after[key]:9.3f}s  x{after[key] / before[key]:.2f}")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the skill loader and finder on synthetic libraries.")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated library sizes (default: 1000,10000,50000).",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed for synthetic content.")
+    parser.add_argument(
+        "--rank-budget",
+        type=float,
+        default=120.0,
+        help="Stop running finder queries once this many seconds are spent (at least one always runs).",
+    )
+    parser.add_argument("--output", type=Path, help="Report path (default: .cache/benchmarks/<commit>.json).")
+    parser.add_argument("--compare", type=Path, help="Earlier report to compare against.")
+    parser.add_argument("--keep", help="Generate into this directory and keep it (single size only).")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-queries", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.worker:
+        print(json.dumps(app_worker(Path(args.worker), args.rank_budget, args.worker_queries)))
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    if args.keep and len(sizes) != 1:
+        print("--keep needs exactly one size.", file=sys.stderr)
+        return 2
+
+    commit = git_commit()
+    report = {
+        "version": REPORT_VERSION,
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "queries": list(BENCHMARK_QUERIES),
+        "sizes": {},
+    }
+    for count in sizes:
+        report["sizes"][str(count)] = benchmark_size(count, args)
+
+    output = args.output or REPORT_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\nWrote {output}")
+
+    if args.compare:
+        print_comparison(report, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -46,27 +46,20 @@ echo "  $skill_zip_count individual skill ZIPs, $(find "$DIST/packages" -name '*
 
 echo "[3/4] Generating CATALOG.md and README.md"
 python3 - "$ROOT" <<'PY'
-import os, sys, glob
-try:
-    import yaml
-except ImportError:
-    sys.exit("PyYAML required (used elsewhere in this repo)")
+import os, sys
 
 root = sys.argv[1]
 dist = os.path.join(root, "dist")
-skills_dir = os.path.join(root, "skills")
-
-def frontmatter(path):
-    text = open(path, encoding="utf-8").read()
-    if not text.startswith("---"):
-        return {}
-    end = text.find("\n---", 3)
-    return yaml.safe_load(text[3:end]) or {}
+sys.path.insert(0, os.path.join(root, "scripts"))
+try:
+    from skill_library import load_library_snapshot
+except ImportError:
+    sys.exit("PyYAML required (used elsewhere in this repo)")
 
 skills = []
-for p in sorted(glob.glob(os.path.join(skills_dir, "*", "SKILL.md"))):
-    fm = frontmatter(p)
-    name = fm.get("name") or os.path.basename(os.path.dirname(p))
+for parsed in load_library_snapshot(root).skills:
+    fm = parsed.frontmatter or {}
+    name = fm.get("name") or parsed.path.parent.name
     skills.append({
         "name": name,
         "type": (fm.get("type") or "other").lower(),
@@ -22,11 +22,7 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-try:
-    import yaml
-except ImportError:  # pragma: no cover
-    print("PyYAML is required. Install with: python3 -m pip install pyyaml", file=sys.stderr)
-    raise
+from skill_library import parse_file
 
 
 REQUIRED_SECTIONS = ["Invocation", "Workflow", "Checkpoints", "Next Steps"]
@@ -41,17 +37,6 @@ class Issue:
     detail: str
 
 
-def split_frontmatter(text: str) -> tuple[dict | None, str]:
-    if not text.startswith("---\n"):
-        return None, text
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        return None, text
-    data = yaml.safe_load(parts[1]) or {}
-    body = parts[2]
-    return data, body
-
-
 def check_required_sections(path: str, body: str) -> list[Issue]:
     issues: list[Issue] = []
     headings = re.findall(r"^##\s+(.+?)\s*$", body, flags=re.MULTILINE)
@@ -84,11 +69,9 @@ def check_command(path: str) -> list[Issue]:
     if os.path.basename(path).lower() == "readme.md":
         return []
 
-    with open(path, "r", encoding="utf-8") as handle:
-        text = handle.read()
-
     issues: list[Issue] = []
-    data, body = split_frontmatter(text)
+    parsed = parse_file(path)
+    data, body = parsed.frontmatter, parsed.body
     if data is None:
         issues.append(Issue(path, "frontmatter_missing", "Missing or malformed frontmatter"))
         return issues
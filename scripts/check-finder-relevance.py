@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Fail when Find My Skill relevance or latency regresses.
+
+Why this exists
+---------------
+Nothing stopped an edit to a skill's description, or to the finder's field
+weights, from quietly pushing `prd-development` off the top of "turn
+discovery notes into a PRD". This check replays a fixed set of golden queries
+through every ranking mode in the Playground and compares the results with
+the committed baseline.
+
+Golden queries
+--------------
+- every `scenarios` and `best_for` entry in skills/*/SKILL.md, expecting the
+  skill it came from
+- every `FIND_MY_SKILL_PROMPTS` starter prompt, expecting the skills listed
+  in PROMPT_EXPECTATIONS below
+
+For each ranking mode it reports recall@1, recall@3, mean reciprocal rank
+(MRR), and p50/p95 latency. It fails when a relevance metric drops more than
+`--tolerance` below `finder-relevance-baseline.json`, or p95 latency exceeds
+`--max-p95-ms`. Latency is an absolute budget, not a baseline, because it
+depends on the machine. When NumPy is installed it also fails if the batch
+ranker (`rank_skills_for_queries`) disagrees with the single-query results.
+
+After an intended ranking change, review the output, then record the new
+numbers:
+
+    python3 scripts/check-finder-relevance.py --update-baseline
+
+Needs the Playground's dependencies (app/requirements.txt). Without them it
+checks nothing and exits with MISSING_DEPENDENCIES_EXIT (3), so the gate
+never passes unchecked; `test-library.sh` reports that as SKIPPED.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+APP_DIR = PROJECT_ROOT / "app"
+BASELINE_PATH = Path(__file__).resolve().parent / "finder-relevance-baseline.json"
+
+# Skills that count as a correct answer for each starter prompt in the app.
+PROMPT_EXPECTATIONS = {
+    "I need to figure out why activation is dropping for new users.": (
+        "discovery-process",
+        "opportunity-solution-tree",
+        "problem-statement",
+    ),
+    "Help me decide whether this feature is worth building.": ("feature-investment-advisor",),
+    "I need to turn discovery notes into a PRD my engineers can use.": ("prd-development",),
+    "We need a clearer prioritization framework for roadmap decisions.": ("prioritization-advisor",),
+}
+RELEVANCE_METRICS = ("recall_at_1", "recall_at_3", "mrr")
+DEFAULT_TOLERANCE = 0.02
+DEFAULT_MAX_P95_MS = 50.0
+MISSING_DEPENDENCIES_EXIT = 3
+
+
+def load_app():
+    """Import app/main.py without starting the file watcher; None without Streamlit."""
+    logging.disable(logging.WARNING)  # st.cache_resource warns outside `streamlit run`
+    os.environ["SKILLS_WATCH"] = "off"
+    sys.path.insert(0, str(APP_DIR))
+    try:
+        import main
+    except ImportError as e:
+        print(
+            f"Cannot run the finder relevance check: {e}. Install with: pip install -r app/requirements.txt",
+            file=sys.stderr,
+        )
+        return None
+    return main
+
+
+def golden_queries(app, library) -> tuple[dict[str, set[str]], list[str]]:
+    """Query -> acceptable skill names, plus problems with the query set itself."""
+    queries: dict[str, set[str]] = {}
+    for skill in library.skills:
+        for text in skill.scenarios + skill.best_for:
+            queries.setdefault(text, set()).add(skill.name)
+
+    problems = []
+    for prompt in app.FIND_MY_SKILL_PROMPTS:
+        expected = PROMPT_EXPECTATIONS.get(prompt)
+        if not expected:
+            problems.append(f"starter prompt has no PROMPT_EXPECTATIONS entry: {prompt!r}")
+            continue
+        missing = [name for name in expected if library.get(name) is None]
+        if missing:
+            problems.append(f"PROMPT_EXPECTATIONS names unknown skills: {', '.join(missing)}")
+        queries.setdefault(prompt, set()).update(expected)
+    return queries, problems
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def evaluate(app, library, ranking: str, queries: dict[str, set[str]]) -> tuple[dict, list[str]]:
+    """Relevance and latency of one ranking mode over the golden queries."""
+    app.rank_skills_for_query(library, "warm up the indexes", ranking=ranking)
+    ranks: list[int | None] = []
+    timings: list[float] = []
+    misses: list[str] = []
+    for query, expected in queries.items():
+        started = time.perf_counter()
+        results = app.rank_skills_for_query(library, query, ranking=ranking).items
+        timings.append((time.perf_counter() - started) * 1000)
+        rank = next((i for i, item in enumerate(results, start=1) if item["skill"].name in expected), None)
+        ranks.append(rank)
+        if rank is None or rank > 3:
+            top = ", ".join(item["skill"].name for item in results[:3]) or "no results"
+            misses.append(f"{query!r}: expected {'/'.join(sorted(expected))}, got {top}")
+
+    count = len(ranks)
+    metrics = {
+        "queries": count,
+        "recall_at_1": sum(1 for rank in ranks if rank == 1) / count,
+        "recall_at_3": sum(1 for rank in ranks if rank and rank <= 3) / count,
+        "mrr": sum(1 / rank for rank in ranks if rank) / count,
+        "p50_ms": statistics.median(timings),
+        "p95_ms": percentile(timings, 0.95),
+    }
+    return metrics, misses
+
+
+def batch_mismatches(app, library, ranking: str, queries: dict[str, set[str]]) -> list[str]:
+    """Queries whose batch-ranked results differ from `rank_skills_for_query`."""
+    texts = list(queries)
+    batch = app.rank_skills_for_queries(library, texts, ranking=ranking, k=None)
+    mismatches = []
+    for query, results in zip(texts, batch):
+        single = app.rank_skills_for_query(library, query, ranking=ranking)
+        if [(item["skill"].name, item["score"], item["match"]) for item in results.items] != [
+            (item["skill"].name, item["score"], item["match"]) for item in single.items
+        ]:
+            mismatches.append(query)
+    return mismatches
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--update-baseline", action="store_true", help=f"Write current metrics to {BASELINE_PATH.name}."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Allowed drop in recall/MRR before failing (default {DEFAULT_TOLERANCE}).",
+    )
+    parser.add_argument(
+        "--max-p95-ms",
+        type=float,
+        default=DEFAULT_MAX_P95_MS,
+        help=f"p95 latency budget per query in ms (default {DEFAULT_MAX_P95_MS:g}).",
+    )
+    parser.add_argument("--show-misses", type=int, default=5, help="Queries missing the top 3 to list per mode.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    app = load_app()
+    if app is None:
+        return MISSING_DEPENDENCIES_EXIT
+    library = app.load_skills()
+    queries, problems = golden_queries(app, library)
+
+    try:
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8")).get("rankings", {})
+    except (OSError, ValueError):
+        baseline = {}
+
+    current: dict[str, dict] = {}
+    print(f"{len(queries)} golden queries over {len(library.skills)} skills")
+    for ranking in app.FINDER_RANKINGS:
+        metrics, misses = evaluate(app, library, ranking, queries)
+        current[ranking] = metrics
+        print(
+            f"  {ranking:<9} R@1 {metrics['recall_at_1']:.3f}  R@3 {metrics['recall_at_3']:.3f}  "
+            f"MRR {metrics['mrr']:.3f}  p50 {metrics['p50_ms']:.1f} ms  p95 {metrics['p95_ms']:.1f} ms"
+        )
+        for miss in misses[: args.show_misses]:
+            print(f"      miss: {miss}")
+
+        if importlib.util.find_spec("numpy") is not None:
+            mismatches = batch_mismatches(app, library, ranking, queries)
+            if mismatches:
+                problems.append(
+                    f"{ranking}: batch ranking differs for {len(mismatches)} queries, e.g. {mismatches[0]!r}"
+                )
+        if metrics["p95_ms"] > args.max_p95_ms:
+            problems.append(f"{ranking}: p95 {metrics['p95_ms']:.1f} ms exceeds {args.max_p95_ms:g} ms")
+        expected = baseline.get(ranking)
+        if expected is None:
+            if not args.update_baseline:
+                print(f"      no baseline for {ranking}; run with --update-baseline to record one")
+            continue
+        for metric in RELEVANCE_METRICS:
+            if metrics[metric] < expected[metric] - args.tolerance:
+                problems.append(
+                    f"{ranking}: {metric} fell to {metrics[metric]:.3f} (baseline {expected[metric]:.3f})"
+                )
+
+    if args.update_baseline:
+        payload = {
+            "queries": len(queries),
+            "rankings": {
+                ranking: {metric: round(metrics[metric], 4) for metric in RELEVANCE_METRICS}
+                for ranking, metrics in current.items()
+            },
+        }
+        BASELINE_PATH.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {BASELINE_PATH.relative_to(PROJECT_ROOT)}")
+        return 0
+
+    if problems:
+        print("\nFinder relevance check failed:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print("Finder relevance and latency are within thresholds.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -24,11 +24,7 @@ import re
 import sys
 from dataclasses import dataclass
 
-try:
-    import yaml
-except ImportError:  # pragma: no cover
-    print("PyYAML is required. Install with: python3 -m pip install pyyaml", file=sys.stderr)
-    raise
+from skill_library import parse_file
 
 
 @dataclass
@@ -70,17 +66,6 @@ def check_forbidden_template_syntax(path: str, body: str) -> list[Issue]:
     return []
 
 
-def split_frontmatter(text: str) -> tuple[dict | None, str]:
-    if not text.startswith("---\n"):
-        return None, text
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        return None, text
-    data = yaml.safe_load(parts[1]) or {}
-    body = parts[2]
-    return data, body
-
-
 def check_required_sections(path: str, body: str) -> list[Issue]:
     issues: list[Issue] = []
     headings = re.findall(r"^##\s+(.+?)\s*$", body, flags=re.MULTILINE)
@@ -113,11 +98,9 @@ def check_skill(path: str) -> list[Issue]:
     if os.path.basename(path) != "SKILL.md":
         return [Issue(path, "file_name_invalid", "Skill file must be named SKILL.md")]
 
-    with open(path, "r", encoding="utf-8") as handle:
-        text = handle.read()
-
     issues: list[Issue] = []
-    data, body = split_frontmatter(text)
+    parsed = parse_file(path)
+    data, body = parsed.frontmatter, parsed.body
     if data is None:
         issues.append(Issue(path, "frontmatter_missing", "Missing or malformed frontmatter"))
         return issues
@@ -21,11 +21,7 @@ import re
 import sys
 from dataclasses import dataclass
 
-try:
-    import yaml
-except ImportError:  # pragma: no cover
-    print("PyYAML is required. Install with: python3 -m pip install pyyaml", file=sys.stderr)
-    raise
+from skill_library import parse_file
 
 
 DESCRIPTION_LIMIT = 200
@@ -58,17 +54,6 @@ class Issue:
     detail: str
 
 
-def split_frontmatter(text: str) -> tuple[dict | None, str]:
-    if not text.startswith("---\n"):
-        return None, text
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        return None, text
-    data = yaml.safe_load(parts[1]) or {}
-    body = parts[2]
-    return data, body
-
-
 def resolve_skill_files(paths: list[str]) -> list[str]:
     if not paths:
         return sorted(glob.glob("skills/*/SKILL.md"))
@@ -121,10 +106,7 @@ def check_skill(path: str) -> tuple[list[Issue], list[str], list[str]]:
     if not os.path.isfile(path):
         return [Issue(path, "error", "file_missing", "Skill file not found")], [], []
 
-    with open(path, "r", encoding="utf-8") as handle:
-        text = handle.read()
-
-    data, _body = split_frontmatter(text)
+    data = parse_file(path).frontmatter
     if data is None:
         return [Issue(path, "error", "frontmatter_missing", "Missing or malformed frontmatter")], [], []
 
@@ -3,17 +3,17 @@
 
 from __future__ import annotations
 
-import glob
-import os
+import argparse
+import sys
 from collections import defaultdict
 from pathlib import Path
 
 import yaml
 
+from skill_finder import SemanticIndex, SkillGraph, semantic_fields, semantic_term_counts, skill_references
+from skill_library import LibrarySnapshot, load_library_snapshot
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-CATALOG_DIR = PROJECT_ROOT / "catalog"
-SKILLS_GLOB = PROJECT_ROOT / "skills" / "*" / "SKILL.md"
-COMMANDS_GLOB = PROJECT_ROOT / "commands" / "*.md"
 
 SKILL_OPTIONAL_FIELDS = [
     "intent",
@@ -27,23 +27,11 @@ SKILL_OPTIONAL_FIELDS = [
 ]
 
 
-def read_frontmatter(path: Path) -> tuple[dict, str]:
-    text = path.read_text(encoding="utf-8")
-    if not text.startswith("---\n"):
-        return {}, text
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        return {}, text
-    data = yaml.safe_load(parts[1]) or {}
-    body = parts[2]
-    return data, body
-
-
-def load_skills() -> list[dict]:
+def load_skills(snapshot: LibrarySnapshot) -> list[dict]:
     skills: list[dict] = []
-    for raw_path in sorted(glob.glob(str(SKILLS_GLOB))):
-        path = Path(raw_path)
-        data, _ = read_frontmatter(path)
+    for parsed in snapshot.skills:
+        path = parsed.path
+        data = parsed.frontmatter
         if not data:
             continue
 
@@ -51,7 +39,7 @@ def load_skills() -> list[dict]:
             "name": data.get("name", ""),
             "description": data.get("description", ""),
             "type": data.get("type", ""),
-            "path": str(path.relative_to(PROJECT_ROOT)),
+            "path": str(path.relative_to(snapshot.root)),
         }
         for key in SKILL_OPTIONAL_FIELDS:
             if key in data:
@@ -62,11 +50,11 @@ def load_skills() -> list[dict]:
     return skills
 
 
-def load_commands() -> list[dict]:
+def load_commands(snapshot: LibrarySnapshot) -> list[dict]:
     commands: list[dict] = []
-    for raw_path in sorted(glob.glob(str(COMMANDS_GLOB))):
-        path = Path(raw_path)
-        data, _ = read_frontmatter(path)
+    for parsed in snapshot.commands:
+        path = parsed.path
+        data = parsed.frontmatter
         if not data:
             continue
 
@@ -76,7 +64,7 @@ def load_commands() -> list[dict]:
             "argument_hint": data.get("argument-hint", ""),
             "uses": data.get("uses", []),
             "outputs": data.get("outputs", []),
-            "path": str(path.relative_to(PROJECT_ROOT)),
+            "path": str(path.relative_to(snapshot.root)),
         }
         commands.append(item)
 
@@ -137,14 +125,64 @@ def write_commands_markdown(path: Path, commands: list[dict]) -> None:
     path.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
 
 
-def main() -> int:
-    CATALOG_DIR.mkdir(parents=True, exist_ok=True)
+def write_semantic_index(path: Path, snapshot: LibrarySnapshot) -> str:
+    """Fit the Find My Skill semantic model and save it; NumPy is optional."""
+    named = [(parsed.frontmatter.get("name", ""), parsed) for parsed in snapshot.skills if parsed.frontmatter]
+    named.sort(key=lambda item: item[0])
+    try:
+        model = SemanticIndex.fit(
+            [name for name, _ in named],
+            [semantic_term_counts(semantic_fields(parsed.frontmatter, parsed.body)) for _, parsed in named],
+        )
+    except ImportError:
+        return "skipped semantic index (install numpy to build it)"
+    model.save(path)
+    return f"semantic index with {len(model.vocabulary)} terms"
+
+
+def write_skill_graph(path: Path, snapshot: LibrarySnapshot) -> str:
+    """Build the related-skill graph behind Find My Skill's graph ranking and save it."""
+    skills = {
+        parsed.frontmatter.get("name", ""): (
+            parsed.frontmatter.get("theme"),
+            skill_references(parsed.frontmatter, parsed.body),
+        )
+        for parsed in snapshot.skills
+        if parsed.frontmatter
+    }
+    commands = {
+        parsed.frontmatter.get("name", parsed.path.stem): parsed.frontmatter.get("uses") or []
+        for parsed in snapshot.commands
+        if parsed.frontmatter
+    }
+    graph = SkillGraph.build(skills, commands)
+    graph.save(path)
+    return f"skill graph linking {len(graph.neighbors)} skills"
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate catalog/ indexes from skills and commands.")
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=PROJECT_ROOT,
+        help="Library root containing skills/ and commands/ (default: this repo).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    root = args.root.resolve()
+    catalog_dir = root / "catalog"
+    catalog_dir.mkdir(parents=True, exist_ok=True)
 
-    skills = load_skills()
-    commands = load_commands()
+    snapshot = load_library_snapshot(root)
+    skills = load_skills(snapshot)
+    commands = load_commands(snapshot)
 
     write_yaml(
-        CATALOG_DIR / "skills-index.yaml",
+        catalog_dir / "skills-index.yaml",
         {
             "generated_from": "skills/*/SKILL.md",
             "count": len(skills),
@@ -152,7 +190,7 @@ def main() -> int:
         },
     )
     write_yaml(
-        CATALOG_DIR / "commands-index.yaml",
+        catalog_dir / "commands-index.yaml",
         {
             "generated_from": "commands/*.md",
             "count": len(commands),
@@ -160,10 +198,12 @@ def main() -> int:
         },
     )
 
-    write_skills_by_type_markdown(CATALOG_DIR / "skills-by-type.md", skills)
-    write_commands_markdown(CATALOG_DIR / "commands.md", commands)
+    write_skills_by_type_markdown(catalog_dir / "skills-by-type.md", skills)
+    write_commands_markdown(catalog_dir / "commands.md", commands)
+    semantic = write_semantic_index(catalog_dir / "skills-semantic.npz", snapshot)
+    graph = write_skill_graph(catalog_dir / "skills-graph.json", snapshot)
 
-    print(f"Generated catalog for {len(skills)} skills and {len(commands)} commands.")
+    print(f"Generated catalog for {len(skills)} skills and {len(commands)} commands ({semantic}, {graph}).")
     return 0
 
 
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""Search skills or commands from the shell with the Playground's finder.
+
+Why this exists
+---------------
+`find-a-skill.sh` and `find-a-command.sh` used to run `awk` several times per
+file on every search, hundreds of subprocesses for the 77 skills. Both now
+call this script. It ranks in one process with `skill_finder.Finder`, the
+same ranker as Find My Skill: the same field weights, typo correction, and
+BM25F mode, plus `--ranking graph` for skills, which orders matches after the
+best one by `catalog/skills-graph.json`. A query therefore ranks the same in
+the shell as in the web app.
+
+Each file's finder fields (normalized text and term counts) are cached in
+`.cache/finder-index.json`, keyed by the file's SHA-256. After the first run,
+a search hashes the files, loads that index, and re-indexes only files edited
+since, so results are never stale.
+
+The wrappers pass their own name in `SEARCH_LIBRARY_PROG`, so usage and error
+messages name the script that was run. Bad options print an `Error:` line and
+exit 1, and an exact `--name` ranks first even with a query, as in the shell
+versions.
+
+Usage:
+    python3 scripts/search-library.py skills pricing
+    python3 scripts/search-library.py skills --type workflow --json roadmap
+    python3 scripts/search-library.py commands --uses prd-development
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NoReturn
+
+from skill_finder import (
+    Finder,
+    Ranked,
+    SkillGraph,
+    field_term_counts,
+    match_reasons,
+    normalize_text,
+    purpose_excerpt,
+    search_text,
+    select_page,
+)
+from skill_library import PROJECT_ROOT, ParsedFile, SectionMap, load_library_snapshot, split_sections
+
+INDEX_PATH = PROJECT_ROOT / ".cache" / "finder-index.json"
+SKILL_GRAPH_PATH = PROJECT_ROOT / "catalog" / "skills-graph.json"
+INDEX_VERSION = 1
+SKILL_TYPES = ("component", "interactive", "workflow")
+RANKINGS = ("weighted", "bm25f")
+SKILL_RANKINGS = RANKINGS + ("graph",)
+DEFAULT_LIMIT = 25
+# With a query, the entry named exactly `--name` scores this far above the best match.
+EXACT_NAME_BONUS = 250
+
+
+@dataclass(frozen=True)
+class Entry:
+    """One skill or command as the CLI lists it."""
+
+    name: str
+    path: str
+    type: str
+    description: str
+    best_for: tuple[str, ...]
+    scenarios: tuple[str, ...]
+    uses: tuple[str, ...]
+    parsed: ParsedFile
+
+
+def skill_entry(parsed: ParsedFile, root: Path) -> Entry | None:
+    fm = parsed.frontmatter
+    if fm is None:
+        return None
+    return Entry(
+        name=fm.get("name", parsed.path.parent.name),
+        path=str(parsed.path.relative_to(root)),
+        type=fm.get("type", "component"),
+        description=fm.get("description", ""),
+        best_for=tuple(fm.get("best_for") or ()),
+        scenarios=tuple(fm.get("scenarios") or ()),
+        uses=(),
+        parsed=parsed,
+    )
+
+
+def command_entry(parsed: ParsedFile, root: Path) -> Entry | None:
+    fm = parsed.frontmatter
+    if not fm or not fm.get("name"):
+        return None
+    return Entry(
+        name=fm["name"],
+        path=str(parsed.path.relative_to(root)),
+        type="command",
+        description=fm.get("description", ""),
+        best_for=(),
+        scenarios=(),
+        uses=tuple(fm.get("uses") or ()),
+        parsed=parsed,
+    )
+
+
+def finder_fields(entry: Entry) -> dict:
+    """Search text and term counts for one entry, the way the Playground compiles a skill."""
+    body = entry.parsed.body.strip()
+    intent, purpose = "", ""
+    if entry.type != "command":
+        intent = entry.parsed.frontmatter.get("intent", "")
+        purpose = purpose_excerpt(SectionMap(body, split_sections(body)).get("Purpose", ""))
+    text = search_text(entry.name, entry.description, entry.best_for, entry.scenarios, intent, purpose)
+    return {"search_text": text, "field_terms": field_term_counts(text, body)}
+
+
+def load_index_cache() -> dict[str, dict]:
+    try:
+        payload = json.loads(INDEX_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+        return {}
+    return payload.get("documents") or {}
+
+
+def write_index_cache(documents: dict[str, dict]) -> None:
+    """Atomically write the index cache; read-only checkouts just skip it."""
+    try:
+        INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = INDEX_PATH.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"version": INDEX_VERSION, "documents": documents}), encoding="utf-8")
+        os.replace(tmp_path, INDEX_PATH)
+    except OSError:
+        pass
+
+
+def build_finder(entries: list[Entry]) -> Finder:
+    """A Finder over `entries`, reusing cached finder fields by content hash.
+
+    Skills and commands share one cache file, so entries for the other kind
+    are kept when this one is written.
+    """
+    cached = load_index_cache()
+    fields = []
+    dirty = False
+    for entry in entries:
+        record = cached.get(entry.parsed.sha256)
+        if record is None:
+            record = cached[entry.parsed.sha256] = finder_fields(entry)
+            dirty = True
+        fields.append(record)
+    if dirty:
+        write_index_cache(cached)
+
+    def body_contains(i: int, phrase: str) -> bool:
+        return phrase in normalize_text(entries[i].parsed.body)
+
+    return Finder(
+        [entry.name for entry in entries],
+        [record["search_text"] for record in fields],
+        [record["field_terms"] for record in fields],
+        body_contains,
+    )
+
+
+def listing(entries: list[Entry], allowed: list[int], name_filter: str) -> list[Ranked]:
+    """Candidates without a query: an exact --name first, then alphabetical."""
+    scored: list[Ranked] = []
+    for i in allowed:
+        name = entries[i].name
+        if not name_filter:
+            scored.append((-50, name, i, "browse"))
+        elif name.lower() == name_filter:
+            scored.append((-250, name, i, "exact name"))
+        else:
+            scored.append((-120, name, i, "name"))
+    return scored
+
+
+def boost_exact_name(scored: list[Ranked], entries: list[Entry], name_filter: str) -> list[Ranked]:
+    """Rank the entry named exactly `--name` first, as the shell finders always have."""
+    if not scored or not name_filter:
+        return scored
+    top = -min(scored)[0]
+    boosted: list[Ranked] = []
+    for negated, name, i, match in scored:
+        if entries[i].name.lower() == name_filter:
+            negated, match = -(top + EXACT_NAME_BONUS), "exact name"
+        boosted.append((negated, name, i, match))
+    return boosted
+
+
+def format_score(score: float) -> str:
+    return str(score) if isinstance(score, int) else f"{score:.2f}"
+
+
+def print_text(kind: str, entries: list[Entry], page: list[Ranked], args: argparse.Namespace) -> None:
+    if kind == "commands" and not args.list_all:
+        print("Commands:")
+    for negated, _name, i, match in page:
+        entry = entries[i]
+        if kind == "commands":
+            if args.list_all:
+                print(f"- {entry.name} - {entry.description}\n  {entry.path}")
+            else:
+                print(f"- {entry.name} [score={format_score(-negated)}, match={match}]")
+                print(f"  {entry.description}\n  {entry.path}")
+            continue
+        print(f"- {entry.name} ({entry.type}) - {entry.description}\n  {entry.path}")
+        if not args.list_all:
+            print(f"  match={match} score={format_score(-negated)}")
+        if args.mode == "trigger":
+            if entry.best_for:
+                print(f"  best_for={'; '.join(entry.best_for)}")
+            if entry.scenarios:
+                print(f"  scenarios={'; '.join(entry.scenarios)}")
+
+
+def positive_int(value: str) -> int:
+    if not value.isdigit() or int(value) < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return int(value)
+
+
+class ArgumentParser(argparse.ArgumentParser):
+    """argparse with the shell finders' error style: an `Error:` line and exit status 1."""
+
+    def error(self, message: str) -> NoReturn:
+        print(f"Error: {message}", file=sys.stderr)
+        print(f"Run '{self.prog} --help' for usage.", file=sys.stderr)
+        raise SystemExit(1)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    # find-a-skill.sh and find-a-command.sh pass their own name for usage and errors.
+    wrapper = os.environ.get("SEARCH_LIBRARY_PROG")
+    parser = ArgumentParser(prog=wrapper, description=__doc__.splitlines()[0])
+    kinds = parser.add_subparsers(dest="kind", required=True)
+    for kind in ("skills", "commands"):
+        sub = kinds.add_parser(kind, prog=wrapper, help=f"Search {kind}.")
+        sub.add_argument("query", nargs="*", help="Words to search for.")
+        sub.add_argument("--keyword", action="append", default=[], help="More query words (same as positional).")
+        sub.add_argument("--name", default="", help="Only names containing this text; an exact name ranks first.")
+        sub.add_argument(
+            "--ranking",
+            choices=SKILL_RANKINGS if kind == "skills" else RANKINGS,
+            default="weighted",
+            help="Find My Skill ranking mode.",
+        )
+        sub.add_argument("--limit", type=positive_int, default=DEFAULT_LIMIT, help="Max results (default 25).")
+        sub.add_argument("--list-all", action="store_true", help="List every match alphabetically.")
+        sub.add_argument("--json", action="store_true", help="Print results as JSON.")
+        if kind == "skills":
+            sub.add_argument("--type", type=str.lower, choices=SKILL_TYPES, help="Only skills of this type.")
+            sub.add_argument(
+                "--mode",
+                type=str.lower,
+                choices=("default", "trigger"),
+                default="default",
+                help="trigger also prints best_for and scenarios.",
+            )
+        else:
+            sub.add_argument("--uses", default="", help="Only commands that use this skill.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    snapshot = load_library_snapshot()
+    if args.kind == "skills":
+        entries = [skill_entry(parsed, snapshot.root) for parsed in snapshot.skills]
+    else:
+        entries = [command_entry(parsed, snapshot.root) for parsed in snapshot.commands]
+    entries = [entry for entry in entries if entry is not None]
+
+    name_filter = args.name.lower()
+    type_filter = getattr(args, "type", None)
+    uses_filter = getattr(args, "uses", "").lower()
+    allowed = [
+        i
+        for i, entry in enumerate(entries)
+        if (not type_filter or entry.type.lower() == type_filter)
+        and (not name_filter or name_filter in entry.name.lower())
+        and (not uses_filter or uses_filter in (skill.lower() for skill in entry.uses))
+    ]
+
+    query = " ".join(args.query + args.keyword)
+    corrections: dict[str, tuple[str, ...]] = {}
+    if args.list_all or not query:
+        scored = listing(entries, allowed, "" if args.list_all else name_filter)
+        page = select_page(scored, args.limit)
+        reasons = {i: [] for _negated, _name, i, _match in page}
+    else:
+        ranking = build_finder(entries).rank(query, allowed, args.ranking)
+        scored, corrections = ranking.scored, ranking.corrections
+        scored = boost_exact_name(scored, entries, name_filter)
+        presorted = False
+        if args.ranking == "graph":
+            graph = SkillGraph.load(SKILL_GRAPH_PATH)
+            if graph is None:
+                print(f"No skill graph at {SKILL_GRAPH_PATH}; ranking by weighted fields.", file=sys.stderr)
+            else:
+                scored, presorted = graph.rerank(scored), True
+        page = select_page(scored, args.limit, presorted=presorted)
+        reasons = {i: match_reasons(ranking.fields_hit(i)) for _negated, _name, i, _match in page}
+
+    if args.json:
+        results = []
+        for negated, _name, i, match in page:
+            entry = entries[i]
+            item = {"name": entry.name, "type": entry.type, "description": entry.description, "path": entry.path}
+            item.update({"score": -negated, "match": match, "reasons": reasons[i]})
+            if args.kind == "skills":
+                item.update({"best_for": list(entry.best_for), "scenarios": list(entry.scenarios)})
+            else:
+                item["uses"] = list(entry.uses)
+            results.append(item)
+        payload = {"query": query, "total": len(scored), "corrections": corrections, "results": results}
+        print(json.dumps(payload, indent=2))
+        return 0 if page else 1
+
+    if not page:
+        print(f"No matching {args.kind} found.")
+        return 1
+    if corrections:
+        spellings = "; ".join(f"{typo} -> {', '.join(words)}" for typo, words in corrections.items())
+        print(f"Also searched close spellings: {spellings}", file=sys.stderr)
+    print_text(args.kind, entries, page, args)
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except BrokenPipeError:  # e.g. `find-a-skill.sh --list-all | head`
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise SystemExit(0)
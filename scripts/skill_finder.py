@@ -0,0 +1,1306 @@
+"""Shared text matching and term index for skill search.
+
+`tokens_match()` defines when a query word counts as a hit on a skill word:
+an exact match, a prefix match once the prefix is at least 4 characters, or
+a substring match between words of at least 5 characters. `TermIndex` gives
+the same answers without scanning every skill. It is an inverted index from
+each term to the documents and fields that contain it, plus a sorted term
+list for prefix lookups and a sorted suffix list for substring lookups
+(built once `SUFFIX_INDEX_AFTER` lookups have scanned the vocabulary).
+A query word that is neither indexed nor the start of an indexed word is
+treated as a likely typo. A trigram index over the vocabulary proposes the
+few terms that share enough character trigrams with it, and only those are
+checked against the edit-distance budget from `typo_distance()`.
+
+`BM25FIndex` is the alternative ranking backend. It uses field-weighted,
+length-normalized BM25 over the same per-field term counts, precomputed so
+scoring a query is a sparse sum over postings rather than a text scan.
+
+`sparse_product()` scores many queries at once: one sparse row of postings
+per distinct query term, summed for a whole block of queries by one
+`numpy.bincount`.
+
+`SemanticIndex` is the offline semantic mode, latent semantic analysis
+(LSA). TF-IDF vectors are projected onto the top singular vectors of the
+skills-by-terms matrix, so "churn" can land near skills that talk about
+"retention". `generate-catalog.py` fits it and writes it to
+`catalog/skills-semantic.npz`. The app only loads it and scores a query
+with a matrix-vector product. NumPy is imported on first use.
+
+Phrase matches against long text (skill bodies) need the text itself.
+`PhraseCorpus` keeps it in one memory-mapped file keyed by content hash, so
+checking thousands of candidates is a byte search per document rather than
+a file read and re-normalize each, and the Python heap never holds it.
+
+`Finder` is Find My Skill's lexical ranker: weighted field matching or
+BM25F over one `TermIndex`, with phrase hits and typo correction. The
+Playground builds one per published library, and `search-library.py` (behind
+`find-a-skill.sh` and `find-a-command.sh`) builds one per search, so a query
+ranks the same in both. `LiveSearch` wraps a `Finder` for search-as-you-type:
+each keystroke's query is narrowed from the longest recent query it
+contains rather than ranked from scratch.
+
+`SkillGraph` is the related-skill graph: skills linked by references and by
+the commands that use them together, with precomputed neighbor lists and
+PageRank centrality. `generate-catalog.py` writes it to
+`catalog/skills-graph.json`. The opt-in "graph" ranking orders matches with
+`SkillGraph.rerank()`, which moves the top match's neighbors up without
+changing any score or reading skill files at query time.
+
+Import from a script in this folder with:
+
+    from skill_finder import Finder, TermIndex, normalize_text, tokenize_text
+"""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import io
+import json
+import math
+import mmap
+import os
+import re
+import tempfile
+import zipfile
+from array import array
+from bisect import bisect_left
+from collections import Counter, deque
+from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+TERM_RE = re.compile(r"[a-z0-9]+")
+MATCH_CACHE_SIZE = 4096
+# Substring lookups answered by scanning the vocabulary before TermIndex
+# builds its suffix list; a one-off CLI search never pays for the build.
+SUFFIX_INDEX_AFTER = 32
+# Earlier queries a `LiveSearch` keeps to narrow the next one from.
+LIVE_SEARCH_HISTORY = 16
+
+# Find My Skill fields:
+# (label, index field, phrase bonus, per-token weight, match-reason label)
+FINDER_FIELDS = (
+    ("name", "name", 320, 120, None),
+    ("trigger metadata", "description", 240, 45, "description"),
+    ("best for", "best_for", 220, 55, "best for"),
+    ("scenarios", "scenarios", 220, 55, "scenarios"),
+    ("intent", "intent", 180, 30, "intent"),
+    ("purpose", "purpose", 140, 24, "purpose"),
+    ("skill body", "body", 80, 8, None),
+)
+
+# BM25F field weights: a term in the name counts as much as five in the body
+# before saturation. Body length normalization does the rest.
+BM25F_FIELD_WEIGHTS = {
+    "name": 5.0,
+    "description": 3.0,
+    "best_for": 2.5,
+    "scenarios": 2.5,
+    "intent": 1.5,
+    "purpose": 1.5,
+    "body": 1.0,
+}
+
+# Offline semantic model: field repeat counts, latent dimensions, vocabulary cap.
+SEMANTIC_FIELD_WEIGHTS = {"name": 3, "description": 3, "best_for": 2, "scenarios": 2, "intent": 2, "body": 1}
+SEMANTIC_DIMENSIONS = 48
+SEMANTIC_MAX_FEATURES = 4096
+SEMANTIC_INDEX_VERSION = 1
+
+# Skill graph (`SkillGraph`): edge weights for a reference between two skills
+# and for each command using both, neighbors kept per skill, and PageRank.
+GRAPH_VERSION = 1
+GRAPH_REFERENCE_WEIGHT = 1.0
+GRAPH_COMMAND_WEIGHT = 0.5
+GRAPH_NEIGHBORS = 10
+GRAPH_DAMPING = 0.85
+GRAPH_ITERATIONS = 100
+# Ordering after the best match, in units of its score: proximity to it,
+# the proximity granted for sharing its theme, and centrality.
+GRAPH_PROXIMITY_WEIGHT = 0.3
+GRAPH_THEME_PROXIMITY = 0.2
+GRAPH_CENTRALITY_WEIGHT = 0.05
+SKILL_REFERENCE_RE = re.compile(r"skills/([a-z0-9][a-z0-9-]*)/SKILL\.md")
+
+FINDER_STOP_WORDS = {
+    "a",
+    "an",
+    "and",
+    "are",
+    "at",
+    "be",
+    "by",
+    "do",
+    "for",
+    "from",
+    "help",
+    "how",
+    "i",
+    "if",
+    "in",
+    "into",
+    "is",
+    "it",
+    "me",
+    "my",
+    "need",
+    "new",
+    "of",
+    "on",
+    "or",
+    "our",
+    "that",
+    "the",
+    "this",
+    "to",
+    "user",
+    "users",
+    "we",
+    "what",
+    "when",
+    "with",
+}
+
+
+def normalize_text(value: str) -> str:
+    return re.sub(r"\s+", " ", (value or "").strip().lower())
+
+
+def is_token(term: str) -> bool:
+    """True for terms that take part in token matching (not stop words or single characters)."""
+    return len(term) > 1 and term not in FINDER_STOP_WORDS
+
+
+def tokenize_text(value: str) -> list[str]:
+    return [token for token in TERM_RE.findall(normalize_text(value)) if is_token(token)]
+
+
+def text_terms(normalized: str) -> frozenset[str]:
+    """Every distinct alphanumeric run in already-normalized text, stop words included."""
+    return frozenset(TERM_RE.findall(normalized))
+
+
+def term_counts(normalized: str) -> dict[str, int]:
+    """Occurrences of each alphanumeric run in already-normalized text."""
+    return dict(Counter(TERM_RE.findall(normalized)))
+
+
+def typo_distance(token: str) -> int:
+    """Edits tolerated when correcting `token`: none under 4 characters, 1 up to 7, then 2."""
+    if len(token) < 4:
+        return 0
+    return 1 if len(token) <= 7 else 2
+
+
+def trigrams(term: str) -> set[str]:
+    """Character trigrams of `term` padded with spaces, so ends count too."""
+    padded = f" {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (an adjacent swap is one edit), capped at limit + 1."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+def tokens_match(query_token: str, candidate_token: str) -> bool:
+    if query_token == candidate_token:
+        return True
+    if len(query_token) >= 4 and candidate_token.startswith(query_token):
+        return True
+    if len(candidate_token) >= 4 and query_token.startswith(candidate_token):
+        return True
+    if len(query_token) >= 5 and len(candidate_token) >= 5:
+        if query_token in candidate_token or candidate_token in query_token:
+            return True
+    return False
+
+
+class TermIndex:
+    """Inverted index over per-document, per-field term sets.
+
+    `documents[i][field]` holds every alphanumeric run in that field, stop
+    words included, so phrase lookups can use it too. Any collection works,
+    including a term -> count mapping. Token lookups only
+    return terms that pass `is_token()`, which is what `tokenize_text()` keeps.
+    """
+
+    def __init__(self, documents: Sequence[Mapping[str, Collection[str]]]) -> None:
+        postings: dict[str, dict[str, list[int]]] = {}
+        for doc_id, fields in enumerate(documents):
+            for field, terms in fields.items():
+                field_postings = postings.setdefault(field, {})
+                for term in terms:
+                    field_postings.setdefault(term, []).append(doc_id)
+
+        vocabulary: set[str] = set()
+        for field_postings in postings.values():
+            vocabulary.update(field_postings)
+
+        self.documents = documents
+        self._postings = postings
+        self._vocabulary = vocabulary
+        self._sorted_terms = sorted(vocabulary)
+        self._substring_lookups = 0
+        self._containing_cache: dict[str, frozenset[str]] = {}
+        self._match_cache: dict[str, frozenset[str]] = {}
+        self._correction_cache: dict[str, frozenset[str]] = {}
+        self._substitutions: dict[str, frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @functools.cached_property
+    def _suffix_terms(self) -> dict[str, list[str]]:
+        """Every suffix of every term -> the terms ending with it; built on the first substring lookup."""
+        suffix_terms: dict[str, list[str]] = {}
+        for term in self._vocabulary:
+            for i in range(len(term)):
+                suffix_terms.setdefault(term[i:], []).append(term)
+        return suffix_terms
+
+    @functools.cached_property
+    def _suffix_keys(self) -> list[str]:
+        return sorted(self._suffix_terms)
+
+    @functools.cached_property
+    def _trigram_terms(self) -> dict[str, list[str]]:
+        """Trigram -> tokens containing it; built on the first spelling correction."""
+        trigram_terms: dict[str, list[str]] = {}
+        for term in self._sorted_terms:
+            if len(term) >= 3 and is_token(term):
+                for gram in trigrams(term):
+                    trigram_terms.setdefault(gram, []).append(term)
+        return trigram_terms
+
+    # Term lookups ------------------------------------------------------------
+
+    def terms_with_prefix(self, prefix: str) -> set[str]:
+        found = set()
+        for i in range(bisect_left(self._sorted_terms, prefix), len(self._sorted_terms)):
+            term = self._sorted_terms[i]
+            if not term.startswith(prefix):
+                break
+            found.add(term)
+        return found
+
+    def _use_suffix_index(self) -> bool:
+        self._substring_lookups += 1
+        return self._substring_lookups > SUFFIX_INDEX_AFTER
+
+    def terms_containing(self, fragment: str) -> frozenset[str]:
+        """Every indexed term with `fragment` inside it.
+
+        A word typed one character at a time refines the previous answer: a
+        term containing "roadm" also contains "road", so only those terms are
+        checked rather than the whole vocabulary.
+        """
+        found = self._containing_cache.get(fragment)
+        if found is not None:
+            return found
+        shorter = self._containing_cache.get(fragment[:-1])
+        if shorter is not None:
+            found = frozenset(term for term in shorter if fragment in term)
+        elif not self._use_suffix_index():
+            found = frozenset(term for term in self._sorted_terms if fragment in term)
+        else:
+            matches: set[str] = set()
+            keys = self._suffix_keys
+            for i in range(bisect_left(keys, fragment), len(keys)):
+                if not keys[i].startswith(fragment):
+                    break
+                matches.update(self._suffix_terms[keys[i]])
+            found = frozenset(matches)
+        if len(self._containing_cache) >= MATCH_CACHE_SIZE:
+            self._containing_cache.clear()
+        self._containing_cache[fragment] = found
+        return found
+
+    def terms_ending_with(self, fragment: str) -> set[str]:
+        if not self._use_suffix_index():
+            return {term for term in self._sorted_terms if term.endswith(fragment)}
+        return set(self._suffix_terms.get(fragment, ()))
+
+    def spelling_corrections(self, query_token: str) -> frozenset[str]:
+        """The closest indexed tokens within `typo_distance()` edits of `query_token`.
+
+        Candidates must share enough trigrams to survive that many edits (one
+        edit changes at most three, an adjacent swap four), so the distance
+        check runs on a handful of terms rather than the whole vocabulary.
+        """
+        cached = self._correction_cache.get(query_token)
+        if cached is not None:
+            return cached
+
+        limit = typo_distance(query_token)
+        found: frozenset[str] = frozenset()
+        if limit:
+            grams = trigrams(query_token)
+            shared: Counter = Counter()
+            for gram in grams:
+                shared.update(self._trigram_terms.get(gram, ()))
+            needed = max(1, len(grams) - 4 * limit)
+            distances = {
+                term: edit_distance(query_token, term, limit)
+                for term, count in shared.items()
+                if count >= needed and term != query_token
+            }
+            best = min(distances.values(), default=limit + 1)
+            if best <= limit:
+                found = frozenset(term for term, distance in distances.items() if distance == best)
+
+        if len(self._correction_cache) >= MATCH_CACHE_SIZE:
+            self._correction_cache.clear()
+        self._correction_cache[query_token] = found
+        return found
+
+    def matching_tokens(self, query_token: str) -> frozenset[str]:
+        """Every indexed token `t` with `tokens_match(query_token, t)`.
+
+        A query token that is neither indexed nor the start of an indexed
+        token is likely misspelled, so the tokens matching its
+        `spelling_corrections()` are added too. Substring matches alone (say
+        "ation" inside "prioritsation") do not count as recognizing the word.
+        """
+        cached = self._match_cache.get(query_token)
+        if cached is not None:
+            return cached
+
+        q = query_token
+        vocabulary = self._vocabulary
+        found: set[str] = {q} if q in vocabulary else set()
+        if len(q) >= 4:
+            found |= self.terms_with_prefix(q)
+        recognized = any(is_token(term) for term in found)
+        if len(q) >= 4:
+            found.update(q[:end] for end in range(4, len(q)) if q[:end] in vocabulary)
+        if len(q) >= 5:
+            found.update(term for term in self.terms_containing(q) if len(term) >= 5)
+            found.update(
+                q[start:end]
+                for start in range(len(q) - 4)
+                for end in range(start + 5, len(q) + 1)
+                if q[start:end] in vocabulary
+            )
+        result = frozenset(term for term in found if is_token(term))
+        corrections = frozenset() if recognized else self.spelling_corrections(q)
+        if corrections:
+            result = result.union(*(self.matching_tokens(term) for term in corrections))
+            self._substitutions[q] = corrections
+
+        if len(self._match_cache) >= MATCH_CACHE_SIZE:
+            self._match_cache.clear()
+            self._substitutions = {q: self._substitutions[q]} if q in self._substitutions else {}
+        self._match_cache[query_token] = result
+        return result
+
+    def substitutions(self, query_token: str) -> frozenset[str]:
+        """Corrections `matching_tokens()` used in place of `query_token` (empty if it matched as typed)."""
+        self.matching_tokens(query_token)
+        return self._substitutions.get(query_token, frozenset())
+
+    # Document lookups --------------------------------------------------------
+
+    def documents_with(self, field: str, terms: Iterable[str]) -> set[int]:
+        field_postings = self._postings.get(field, {})
+        found: set[int] = set()
+        for term in terms:
+            found.update(field_postings.get(term, ()))
+        return found
+
+    def phrase_candidates(self, field: str, phrase: str) -> set[int] | None:
+        """Documents whose `field` could contain `phrase` as a substring.
+
+        A superset: callers still check the text. Each alphanumeric run inside
+        the phrase must be a whole term, the first run may end a longer term,
+        and the last run may start one. Returns None when the phrase has no
+        alphanumeric run to anchor on.
+        """
+        runs = list(TERM_RE.finditer(phrase))
+        if not runs:
+            return None
+        field_postings = self._postings.get(field, {})
+
+        constraints: list[set[str]] = []
+        for run in runs:
+            fragment = run.group()
+            starts_phrase, ends_phrase = run.start() == 0, run.end() == len(phrase)
+            if starts_phrase and ends_phrase:
+                terms = self.terms_containing(fragment)
+            elif starts_phrase:
+                terms = self.terms_ending_with(fragment)
+            elif ends_phrase:
+                terms = self.terms_with_prefix(fragment)
+            else:
+                terms = {fragment}
+            terms = {term for term in terms if term in field_postings}
+            if not terms:
+                return set()
+            constraints.append(terms)
+
+        constraints.sort(key=lambda terms: sum(len(field_postings[term]) for term in terms))
+        candidates = self.documents_with(field, constraints[0])
+        for terms in constraints[1:]:
+            candidates = {
+                doc_id
+                for doc_id in candidates
+                if any(term in self.documents[doc_id].get(field, ()) for term in terms)
+            }
+            if not candidates:
+                break
+        return candidates
+
+    def phrase_is_exact(self, phrase: str) -> bool:
+        """True when `phrase_candidates` is exact rather than a superset (one bare run)."""
+        return TERM_RE.fullmatch(phrase) is not None
+
+
+class BM25FIndex:
+    """Field-weighted BM25 (BM25F) over per-document, per-field term counts.
+
+    At build time each field's term frequency is divided by that field's
+    length normalization, multiplied by the field weight, and summed into one
+    pseudo-frequency per (term, document). `score()` adds up those weights
+    for the terms each query token matches, then saturates once with `k1`, so
+    a long body cannot outscore a short field just by repeating a word.
+    """
+
+    def __init__(
+        self,
+        documents: Sequence[Mapping[str, Mapping[str, int]]],
+        field_weights: Mapping[str, float],
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        lengths = {
+            field: [sum(doc.get(field, {}).values()) for doc in documents] for field in field_weights
+        }
+        average = {field: (sum(values) / len(values) if values else 0) or 1.0 for field, values in lengths.items()}
+
+        pseudo: dict[str, dict[int, float]] = {}
+        for doc_id, fields in enumerate(documents):
+            for field, weight in field_weights.items():
+                counts = fields.get(field)
+                if not counts or not weight:
+                    continue
+                scale = weight / (1 - b + b * lengths[field][doc_id] / average[field])
+                for term, count in counts.items():
+                    if is_token(term):
+                        per_doc = pseudo.setdefault(term, {})
+                        per_doc[doc_id] = per_doc.get(doc_id, 0.0) + count * scale
+
+        self.size = len(documents)
+        self.k1 = k1
+        self._postings = {
+            term: (array("i", per_doc), array("d", per_doc.values())) for term, per_doc in pseudo.items()
+        }
+
+    def score(
+        self, term_groups: Iterable[Iterable[str]], allowed: Collection[int] | None = None
+    ) -> dict[int, float]:
+        """BM25F score per document with a positive score.
+
+        Each group is the set of indexed terms one query token matches; its
+        frequency and document frequency are taken over the whole group.
+        """
+        scores: dict[int, float] = {}
+        for terms in term_groups:
+            for doc_id, value in self.group_scores(terms).items():
+                if allowed is None or doc_id in allowed:
+                    scores[doc_id] = scores.get(doc_id, 0.0) + value
+        return scores
+
+    def group_scores(self, terms: Iterable[str]) -> dict[int, float]:
+        """One query token's saturated, IDF-weighted contribution per document."""
+        frequency: dict[int, float] = {}
+        for term in terms:
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            for doc_id, weight in zip(*posting):
+                frequency[doc_id] = frequency.get(doc_id, 0.0) + weight
+        if not frequency:
+            return {}
+        df = len(frequency)
+        idf = math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+        return {
+            doc_id: idf * value * (self.k1 + 1) / (value + self.k1) for doc_id, value in frequency.items()
+        }
+
+
+def search_text(
+    name: str, description: str, best_for: Iterable[str], scenarios: Iterable[str], intent: str, purpose: str
+) -> dict[str, str]:
+    """Normalized text of every FINDER_FIELDS field except the body."""
+    return {
+        "name": normalize_text(name),
+        "description": normalize_text(description),
+        "best_for": normalize_text(" ".join(best_for)),
+        "scenarios": normalize_text(" ".join(scenarios)),
+        "intent": normalize_text(intent),
+        "purpose": normalize_text(purpose),
+    }
+
+
+def field_term_counts(fields: Mapping[str, str], body: str) -> dict[str, dict[str, int]]:
+    """Term counts per field plus the body, stop words included.
+
+    Stop words stay so the finder can rule out a body phrase match, and weigh
+    body hits, without loading the body.
+    """
+    counts = {field: term_counts(text) for field, text in fields.items()}
+    counts["body"] = term_counts(normalize_text(body))
+    return counts
+
+
+def purpose_excerpt(purpose: str) -> str:
+    """First non-empty paragraph of a Purpose section."""
+    return next((paragraph.strip() for paragraph in purpose.split("\n\n") if paragraph.strip()), "")
+
+
+def match_reasons(fields: Iterable[str]) -> list[str]:
+    """Up to three match-reason labels for the fields a document was hit on."""
+    fields = set(fields)
+    return [reason for _label, field, _bonus, _weight, reason in FINDER_FIELDS if reason and field in fields][:3]
+
+
+# A scored candidate: (negated score, name, document index, match label).
+# Tuples sort best-first, ties by name, so `heapq.nsmallest` selects a page.
+Ranked = tuple[float, str, int, str]
+
+
+def select_page(scored: list[Ranked], k: int | None, offset: int = 0, presorted: bool = False) -> list[Ranked]:
+    """The `k` best candidates from `offset` on, or all of them when `k` is None.
+
+    With `presorted`, `scored` is already in display order (as from
+    `SkillGraph.rerank`) and is sliced as is.
+    """
+    if presorted:
+        return scored[offset:] if k is None else scored[offset:offset + k]
+    if k is None:
+        return sorted(scored)[offset:]
+    return heapq.nsmallest(offset + k, scored)[offset:]
+
+
+@dataclass(frozen=True)
+class QueryState:
+    """What `Finder.rank` can reuse for a later query that extends this one.
+
+    `token_docs[token][field]` holds the allowed documents a query token hits
+    in that field. `phrase_docs[field]` holds the documents whose field
+    contains the whole normalized query, or is None when no phrase lookup ran.
+    """
+
+    query_lc: str
+    allowed: frozenset[int]
+    token_docs: Mapping[str, Mapping[str, frozenset[int]]]
+    phrase_docs: Mapping[str, frozenset[int]] | None
+
+
+@dataclass(frozen=True)
+class Ranking:
+    """Every scored candidate for one query, before paging.
+
+    `corrections` maps misspelled query words to the words searched instead.
+    `state` records which documents each query word and the whole phrase hit.
+    """
+
+    scored: list[Ranked]
+    corrections: dict[str, tuple[str, ...]]
+    state: QueryState
+
+    def fields_hit(self, doc_id: int) -> set[str]:
+        """Fields of `doc_id` that a query word or the whole query matched."""
+        fields = {
+            field for docs in self.state.token_docs.values() for field, hits in docs.items() if doc_id in hits
+        }
+        if self.state.phrase_docs:
+            fields.update(field for field, hits in self.state.phrase_docs.items() if doc_id in hits)
+        return fields
+
+
+class Finder:
+    """Find My Skill ranking over a fixed list of documents.
+
+    `search_texts[i]` is document i's `search_text()` and `field_terms[i]` its
+    `field_term_counts()`. `body_contains(i, phrase)` settles multi-word body
+    phrases the term index cannot; the Playground answers it from a
+    `PhraseCorpus`, the CLI from the file it already read. The term index and
+    BM25F statistics are built on first use.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        search_texts: Sequence[Mapping[str, str]],
+        field_terms: Sequence[Mapping[str, Mapping[str, int]]],
+        body_contains: Callable[[int, str], bool],
+    ) -> None:
+        self.names = names
+        self.search_texts = search_texts
+        self.field_terms = field_terms
+        self.body_contains = body_contains
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @functools.cached_property
+    def index(self) -> TermIndex:
+        return TermIndex(self.field_terms)
+
+    @functools.cached_property
+    def bm25f(self) -> BM25FIndex:
+        return BM25FIndex(self.field_terms, BM25F_FIELD_WEIGHTS)
+
+    def rank(
+        self,
+        query: str,
+        allowed: Iterable[int],
+        ranking: str = "weighted",
+        previous: QueryState | None = None,
+    ) -> Ranking:
+        """Score the `allowed` documents that match `query`.
+
+        Only documents with a token hit or a phrase match in some field are
+        scored, so cost follows the number of matches rather than the number
+        of documents. `ranking` is "weighted" or "bm25f". BM25F scores query
+        words only, so a query with no words (all stop words) is weighted.
+        An empty query lists every allowed document.
+
+        `previous` is the `Ranking.state` of an earlier query over the same
+        documents. Its query words are not looked up again, and when this
+        query contains the earlier one, only the earlier phrase matches can
+        still match the longer phrase, so only they are checked.
+        """
+        query_lc = normalize_text(query)
+        query_tokens = tokenize_text(query)
+        allowed_set = frozenset(allowed)
+        if previous is not None and previous.allowed != allowed_set:
+            previous = None
+        corrections: dict[str, tuple[str, ...]] = {}
+        if not query_lc:
+            scored: list[Ranked] = [(-50, self.names[i], i, "browse") for i in allowed_set]
+            return Ranking(scored, corrections, QueryState(query_lc, allowed_set, {}, None))
+
+        index = self.index
+        token_docs: dict[str, Mapping[str, frozenset[int]]] = {}
+        for query_token in dict.fromkeys(query_tokens):
+            docs = previous.token_docs.get(query_token) if previous else None
+            if docs is None:
+                docs = self.token_documents(query_token, allowed_set)
+            token_docs[query_token] = docs
+            substitutes = index.substitutions(query_token)
+            if substitutes:
+                corrections[query_token] = tuple(sorted(substitutes))
+
+        phrase_docs: dict[str, frozenset[int]] | None = None
+        if ranking == "bm25f" and query_tokens:
+            scored = self.score_bm25f(query_lc, query_tokens, token_docs)
+        else:
+            narrower = None
+            if previous is not None and previous.phrase_docs is not None and previous.query_lc in query_lc:
+                narrower = previous.phrase_docs
+            phrase_docs = {}
+            for _label, field, _bonus, _weight, _reason in FINDER_FIELDS:
+                within = None if narrower is None else narrower.get(field, frozenset())
+                phrase_docs[field] = frozenset(self.phrase_matches(field, query_lc, allowed_set, within))
+            scored = self.score_weighted(query_lc, query_tokens, token_docs, phrase_docs)
+        return Ranking(scored, corrections, QueryState(query_lc, allowed_set, token_docs, phrase_docs))
+
+    def token_documents(self, query_token: str, allowed: Collection[int]) -> dict[str, frozenset[int]]:
+        """Field -> the `allowed` documents `query_token` hits there."""
+        terms = self.index.matching_tokens(query_token)
+        docs = {}
+        if terms:
+            for _label, field, _bonus, _weight, _reason in FINDER_FIELDS:
+                hits = self.index.documents_with(field, terms).intersection(allowed)
+                if hits:
+                    docs[field] = frozenset(hits)
+        return docs
+
+    def phrase_matches(
+        self, field: str, query_lc: str, allowed: Iterable[int], within: Iterable[int] | None = None
+    ) -> set[int]:
+        """Documents whose `field` contains the normalized query as a phrase.
+
+        `within` is a small set already known to hold every match (say, the
+        matches for a shorter part of the query); only those documents are
+        checked and the index lookup is skipped.
+        """
+        if within is not None:
+            if field != "body":
+                return {i for i in within if query_lc in self.search_texts[i][field]}
+            return {i for i in within if self.body_contains(i, query_lc)}
+        index = self.index
+        candidates = index.phrase_candidates(field, query_lc)
+        if candidates is None:
+            candidates = set(range(len(self)))
+        candidates &= set(allowed)
+        if field != "body":
+            return {i for i in candidates if query_lc in self.search_texts[i][field]}
+        if index.phrase_is_exact(query_lc):
+            return candidates
+        return {i for i in candidates if self.body_contains(i, query_lc)}
+
+    @staticmethod
+    def hit_counts(token_docs: Mapping[str, Mapping[str, frozenset[int]]]) -> tuple[dict[str, Counter], Counter]:
+        """Per field, how many query words hit each document; and how many hit it in any field.
+
+        Counting whole document sets keeps the per-query work in C rather
+        than building a field -> words map for every candidate.
+        """
+        field_hits = {field: Counter() for _label, field, _bonus, _weight, _reason in FINDER_FIELDS}
+        covered: Counter = Counter()
+        for docs in token_docs.values():
+            for field, hits in docs.items():
+                field_hits[field].update(hits)
+            covered.update(frozenset().union(*docs.values()))
+        return field_hits, covered
+
+    def score_weighted(
+        self,
+        query_lc: str,
+        query_tokens: list[str],
+        token_docs: Mapping[str, Mapping[str, frozenset[int]]],
+        phrase_docs: Mapping[str, frozenset[int]],
+    ) -> list[Ranked]:
+        """FINDER_FIELDS points for phrase and token hits, plus a coverage bonus."""
+        field_hits, covered = self.hit_counts(token_docs)
+        fields = [
+            (label, phrase_docs[field], field_hits[field].get, bonus, weight)
+            for label, field, bonus, weight, _reason in FINDER_FIELDS
+        ]
+        candidates = set(covered).union(*phrase_docs.values())
+        scored: list[Ranked] = []
+        for i in candidates:
+            name = self.names[i]
+            if self.search_texts[i]["name"] == query_lc:
+                scored.append((-400, name, i, "exact name"))
+                continue
+
+            score = 0
+            match = "browse"
+            best_field_score = 0
+            for label, phrases, hits, phrase_bonus, token_weight in fields:
+                field_score = (phrase_bonus if i in phrases else 0) + hits(i, 0) * token_weight
+                if field_score > best_field_score:
+                    best_field_score = field_score
+                    match = label
+                score += field_score
+
+            if not score:
+                continue
+            matched_tokens = covered.get(i, 0)
+            if query_tokens:
+                coverage = matched_tokens / max(len(query_tokens), 1)
+                score += int(coverage * 100)
+            if len(query_tokens) >= 3 and matched_tokens < 2:
+                continue
+            scored.append((-score, name, i, match))
+        return scored
+
+    def score_bm25f(
+        self, query_lc: str, query_tokens: list[str], token_docs: Mapping[str, Mapping[str, frozenset[int]]]
+    ) -> list[Ranked]:
+        """BM25F scores for the documents with a token hit.
+
+        An exact name match still comes first. `match` is the highest-weighted
+        field the document was hit on, and the same coverage rule as the
+        weighted scorer drops one-word hits on queries of three or more words.
+        """
+        index = self.index
+        field_hits, covered = self.hit_counts(token_docs)
+        scores = self.bm25f.score((index.matching_tokens(token) for token in dict.fromkeys(query_tokens)), covered)
+        top_score = max(scores.values(), default=0.0)
+
+        scored: list[Ranked] = []
+        for i, score in scores.items():
+            name = self.names[i]
+            if self.search_texts[i]["name"] == query_lc:
+                scored.append((-(top_score + 1), name, i, "exact name"))
+                continue
+            if len(query_tokens) >= 3 and covered[i] < 2:
+                continue
+            match = next(
+                label for label, field, _bonus, _weight, _reason in FINDER_FIELDS if i in field_hits[field]
+            )
+            scored.append((-score, name, i, match))
+        return scored
+
+
+class LiveSearch:
+    """Search-as-you-type over one `Finder`, document filter, and ranking.
+
+    Each query starts from the longest recent query it contains, so typing
+    narrows the earlier phrase matches and reuses finished words instead of
+    ranking from scratch; after a backspace the shorter query is usually
+    still in the history. Keep one per typist, since the history follows a
+    single stream of edits.
+    """
+
+    def __init__(
+        self,
+        finder: Finder,
+        allowed: Iterable[int],
+        ranking: str = "weighted",
+        history: int = LIVE_SEARCH_HISTORY,
+    ) -> None:
+        self.finder = finder
+        self.allowed = frozenset(allowed)
+        self.ranking = ranking
+        self.history: deque[QueryState] = deque(maxlen=history)
+
+    def rank(self, query: str) -> Ranking:
+        query_lc = normalize_text(query)
+        previous = max(
+            (state for state in self.history if state.query_lc in query_lc),
+            key=lambda state: len(state.query_lc),
+            default=None,
+        )
+        ranking = self.finder.rank(query, self.allowed, self.ranking, previous)
+        if previous is None or previous.query_lc != query_lc:
+            self.history.append(ranking.state)
+        return ranking
+
+
+class PhraseCorpus:
+    """Normalized document text in one read-only memory map, keyed by content hash.
+
+    File layout: each document's UTF-8 text followed by a newline (normalized
+    text never contains one, so a phrase cannot match across documents), then
+    a JSON trailer of `{key: [start, end]}` spans, then the trailer length as
+    16 ASCII digits.
+    """
+
+    VERSION = 1
+    FOOTER_SIZE = 16
+
+    def __init__(self, mapped: mmap.mmap, spans: dict[str, list[int]]) -> None:
+        self._map = mapped
+        self.spans = spans
+
+    @classmethod
+    def open(cls, path: Path) -> PhraseCorpus | None:
+        """Map an existing corpus file, or None when missing or unreadable."""
+        try:
+            with open(path, "rb") as handle:
+                return cls._from_file(handle)
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def _from_file(cls, handle) -> PhraseCorpus | None:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            trailer_size = int(mapped[-cls.FOOTER_SIZE:])
+            trailer = json.loads(mapped[len(mapped) - cls.FOOTER_SIZE - trailer_size:-cls.FOOTER_SIZE])
+            if trailer.get("version") == cls.VERSION:
+                return cls(mapped, trailer["spans"])
+        except (ValueError, AttributeError, KeyError):
+            pass
+        mapped.close()
+        return None
+
+    @classmethod
+    def build(
+        cls, path: Path | None, documents: Iterable[tuple[str, Callable[[], str]]]
+    ) -> PhraseCorpus | None:
+        """Return a corpus covering `documents` (key, text loader) pairs.
+
+        Reuses the file at `path` when it already has every key; otherwise
+        rewrites it, copying known documents and loading only new ones. Falls
+        back to an unnamed temporary file when `path` is None or not writable.
+        """
+        documents = list(documents)
+        previous = cls.open(path) if path else None
+        if previous and all(key in previous.spans for key, _load in documents):
+            return previous
+
+        if path:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "wb") as handle:
+                    cls._write(handle, documents, previous)
+                os.replace(tmp_path, path)
+                corpus = cls.open(path)
+                if corpus is not None:
+                    return corpus
+            except OSError:
+                pass
+
+        with tempfile.TemporaryFile() as handle:
+            cls._write(handle, documents, previous)
+            handle.flush()
+            return cls._from_file(handle)
+
+    @classmethod
+    def _write(
+        cls, handle, documents: list[tuple[str, Callable[[], str]]], previous: PhraseCorpus | None
+    ) -> None:
+        spans: dict[str, list[int]] = {}
+        position = 0
+        for key, load in documents:
+            if key in spans:
+                continue
+            if previous and key in previous.spans:
+                start, end = previous.spans[key]
+                data = previous._map[start:end]
+            else:
+                data = load().encode("utf-8")
+            handle.write(data + b"\n")
+            spans[key] = [position, position + len(data)]
+            position += len(data) + 1
+        trailer = json.dumps({"version": cls.VERSION, "spans": spans}).encode("utf-8")
+        handle.write(trailer + b"%016d" % len(trailer))
+
+    def contains(self, key: str, phrase: str) -> bool | None:
+        """Whether document `key` contains `phrase`; None when the key is unknown."""
+        span = self.spans.get(key)
+        if span is None:
+            return None
+        return self._map.find(phrase.encode("utf-8"), span[0], span[1]) != -1
+
+
+@functools.cache
+def _numpy():
+    """Import NumPy on first use; only the semantic mode and batch ranking need it."""
+    import numpy
+
+    return numpy
+
+
+def sparse_product(rows: Sequence[Sequence[int]], postings: Sequence[tuple], width: int):
+    """Dense `len(rows)` x `width` product of a sparse query x term matrix and term postings.
+
+    `rows[q]` lists the term ids in query q; `postings[t]` is a (document ids,
+    weights) pair of arrays. Each cell is accumulated in `rows[q]` order
+    starting from 0.0, the same additions a dict-based loop over those terms
+    makes, so float scores match it exactly.
+    """
+    np = _numpy()
+    cells: list = []
+    weights: list = []
+    for q, terms in enumerate(rows):
+        for t in terms:
+            doc_ids, values = postings[t]
+            cells.append(doc_ids + q * width)
+            weights.append(values)
+    if not cells:
+        return np.zeros((len(rows), width))
+    totals = np.bincount(np.concatenate(cells), np.concatenate(weights), minlength=len(rows) * width)
+    return totals.reshape(len(rows), width)
+
+
+def semantic_fields(frontmatter: Mapping, body: str) -> dict[str, str]:
+    """The text the semantic model reads for one skill, keyed like SEMANTIC_FIELD_WEIGHTS."""
+    fields = {}
+    for field in SEMANTIC_FIELD_WEIGHTS:
+        value = body if field == "body" else frontmatter.get(field) or ""
+        if isinstance(value, list):
+            value = " ".join(str(item) for item in value)
+        fields[field] = str(value).replace("-", " ")
+    return fields
+
+
+def semantic_term_counts(fields: Mapping[str, str]) -> Counter:
+    """Token counts with each field repeated by its SEMANTIC_FIELD_WEIGHTS weight."""
+    counts: Counter = Counter()
+    for field, text in fields.items():
+        weight = SEMANTIC_FIELD_WEIGHTS.get(field, 1)
+        for token in tokenize_text(text):
+            counts[token] += weight
+    return counts
+
+
+class SemanticIndex:
+    """LSA model: TF-IDF vectors projected onto `dimensions` latent topics.
+
+    `documents` holds one unit-length row per skill in latent space and
+    `projection` maps a TF-IDF vector into that space, so a query scores
+    every skill with one matrix-vector product. Fitted offline; the app never
+    re-fits.
+    """
+
+    def __init__(self, names: list[str], vocabulary: list[str], idf, projection, documents) -> None:
+        self.names = names
+        self.vocabulary = vocabulary
+        self.term_ids = {term: i for i, term in enumerate(vocabulary)}
+        self.idf = idf
+        self.projection = projection
+        self.documents = documents
+
+    @classmethod
+    def fit(
+        cls,
+        names: list[str],
+        documents: Sequence[Mapping[str, int]],
+        dimensions: int = SEMANTIC_DIMENSIONS,
+        max_features: int = SEMANTIC_MAX_FEATURES,
+    ) -> SemanticIndex:
+        """Fit on per-skill term counts (see `semantic_term_counts`).
+
+        Keeps the `max_features` terms found in the most skills (at least
+        two), then takes a truncated SVD: exact for small libraries,
+        randomized with a fixed seed for large ones, signs normalized, so the
+        same library always produces the same artifact.
+        """
+        np = _numpy()
+        df = Counter(term for counts in documents for term in counts)
+        ranked = sorted((term for term, n in df.items() if n >= 2), key=lambda term: (-df[term], term))
+        vocabulary = sorted(ranked[:max_features])
+        term_ids = {term: i for i, term in enumerate(vocabulary)}
+        size = len(documents)
+        idf = np.array([math.log((1 + size) / (1 + df[term])) + 1 for term in vocabulary], dtype=np.float32)
+
+        matrix = np.zeros((size, len(vocabulary)), dtype=np.float32)
+        for row, counts in enumerate(documents):
+            for term, count in counts.items():
+                column = term_ids.get(term)
+                if column is not None:
+                    matrix[row, column] = 1 + math.log(count)
+        matrix *= idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+
+        rank = min(dimensions, *matrix.shape)
+        if min(matrix.shape) <= 2000:
+            u, s, vt = np.linalg.svd(matrix, full_matrices=False)
+        else:
+            rng = np.random.default_rng(0)
+            sample = matrix @ rng.standard_normal((matrix.shape[1], rank + 16), dtype=np.float32)
+            for _ in range(2):
+                sample = matrix @ (matrix.T @ sample)
+            basis, _ = np.linalg.qr(sample)
+            ub, s, vt = np.linalg.svd(basis.T @ matrix, full_matrices=False)
+            u = basis @ ub
+        u, s, vt = u[:, :rank], s[:rank], vt[:rank]
+        signs = np.sign(vt[np.arange(rank), np.abs(vt).argmax(axis=1)])
+        u, vt = u * signs, vt * signs[:, None]
+
+        latent = u * s
+        norms = np.linalg.norm(latent, axis=1, keepdims=True)
+        latent /= np.where(norms == 0, 1, norms)
+        return cls(list(names), vocabulary, idf, vt.astype(np.float32), latent.astype(np.float32))
+
+    def score(self, query: str):
+        """Cosine similarity of `query` to every skill, or None if it has no known term."""
+        np = _numpy()
+        counts = Counter(token for token in tokenize_text(query) if token in self.term_ids)
+        if not counts:
+            return None
+        columns = [self.term_ids[token] for token in counts]
+        weights = np.array([1 + math.log(n) for n in counts.values()], dtype=np.float32) * self.idf[columns]
+        latent = self.projection[:, columns] @ weights
+        norm = np.linalg.norm(latent)
+        if not norm:
+            return None
+        return self.documents @ (latent / norm)
+
+    def save(self, path: Path) -> None:
+        """Write a zip of meta.json and float16 .npy arrays with fixed timestamps."""
+        np = _numpy()
+        meta = {"version": SEMANTIC_INDEX_VERSION, "names": self.names, "vocabulary": self.vocabulary}
+        arrays = {"idf": self.idf, "projection": self.projection, "documents": self.documents}
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr(zipfile.ZipInfo("meta.json"), json.dumps(meta), zipfile.ZIP_DEFLATED)
+            for name, values in arrays.items():
+                buffer = io.BytesIO()
+                np.lib.format.write_array(buffer, values.astype(np.float16), allow_pickle=False)
+                archive.writestr(zipfile.ZipInfo(f"{name}.npy"), buffer.getvalue(), zipfile.ZIP_DEFLATED)
+
+    @classmethod
+    def load(cls, path: Path) -> SemanticIndex | None:
+        """Read a saved model, or None when missing or from another version."""
+        np = _numpy()
+        try:
+            with zipfile.ZipFile(path) as archive:
+                meta = json.loads(archive.read("meta.json"))
+                if meta.get("version") != SEMANTIC_INDEX_VERSION:
+                    return None
+                arrays = {
+                    name: np.lib.format.read_array(io.BytesIO(archive.read(f"{name}.npy"))).astype(np.float32)
+                    for name in ("idf", "projection", "documents")
+                }
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+        return cls(meta["names"], meta["vocabulary"], **arrays)
+
+
+def skill_references(frontmatter: Mapping, body: str) -> set[str]:
+    """Skills one skill points at: `related_skills` plus `skills/<name>/SKILL.md` links in the body."""
+    related = frontmatter.get("related_skills") or []
+    if isinstance(related, str):
+        related = [related]
+    return {str(name) for name in related} | set(SKILL_REFERENCE_RE.findall(body))
+
+
+class SkillGraph:
+    """How skills relate: references, shared commands, themes, and centrality.
+
+    Two skills are joined when either references the other (see
+    `skill_references`) or a command `uses` both. `neighbors[name]` maps a
+    skill's closest skills to a proximity in (0, 1], relative to its closest
+    one, and `centrality` is weighted PageRank scaled so the most central
+    skill is 1. `generate-catalog.py` builds it into
+    `catalog/skills-graph.json`; the finder only loads it.
+    """
+
+    def __init__(
+        self,
+        themes: Mapping[str, str | None],
+        neighbors: Mapping[str, Mapping[str, float]],
+        centrality: Mapping[str, float],
+        commands: Mapping[str, Sequence[str]],
+    ) -> None:
+        self.themes = themes
+        self.neighbors = neighbors
+        self.centrality = centrality
+        self.commands = commands
+
+    @classmethod
+    def build(
+        cls,
+        skills: Mapping[str, tuple[str | None, Iterable[str]]],
+        commands: Mapping[str, Sequence[str]],
+        neighbors: int = GRAPH_NEIGHBORS,
+    ) -> SkillGraph:
+        """Build from skill name -> (theme, referenced skills) and command name -> skills used.
+
+        Names that are not skills are ignored. PageRank runs by power
+        iteration over the weighted edges; a skill with no edges spreads its
+        rank evenly, as in the standard formulation.
+        """
+        names = sorted(skills)
+        weights: dict[str, dict[str, float]] = {name: {} for name in names}
+
+        def join(a: str, b: str, weight: float) -> None:
+            if a != b and a in weights and b in weights:
+                weights[a][b] = weights[a].get(b, 0.0) + weight
+                weights[b][a] = weights[b].get(a, 0.0) + weight
+
+        for name in names:
+            for other in sorted(set(skills[name][1])):
+                join(name, other, GRAPH_REFERENCE_WEIGHT)
+        for uses in commands.values():
+            used = sorted({name for name in uses if name in weights})
+            for i, a in enumerate(used):
+                for b in used[i + 1:]:
+                    join(a, b, GRAPH_COMMAND_WEIGHT)
+
+        size = len(names)
+        rank = dict.fromkeys(names, 1 / size) if size else {}
+        totals = {name: sum(edges.values()) for name, edges in weights.items()}
+        for _ in range(GRAPH_ITERATIONS):
+            dangling = sum(rank[name] for name in names if not totals[name])
+            base = (1 - GRAPH_DAMPING) / size + GRAPH_DAMPING * dangling / size
+            updated = dict.fromkeys(names, base)
+            for name in names:
+                if totals[name]:
+                    share = GRAPH_DAMPING * rank[name] / totals[name]
+                    for other, weight in weights[name].items():
+                        updated[other] += share * weight
+            converged = sum(abs(updated[name] - rank[name]) for name in names) < 1e-10
+            rank = updated
+            if converged:
+                break
+        top_rank = max(rank.values(), default=0.0) or 1.0
+
+        closest = {}
+        for name in names:
+            edges = sorted(weights[name].items(), key=lambda item: (-item[1], item[0]))[:neighbors]
+            if edges:
+                strongest = edges[0][1]
+                closest[name] = {other: round(weight / strongest, 4) for other, weight in edges}
+        return cls(
+            {name: skills[name][0] for name in names},
+            closest,
+            {name: round(rank[name] / top_rank, 4) for name in names},
+            {command: [name for name in uses if name in weights] for command, uses in sorted(commands.items())},
+        )
+
+    def proximity(self, name: str, other: str) -> float:
+        """How close `other` is to `name`: neighbor proximity or the shared-theme floor, at most 1."""
+        closeness = self.neighbors.get(name, {}).get(other, 0.0)
+        theme = self.themes.get(name)
+        if theme and self.themes.get(other) == theme:
+            closeness = max(closeness, GRAPH_THEME_PROXIMITY)
+        return closeness
+
+    def rerank(self, scored: list[Ranked]) -> list[Ranked]:
+        """`scored` in graph order: the best match, then the rest by closeness to it.
+
+        The rest are ordered by their fraction of the best score, plus
+        GRAPH_PROXIMITY_WEIGHT times their `proximity()` to the best match,
+        plus GRAPH_CENTRALITY_WEIGHT times their centrality. Only the order
+        changes: every tuple keeps its own score, and no skill is added. When
+        the best match is not in the graph (the catalog predates it), the
+        keyword order is kept. Page the result with `select_page(...,
+        presorted=True)`.
+        """
+        ordered = sorted(scored)
+        if not ordered:
+            return ordered
+        top_negated, top_name = ordered[0][0], ordered[0][1]
+        if top_name not in self.themes or top_negated >= 0:
+            return ordered
+
+        def closeness(item: Ranked) -> float:
+            negated, name = item[0], item[1]
+            score = -negated / -top_negated + GRAPH_PROXIMITY_WEIGHT * self.proximity(top_name, name)
+            return score + GRAPH_CENTRALITY_WEIGHT * self.centrality.get(name, 0.0)
+
+        return ordered[:1] + sorted(ordered[1:], key=lambda item: (-closeness(item), item))
+
+    def save(self, path: Path) -> None:
+        """Write sorted, indented JSON so regenerating an unchanged library is a no-op diff."""
+        payload = {
+            "version": GRAPH_VERSION,
+            "skills": {
+                name: {
+                    "theme": self.themes[name],
+                    "centrality": self.centrality.get(name, 0.0),
+                    "neighbors": self.neighbors.get(name, {}),
+                }
+                for name in sorted(self.themes)
+            },
+            "commands": dict(self.commands),
+            "themes": {
+                theme: sorted(name for name, value in self.themes.items() if value == theme)
+                for theme in sorted({theme for theme in self.themes.values() if theme})
+            },
+        }
+        path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> SkillGraph | None:
+        """Read a saved graph, or None when missing or from another version."""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if payload.get("version") != GRAPH_VERSION:
+                return None
+            skills = payload["skills"]
+            return cls(
+                {name: record["theme"] for name, record in skills.items()},
+                {name: record["neighbors"] for name, record in skills.items() if record["neighbors"]},
+                {name: record["centrality"] for name, record in skills.items()},
+                payload["commands"],
+            )
+        except (OSError, KeyError, TypeError, ValueError, AttributeError):
+            return None
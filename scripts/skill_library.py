@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""Shared frontmatter parsing for the skill library.
+
+Every script that reads `skills/*/SKILL.md` or `commands/*.md` (and the
+Streamlit app) goes through this module instead of carrying its own copy of
+`split_frontmatter`. Parsed frontmatter is cached on disk in
+`.cache/library-snapshot.json`, keyed by each file's SHA-256, so running the
+full `test-library.sh` chain YAML-parses each file once no matter how many
+checks read it. The libyaml C loader is used when PyYAML was built with it.
+
+`split_sections()` is the one markdown splitter: a single pass that skips
+fenced code blocks and records `##`/`###` headings as offsets into the text.
+
+Import from a script in this folder with:
+
+    from skill_library import load_library_snapshot, parse_file
+
+Run directly to print a one-line summary of the current snapshot.
+"""
+
+from __future__ import annotations
+
+import atexit
+import bisect
+import functools
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# SKILL_LIBRARY_CACHE points scratch libraries (benchmarks) at their own cache.
+CACHE_PATH = Path(os.getenv("SKILL_LIBRARY_CACHE") or PROJECT_ROOT / ".cache" / "library-snapshot.json")
+CACHE_VERSION = 2
+
+
+@dataclass(frozen=True)
+class ParsedFile:
+    """One markdown file split into frontmatter and body.
+
+    `frontmatter` is None when the file has no frontmatter block or its YAML
+    does not parse to a mapping.
+    """
+
+    path: Path
+    sha256: str
+    frontmatter: dict | None
+    body: str
+
+
+@dataclass(frozen=True)
+class LibrarySnapshot:
+    """Every skill and command file in the library, parsed once."""
+
+    root: Path
+    skills: tuple[ParsedFile, ...]
+    commands: tuple[ParsedFile, ...]
+
+
+@functools.cache
+def _yaml():
+    """Import PyYAML on first use; fully cached runs never parse YAML at all."""
+    try:
+        import yaml
+    except ImportError:  # pragma: no cover
+        print("PyYAML is required. Install with: python3 -m pip install pyyaml", file=sys.stderr)
+        raise
+    return yaml
+
+
+def yaml_loader():
+    yaml = _yaml()
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(text: str):
+    return _yaml().load(text, Loader=yaml_loader())
+
+
+def split_frontmatter(text: str) -> tuple[dict | None, str]:
+    """Split `---` frontmatter from the body. Raises yaml.YAMLError on bad YAML."""
+    if not text.startswith("---\n"):
+        return None, text
+    parts = text.split("---", 2)
+    if len(parts) < 3:
+        return None, text
+    data = load_yaml(parts[1]) or {}
+    body = parts[2]
+    return data, body
+
+
+@dataclass(frozen=True)
+class Section:
+    """A `##` or `###` heading and the [start, end) offsets of its content.
+
+    `start` is just past the heading line; `end` is the next heading at the
+    same or a shallower level (or the end of the text), so an H2's content
+    includes its H3 `children`.
+    """
+
+    heading: str
+    level: int
+    start: int
+    end: int
+    children: tuple[Section, ...] = ()
+
+    def text(self, source: str) -> str:
+        return source[self.start:self.end].strip()
+
+    def to_json(self) -> list:
+        return [self.heading, self.level, self.start, self.end, [c.to_json() for c in self.children]]
+
+    @classmethod
+    def from_json(cls, data: list) -> Section:
+        heading, level, start, end, children = data
+        return cls(heading, level, start, end, tuple(cls.from_json(c) for c in children))
+
+
+def _fence_marker(line: str) -> str | None:
+    """Return the opening run of a ``` / ~~~ fence line, else None."""
+    stripped = line.lstrip(" ")
+    if len(line) - len(stripped) > 3 or stripped[:3] not in ("```", "~~~"):
+        return None
+    char = stripped[0]
+    run = len(stripped) - len(stripped.lstrip(char))
+    if char == "`" and "`" in stripped[run:]:
+        return None  # inline code, not a fence
+    return stripped[:run]
+
+
+def _fence_closers(lines: list[str], markers: list[str | None]) -> list[int | None]:
+    """For each fence line, the first later line that would close it, else None.
+
+    One backward sweep keeps, per fence character, the later closing lines
+    not shadowed by a nearer one at least as long. Their lengths grow with
+    distance, so each lookup is a binary search.
+    """
+    closers: list[int | None] = [None] * len(lines)
+    later: dict[str, tuple[list[int], list[int]]] = {"`": ([], []), "~": ([], [])}
+    for index in range(len(lines) - 1, -1, -1):
+        marker = markers[index]
+        if marker is None:
+            continue
+        lengths, indexes = later[marker[0]]  # negated lengths, nearest line last
+        nearest = bisect.bisect_right(lengths, -len(marker))
+        if nearest:
+            closers[index] = indexes[nearest - 1]
+        if not lines[index].strip()[len(marker):].strip():
+            while lengths and lengths[-1] >= -len(marker):
+                lengths.pop()
+                indexes.pop()
+            lengths.append(-len(marker))
+            indexes.append(index)
+    return closers
+
+
+def split_sections(text: str, max_level: int = 3) -> tuple[Section, ...]:
+    """Split markdown into nested `##` (and `###`) sections in one pass.
+
+    Headings inside fenced code blocks are content, not section breaks. Each
+    fence is paired with its closing line up front (`_fence_closers`), so an
+    opening fence with no matching close is plain text and the text is
+    scanned once. Returns the H2 sections with their H3 children; text
+    before the first H2 is not a section.
+    """
+    lines = text.split("\n")
+    markers = [_fence_marker(line) for line in lines]
+    closers = _fence_closers(lines, markers)
+    found: list[list] = []  # [level, heading, start, end]
+    open_by_level: dict[int, list] = {}
+    fence_end = -1
+    pos = 0
+    for index, line in enumerate(lines):
+        line_end = pos + len(line) + 1
+        if index <= fence_end:
+            pass  # inside a fenced block, closing line included
+        elif markers[index] and closers[index] is not None:
+            fence_end = closers[index]
+        else:
+            # A fence that never closes is a typo, not a code block that
+            # swallows the rest of the file, so its line is plain text.
+            hashes = len(line) - len(line.lstrip("#"))
+            if 2 <= hashes <= max_level and line[hashes:hashes + 1] == " ":
+                for level in [lvl for lvl in open_by_level if lvl >= hashes]:
+                    open_by_level.pop(level)[3] = pos
+                entry = [hashes, line[hashes + 1:].strip(), min(line_end, len(text)), len(text)]
+                found.append(entry)
+                open_by_level[hashes] = entry
+        pos = line_end
+
+    # Nest each heading under the nearest shallower one before it.
+    roots: list[tuple[list, list]] = []
+    stack: list[tuple[list, list]] = []
+    for entry in found:
+        node = (entry, [])
+        while stack and stack[-1][0][0] >= entry[0]:
+            stack.pop()
+        if not stack and entry[0] != 2:
+            continue  # an H3 before the first H2 belongs to the preamble
+        (stack[-1][1] if stack else roots).append(node)
+        stack.append(node)
+
+    def build(node: tuple[list, list]) -> Section:
+        (level, heading, start, end), children = node
+        return Section(heading, level, start, end, tuple(build(child) for child in children))
+
+    return tuple(build(node) for node in roots)
+
+
+class SectionMap(Mapping[str, str]):
+    """Read-only heading -> content view that slices the source on access.
+
+    Duplicate headings keep the last occurrence, like a dict built in order.
+    """
+
+    def __init__(self, source: str, sections: tuple[Section, ...], key=None) -> None:
+        self._source = source
+        self._sections = {(key(s.heading) if key else s.heading): s for s in sections}
+
+    def __getitem__(self, heading: str) -> str:
+        return self._sections[heading].text(self._source)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def section(self, heading: str) -> Section | None:
+        return self._sections.get(heading)
+
+
+class _FrontmatterCache:
+    """Hash-keyed frontmatter cache shared by every process via CACHE_PATH."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, dict | None] | None = None
+        self.dirty = False
+
+    def load(self) -> dict[str, dict | None]:
+        if self.entries is None:
+            self.entries = {}
+            try:
+                payload = json.loads(CACHE_PATH.read_bytes())
+            except (OSError, ValueError):
+                payload = None
+            if isinstance(payload, dict) and payload.get("version") == CACHE_VERSION:
+                entries = payload.get("frontmatter")
+                if isinstance(entries, dict):
+                    self.entries = entries
+            atexit.register(self.flush)
+        return self.entries
+
+    def get(self, digest: str) -> tuple[bool, dict | None]:
+        entries = self.load()
+        if digest in entries:
+            return True, entries[digest]
+        return False, None
+
+    def put(self, digest: str, frontmatter: dict | None) -> None:
+        """Cache a parse only if it reads back from JSON exactly as parsed.
+
+        Dates and other non-JSON YAML values fail to encode. Non-string keys
+        (`1: foo`, `true: x`) encode but come back as strings. Either way the
+        file is parsed again next time, so a warm run sees what a cold one does.
+        """
+        try:
+            if json.loads(json.dumps(frontmatter)) != frontmatter:
+                return
+        except (TypeError, ValueError):
+            return
+        self.load()[digest] = frontmatter
+        self.dirty = True
+
+    def prune(self, keep: set[str]) -> None:
+        entries = self.load()
+        stale = entries.keys() - keep
+        for digest in stale:
+            del entries[digest]
+        self.dirty = self.dirty or bool(stale)
+
+    def flush(self) -> None:
+        """Atomically write the cache; read-only checkouts just skip it."""
+        if not self.dirty or self.entries is None:
+            return
+        payload = {"version": CACHE_VERSION, "frontmatter": self.entries}
+        try:
+            CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, CACHE_PATH)
+            self.dirty = False
+        except OSError:
+            pass
+
+
+_CACHE = _FrontmatterCache()
+
+
+def parse_text(text: str, path: Path | str = "") -> ParsedFile:
+    """Parse already-read file text, reusing cached frontmatter for known hashes."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    body = text
+    if text.startswith("---\n"):
+        parts = text.split("---", 2)
+        if len(parts) == 3:
+            body = parts[2]
+    hit, frontmatter = _CACHE.get(digest)
+    if not hit:
+        try:
+            frontmatter, _ = split_frontmatter(text)
+        except _yaml().YAMLError:
+            frontmatter = None
+        if frontmatter is not None and not isinstance(frontmatter, dict):
+            frontmatter = None
+        _CACHE.put(digest, frontmatter)
+
+    return ParsedFile(path=Path(path), sha256=digest, frontmatter=frontmatter, body=body)
+
+
+def parse_file(path: Path | str) -> ParsedFile:
+    with open(path, "r", encoding="utf-8") as handle:
+        text = handle.read()
+    return parse_text(text, path)
+
+
+def load_library_snapshot(root: Path | str = PROJECT_ROOT) -> LibrarySnapshot:
+    """Parse `skills/*/SKILL.md` and `commands/*.md` (README excluded) under root."""
+    root = Path(root)
+    skills = tuple(parse_file(path) for path in sorted(root.glob("skills/*/SKILL.md")))
+    commands = tuple(
+        parse_file(path)
+        for path in sorted(root.glob("commands/*.md"))
+        if path.name.lower() != "readme.md"
+    )
+    _CACHE.prune({parsed.sha256 for parsed in skills + commands})
+    return LibrarySnapshot(root=root, skills=skills, commands=commands)
+
+
+def main() -> int:
+    snapshot = load_library_snapshot()
+    loader = "libyaml" if yaml_loader() is not _yaml().SafeLoader else "pure-Python"
+    print(
+        f"Parsed {len(snapshot.skills)} skills and {len(snapshot.commands)} commands "
+        f"({loader} YAML loader, cache: {CACHE_PATH})."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,6 +9,9 @@
 #   4) library drift check (marketplace entries + doc links vs skills/)
 #   5) optional skill smoke tests
 #   6) catalog generation freshness check
+#   7) dist/ shelf freshness check
+#   8) Find My Skill golden-query relevance check (needs app/requirements.txt;
+#      reported as SKIPPED without them)
 #
 
 set -euo pipefail
@@ -52,31 +55,42 @@ main() {
     parse_args "$@"
     cd "$PROJECT_ROOT"
 
-    echo "[1/7] Validating skills"
+    echo "[1/8] Validating skills"
     python3 "$SCRIPT_DIR/check-skill-metadata.py"
 
-    echo "[2/7] Auditing trigger metadata"
+    echo "[2/8] Auditing trigger metadata"
     python3 "$SCRIPT_DIR/check-skill-triggers.py"
 
-    echo "[3/7] Validating commands"
+    echo "[3/8] Validating commands"
     python3 "$SCRIPT_DIR/check-command-metadata.py"
 
-    echo "[4/7] Checking library drift (marketplace + doc links)"
+    echo "[4/8] Checking library drift (marketplace + doc links)"
     python3 "$SCRIPT_DIR/check-library-drift.py"
 
     if $RUN_SMOKE; then
-        echo "[5/7] Running skill smoke tests"
+        echo "[5/8] Running skill smoke tests"
         "$SCRIPT_DIR/test-a-skill.sh" --smoke
     else
-        echo "[5/7] Skipping smoke tests (use --smoke to enable)"
+        echo "[5/8] Skipping smoke tests (use --smoke to enable)"
     fi
 
-    echo "[6/7] Regenerating catalogs"
+    echo "[6/8] Regenerating catalogs"
     python3 "$SCRIPT_DIR/generate-catalog.py"
 
-    echo "[7/7] Checking dist/ shelf freshness"
+    echo "[7/8] Checking dist/ shelf freshness"
     python3 "$SCRIPT_DIR/check-dist-freshness.py"
 
+    echo "[8/8] Checking Find My Skill relevance"
+    local relevance_status=0
+    python3 "$SCRIPT_DIR/check-finder-relevance.py" || relevance_status=$?
+    if [[ $relevance_status -eq 3 ]]; then
+        echo "[8/8] SKIPPED: Find My Skill relevance not checked (pip install -r app/requirements.txt)"
+        echo "Library checks complete (relevance check skipped)."
+        return 0
+    elif [[ $relevance_status -ne 0 ]]; then
+        exit "$relevance_status"
+    fi
+
     echo "Library checks complete."
 }
 
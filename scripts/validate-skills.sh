@@ -17,6 +17,25 @@ found=0
 valid=0
 failures=0
 
+# One Python pass parses every SKILL.md once (via scripts/skill_library.py) and
+# lists required frontmatter fields that are missing as "<folder>:<field>" lines.
+missing_fields="$(python3 - "$SCRIPT_DIR" <<'PY'
+import sys
+sys.path.insert(0, sys.argv[1])
+from skill_library import load_library_snapshot
+
+for parsed in load_library_snapshot().skills:
+    data = parsed.frontmatter or {}
+    for field in ("name", "description"):
+        if not str(data.get(field) or "").strip():
+            print(f"{parsed.path.parent.name}:{field}")
+PY
+)"
+
+field_missing() {
+  [[ $'\n'"$missing_fields"$'\n' == *$'\n'"$1:$2"$'\n'* ]]
+}
+
 echo "Validating skills in: ${SKILLS_DIR#$ROOT/}"
 
 for skill_dir in "$SKILLS_DIR"/*; do
@@ -36,22 +55,12 @@ for skill_dir in "$SKILLS_DIR"/*; do
       echo "Missing YAML front matter: skills/$skill_name/SKILL.md"
       skill_ok=false
     else
-      if ! awk '
-        NR == 1 && $0 == "---" { in_frontmatter = 1; next }
-        in_frontmatter && $0 == "---" { exit }
-        in_frontmatter && $0 ~ /^name:[[:space:]]*[^[:space:]]/ { found = 1 }
-        END { exit(found ? 0 : 1) }
-      ' "$skill_file"; then
+      if field_missing "$skill_name" name; then
         echo "Missing front matter field 'name': skills/$skill_name/SKILL.md"
         skill_ok=false
       fi
 
-      if ! awk '
-        NR == 1 && $0 == "---" { in_frontmatter = 1; next }
-        in_frontmatter && $0 == "---" { exit }
-        in_frontmatter && $0 ~ /^description:[[:space:]]*[^[:space:]]/ { found = 1 }
-        END { exit(found ? 0 : 1) }
-      ' "$skill_file"; then
+      if field_missing "$skill_name" description; then
         echo "Missing front matter field 'description': skills/$skill_name/SKILL.md"
         skill_ok=false
       fi